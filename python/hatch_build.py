@@ -0,0 +1,47 @@
+"""Hatch build hook: bundle the renderer catalog into a single JSON file.
+
+Wheels ship every ``data/renderers/*.json`` file plus
+``renderscope/data/renderers/_bundle.json``, one JSON object mapping each
+renderer ID (file name without ``.json``) to that file's contents.
+``renderscope.core.data_loader`` reads the bundle when loading the full
+catalog, so a cold ``renderscope list`` opens one file instead of one per
+renderer.  Template files (names starting with ``_``) are left out, as they
+are by the loader.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+_RENDERER_DATA = Path("..") / "data" / "renderers"
+_BUNDLE_TARGET = "renderscope/data/renderers/_bundle.json"
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Write the catalog bundle and add it to wheel builds."""
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        if self.target_name != "wheel":
+            return
+        data_dir = Path(self.root) / _RENDERER_DATA
+        catalog = {
+            json_file.stem: json.loads(json_file.read_text(encoding="utf-8"))
+            for json_file in sorted(data_dir.glob("*.json"))
+            if not json_file.name.startswith("_")
+        }
+        self._bundle_dir = tempfile.TemporaryDirectory(prefix="renderscope-build-")
+        bundle = Path(self._bundle_dir.name) / "_bundle.json"
+        bundle.write_text(
+            json.dumps(catalog, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
+        build_data["force_include"][str(bundle)] = _BUNDLE_TARGET
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+        bundle_dir = getattr(self, "_bundle_dir", None)
+        if bundle_dir is not None:
+            bundle_dir.cleanup()
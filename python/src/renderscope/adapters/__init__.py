@@ -2,43 +2,89 @@
 
 Each supported renderer has a concrete adapter that implements the
 ``RendererAdapter`` abstract interface defined in ``base.py``.
-Adapters self-register with the ``AdapterRegistry`` on import.
+Adapters are imported lazily by the ``AdapterRegistry`` — looking up one
+renderer only imports that renderer's module.  Besides the built-ins,
+installed packages can provide adapters through the ``renderscope.adapters``
+entry-point group.
 """
 
 from __future__ import annotations
 
+import functools
 import importlib
 import logging
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from renderscope.adapters.base import RendererAdapter
 
 logger = logging.getLogger(__name__)
 
-# All adapter modules that should be auto-registered.
-# Adding a new adapter: create the file and add its module path here.
-_ADAPTER_MODULES = [
+# Built-in adapters: canonical renderer name → "module:ClassName".
+# Adding a new adapter: create the file and add its entry here.
+_ADAPTER_CLASSES: dict[str, str] = {
     # Session 16.1 adapters
-    "renderscope.adapters.pbrt",
-    "renderscope.adapters.mitsuba",
-    "renderscope.adapters.cycles",
+    "pbrt": "renderscope.adapters.pbrt:PBRTAdapter",
+    "mitsuba3": "renderscope.adapters.mitsuba:MitsubaAdapter",
+    "blender-cycles": "renderscope.adapters.cycles:CyclesAdapter",
     # Session 16.2 adapters
-    "renderscope.adapters.luxcore",
-    "renderscope.adapters.appleseed",
-    "renderscope.adapters.filament",
-    "renderscope.adapters.ospray",
+    "luxcore": "renderscope.adapters.luxcore:LuxCoreAdapter",
+    "appleseed": "renderscope.adapters.appleseed:AppleseedAdapter",
+    "filament": "renderscope.adapters.filament:FilamentAdapter",
+    "ospray": "renderscope.adapters.ospray:OSPRayAdapter",
     # Test-only adapter (always detected, generates synthetic images)
-    "renderscope.adapters.mock",
-]
+    "mock": "renderscope.adapters.mock:MockRendererAdapter",
+}
+
+# Entry-point group for adapters provided by installed distributions
+_ENTRY_POINT_GROUP = "renderscope.adapters"
+
+
+@functools.cache
+def _entry_point_adapters() -> dict[str, str]:
+    """Adapters declared in the ``renderscope.adapters`` entry-point group.
+
+    Reading distribution metadata is comparatively slow, so this is only
+    consulted for names missing from ``_ADAPTER_CLASSES`` and when listing
+    every adapter, and the result is cached for the process.
+
+    Returns:
+        Mapping of renderer name to ``"module:ClassName"``.
+    """
+    try:
+        return {ep.name: ep.value for ep in entry_points(group=_ENTRY_POINT_GROUP)}
+    except Exception:
+        logger.debug("Could not read adapter entry points", exc_info=True)
+        return {}
+
+
+def _adapter_names() -> list[str]:
+    """All known adapter names: built-ins first, then entry-point plugins."""
+    plugins = [name for name in _entry_point_adapters() if name not in _ADAPTER_CLASSES]
+    return [*_ADAPTER_CLASSES, *sorted(plugins)]
+
+
+def _load_adapter_class(name: str) -> type[RendererAdapter] | None:
+    """Import the module of a single adapter and return its class.
 
+    Import failures are logged and reported as ``None`` — one broken
+    adapter should never prevent the rest from loading.
 
-def _register_all() -> None:
-    """Import all adapter modules so they self-register with the registry.
+    Args:
+        name: Canonical renderer name (e.g., ``'pbrt'``).
 
-    Each adapter module calls ``registry.register(MyAdapter)`` at module
-    level, so importing the module is sufficient to register the adapter.
-    Individual import failures are logged and skipped — one broken adapter
-    should never prevent the rest from loading.
+    Returns:
+        The adapter class, or ``None`` if unknown or not importable.
     """
-    for module_name in _ADAPTER_MODULES:
-        try:
-            importlib.import_module(module_name)
-        except Exception:
-            logger.debug("Could not load adapter %s", module_name, exc_info=True)
+    spec = _ADAPTER_CLASSES.get(name) or _entry_point_adapters().get(name)
+    if spec is None:
+        return None
+    module_name, _, class_name = spec.partition(":")
+    try:
+        module = importlib.import_module(module_name)
+        adapter_cls: type[RendererAdapter] = getattr(module, class_name)
+    except Exception:
+        logger.debug("Could not load adapter %s", module_name, exc_info=True)
+        return None
+    return adapter_cls
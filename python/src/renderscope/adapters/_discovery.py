@@ -0,0 +1,148 @@
+"""Cached binary discovery shared by the CLI-based renderer adapters.
+
+Resolving a binary with ``shutil.which`` walks every directory on ``PATH``
+and stats each candidate, and probing its version spawns a subprocess.
+Adapters do both on every ``detect()`` and ``render()`` call, so results
+are memoized for the lifetime of the process.  Call ``clear_binary_cache()``
+after changing ``PATH`` (or installing a renderer) to force a fresh
+lookup — the registry does this from ``AdapterRegistry.clear_cache()``.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# ``cache_clear`` hooks of every memoized probe, run by ``clear_binary_cache()``
+_probe_cache_clearers: list[Callable[[], None]] = []
+
+
+def cached_probe(func: Callable[_P, _T]) -> Callable[_P, _T]:
+    """Memoize a binary probe (e.g. a ``--version`` subprocess) per process.
+
+    The decorated function's arguments must be hashable.  Its cache is
+    invalidated together with binary lookups by ``clear_binary_cache()``.
+    """
+    cached = functools.cache(func)
+    _probe_cache_clearers.append(cached.cache_clear)
+    return cached  # type: ignore[return-value]
+
+
+@cached_probe
+def _search_path() -> str:
+    """Snapshot of ``PATH`` used by every lookup until the cache is cleared.
+
+    ``PATH`` is walked once here: duplicate entries and directories that
+    do not exist are dropped, so no later lookup stats them again — each
+    one costs a round trip per tool on network filesystems.  Empty
+    entries (the current directory) are kept.
+    """
+    seen: set[str] = set()
+    directories: list[str] = []
+    for entry in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        key = os.path.normcase(entry)
+        if key in seen:
+            continue
+        seen.add(key)
+        if entry and not os.path.isdir(entry):
+            continue
+        directories.append(entry)
+    return os.pathsep.join(directories)
+
+
+@cached_probe
+def _which_cached(name: str) -> str | None:
+    """``shutil.which`` against the snapshotted ``PATH``, memoized per name.
+
+    Adapters probing overlapping names (e.g. a CLI and its GUI companion)
+    share results, and ``PATH`` is read from the environment only once.
+    """
+    return shutil.which(name, path=_search_path())
+
+
+@cached_probe
+def resolve_binary(names: tuple[str, ...]) -> str | None:
+    """Return the first of *names* found in PATH.
+
+    Args:
+        names: Candidate binary names, in priority order.
+
+    Returns:
+        The matching binary name (suitable for subprocess) or ``None``.
+    """
+    for name in names:
+        path = _which_cached(name)
+        if path is not None:
+            logger.debug("Found binary: %s → %s", name, path)
+            return name
+    return None
+
+
+@cached_probe
+def find_available(names: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the subset of *names* found in PATH, preserving order.
+
+    Uncached lookups run concurrently: each ``shutil.which`` is dominated
+    by ``stat`` calls that release the GIL, which adds up on long or
+    network-mounted ``PATH`` entries.
+
+    Args:
+        names: Candidate binary names.
+
+    Returns:
+        The names that resolved, in the order given.
+    """
+    if len(names) <= 1:
+        found = [_which_cached(name) for name in names]
+    else:
+        found = list(_lookup_executor().map(_which_cached, names))
+    return tuple(name for name, path in zip(names, found, strict=True) if path is not None)
+
+
+@functools.cache
+def _lookup_executor() -> ThreadPoolExecutor:
+    """Shared pool for concurrent PATH lookups, created on first use."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="renderscope-which")
+
+
+@cached_probe
+def import_optional(module_name: str) -> ModuleType | None:
+    """Import an optional renderer binding once per process.
+
+    Bindings such as ``pyluxcore`` can be slow to import (some builds
+    initialise GPU runtimes), so the import is deferred until an adapter
+    first needs it and the outcome — including absence — is remembered.
+
+    Args:
+        module_name: Top-level module to import.
+
+    Returns:
+        The module, or ``None`` if it is not installed or fails to import.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+    except Exception:
+        logger.debug("%s import failed unexpectedly", module_name, exc_info=True)
+        return None
+
+
+def clear_binary_cache() -> None:
+    """Forget all cached binary lookups and version probes."""
+    for cache_clear in _probe_cache_clearers:
+        cache_clear()
@@ -0,0 +1,49 @@
+"""Pre-render path checks shared by the renderer adapters.
+
+Filament renders a frame in milliseconds, and batch renders check the same
+scene many times, so the filesystem calls made before each render (scene
+existence, creating the output directory) are a visible share of the cost
+— especially on network filesystems.  These helpers keep that to one
+``stat`` of the scene plus one ``makedirs`` per distinct output directory.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from renderscope.adapters.exceptions import RenderError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def check_scene_exists(renderer_name: str, scene_path: Path) -> None:
+    """Verify that *scene_path* exists with a single ``stat`` call.
+
+    Args:
+        renderer_name: Display name used in the error.
+        scene_path: Scene file to check.
+
+    Raises:
+        RenderError: If the scene cannot be stat'ed.
+    """
+    try:
+        os.stat(scene_path)
+    except OSError:
+        raise RenderError(renderer_name, f"Scene file not found: {scene_path}") from None
+
+
+def ensure_output_dir(output_path: Path, known_dirs: set[str]) -> None:
+    """Create the parent directory of *output_path* unless already done.
+
+    Args:
+        output_path: File the renderer will write.
+        known_dirs: Directories already created by the caller; updated in
+            place.  A directory removed after it was recorded is not
+            recreated, and the render then fails with a missing output.
+    """
+    parent = os.path.dirname(output_path) or "."
+    if parent not in known_dirs:
+        os.makedirs(parent, exist_ok=True)
+        known_dirs.add(parent)
@@ -0,0 +1,94 @@
+"""Version probing shared by adapters whose tools lack a fixed version format.
+
+Filament and LuxCore tools print their version in free-form text, and not
+every tool supports ``--version``.  ``probe_version`` tries cheap flags
+first and only falls back to ``--help`` (which can print several KB, or
+page) when they do not yield a version; output is streamed and the tool
+stopped once a version line has been seen.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+from renderscope.core.runner import iter_output_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+# A dotted version such as ``1.32.0`` or ``v2.6``, as a whole word
+VERSION_RE = re.compile(r"\bv?(\d+\.\d+(?:\.\d+)*)\b", re.ASCII)
+
+# Same version, matched from the start of a single candidate line
+_VERSION_LINE_RE = re.compile(r".*?\bv?(\d+\.\d+(?:\.\d+)*)\b", re.ASCII)
+
+# Only the head of ``--help`` output is read
+_MAX_VERSION_LINES = 50
+
+# Flags tried in order.  ``-v`` is deliberately absent: many tools treat
+# it as "verbose" and would start normally instead of exiting.
+_DEFAULT_FLAGS = ("--version", "--help")
+
+# Per-flag limit; a tool that does not exit promptly is not printing a version
+_PROBE_TIMEOUT = 2.0
+
+
+def probe_version(
+    binary: str,
+    *,
+    flags: Sequence[str] = _DEFAULT_FLAGS,
+    pattern: re.Pattern[str] = VERSION_RE,
+) -> str | None:
+    """Run ``<binary> <flag>`` for each flag until the output yields a version.
+
+    Output is streamed line by line and the tool is stopped as soon as a
+    line announcing the version (mentioning ``version`` or the tool's own
+    name) is seen, so long ``--help`` text is never read in full.  If no
+    such line appears in the first ``_MAX_VERSION_LINES`` lines, the first
+    version-looking token on any of them is used.
+
+    Args:
+        binary: Tool to run.
+        flags: Single arguments to try, in order.
+        pattern: Regex whose first group captures the version.
+
+    Returns:
+        The first version found, or ``None`` if no flag produced one.
+    """
+    tool = os.path.basename(binary).lower()
+    # The line-based fast path only knows the default version shape
+    anchored = _VERSION_LINE_RE if pattern is VERSION_RE else None
+    for flag in flags:
+        fallback: str | None = None
+        try:
+            with closing(
+                iter_output_lines(
+                    [binary, flag],
+                    timeout=_PROBE_TIMEOUT,
+                    max_lines=_MAX_VERSION_LINES,
+                )
+            ) as lines:
+                for line in lines:
+                    lowered = line.lower()
+                    if anchored is not None and ("version" in lowered or tool in lowered):
+                        match = anchored.match(line)
+                        if match:
+                            return match.group(1)
+                    if fallback is None:
+                        match = pattern.search(line)
+                        if match:
+                            fallback = match.group(1)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Failed to run '%s %s'", binary, flag)
+            continue
+        if fallback is not None:
+            return fallback
+    return None
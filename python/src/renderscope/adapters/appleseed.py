@@ -15,10 +15,11 @@ Render:     ``appleseed.cli <scene> --output <output> [options]``
 from __future__ import annotations
 
 import logging
+import os
 import re
-import shutil
 from typing import TYPE_CHECKING
 
+from renderscope.adapters._discovery import cached_probe, resolve_binary
 from renderscope.adapters.base import RendererAdapter
 from renderscope.adapters.exceptions import (
     RendererNotFoundError,
@@ -46,12 +47,15 @@ _VERSION_RE = re.compile(r"version\s+(\S+)", re.IGNORECASE)
 _VERSION_FALLBACK_RE = re.compile(r"v?(\d+\.\d+[\.\d]*(?:-\w+)?)")
 
 # Supported formats
-_SUPPORTED_FORMATS = ["appleseed"]
+_SUPPORTED_FORMATS = ("appleseed",)
 
 _EXT_TO_FORMAT: dict[str, str] = {
     ".appleseed": "appleseed",
 }
 
+# Scene validation only needs membership, not the mapped format
+_SUPPORTED_EXTENSIONS = frozenset(_EXT_TO_FORMAT)
+
 
 class AppleseedAdapter(RendererAdapter):
     """Adapter for appleseed — production path tracer with Disney materials.
@@ -80,31 +84,10 @@ class AppleseedAdapter(RendererAdapter):
         binary = self._find_binary()
         if binary is None:
             return None
+        return _detect_version(binary)
 
-        try:
-            result = run_subprocess(
-                [binary, "--version"],
-                timeout=10.0,
-            )
-        except (FileNotFoundError, Exception):
-            logger.debug("Failed to run '%s --version'", binary)
-            # Binary found but version extraction failed
-            return "unknown"
-
-        output = f"{result.stdout}\n{result.stderr}"
-        match = _VERSION_RE.search(output)
-        if match:
-            return match.group(1)
-
-        match = _VERSION_FALLBACK_RE.search(output)
-        if match:
-            return match.group(1)
-
-        logger.debug("appleseed binary found but version not parsed from: %s", output[:200])
-        return "unknown"
-
-    def supported_formats(self) -> list[str]:
-        return list(_SUPPORTED_FORMATS)
+    def supported_formats(self) -> tuple[str, ...]:
+        return _SUPPORTED_FORMATS
 
     def render(
         self,
@@ -137,13 +120,16 @@ class AppleseedAdapter(RendererAdapter):
                 ),
             )
 
+        # Stringify paths once; they are reused for argv, errors, and metadata
+        scene_str = os.fspath(scene_path)
+        output_str = os.fspath(output_path)
+
         # Validate scene format
         ext = scene_path.suffix.lower()
-        fmt = _EXT_TO_FORMAT.get(ext)
-        if fmt is None:
+        if ext not in _SUPPORTED_EXTENSIONS:
             raise SceneFormatError(
                 self.display_name,
-                str(scene_path),
+                scene_str,
                 ext.lstrip("."),
                 self.supported_formats(),
             )
@@ -151,7 +137,7 @@ class AppleseedAdapter(RendererAdapter):
         if not scene_path.exists():
             raise RenderError(
                 self.display_name,
-                f"Scene file not found: {scene_path}",
+                f"Scene file not found: {scene_str}",
             )
 
         # Warn about GPU — appleseed is CPU-only
@@ -161,7 +147,7 @@ class AppleseedAdapter(RendererAdapter):
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Build command
-        cmd = [binary, str(scene_path), "--output", str(output_path)]
+        cmd = [binary, scene_str, "--output", output_str]
 
         if settings.width is not None and settings.height is not None:
             cmd.extend(["--resolution", str(settings.width), str(settings.height)])
@@ -176,7 +162,7 @@ class AppleseedAdapter(RendererAdapter):
         result = run_subprocess(
             cmd,
             timeout=timeout,
-            cwd=str(scene_path.parent),
+            cwd=scene_path.parent,
         )
 
         if result.exit_code != 0:
@@ -190,52 +176,97 @@ class AppleseedAdapter(RendererAdapter):
         if not output_path.exists() or output_path.stat().st_size == 0:
             raise RenderError(
                 self.display_name,
-                f"Output file was not created or is empty: {output_path}",
+                f"Output file was not created or is empty: {output_str}",
                 stderr_output=result.stderr,
             )
 
-        # Check for supplementary tools
-        has_studio = shutil.which(_STUDIO_BINARY) is not None
-
         # Build result
         builder = RenderResultBuilder(
             renderer=self.name,
             scene=scene_path.stem,
-            output_path=str(output_path),
+            output_path=output_str,
             render_time_seconds=result.elapsed_seconds,
             peak_memory_mb=result.peak_memory_mb,
             settings=settings,
             metadata={
                 "binary": binary,
-                "version": self.detect(),
+                "version": _detect_version(binary),
                 "exit_code": result.exit_code,
                 "gpu_enabled": False,  # always CPU
                 "gpu_requested": settings.gpu,
-                "has_studio": has_studio,
+                "has_studio": _studio_available(),
             },
         )
         return builder.build()
 
     @staticmethod
     def _find_binary() -> str | None:
-        """Search PATH for the appleseed CLI binary.
+        """Search PATH for the appleseed CLI binary (cached per process).
 
         Returns:
             The binary name or ``None``.
         """
-        for name in _BINARY_NAMES:
-            path = shutil.which(name)
-            if path is not None:
-                logger.debug("Found appleseed binary: %s → %s", name, path)
-                return name
-        return None
+        return resolve_binary(_BINARY_NAMES)
+
+
+@cached_probe
+def _studio_available() -> bool:
+    """Whether the optional ``appleseed.studio`` GUI is in PATH (cached)."""
+    return resolve_binary((_STUDIO_BINARY,)) is not None
 
 
-def _register() -> None:
-    """Register the appleseed adapter with the global registry."""
-    from renderscope.core.registry import registry
+@cached_probe
+def _detect_version(binary: str) -> str:
+    """Run ``<binary> --version`` once per process and parse the version.
 
-    registry.register(AppleseedAdapter)
+    Args:
+        binary: The appleseed CLI binary name.
 
+    Returns:
+        Version string, or ``'unknown'`` if it could not be determined.
+    """
+    try:
+        result = run_subprocess(
+            [binary, "--version"],
+            timeout=10.0,
+            monitor_memory=False,
+        )
+    except (FileNotFoundError, Exception):
+        logger.debug("Failed to run '%s --version'", binary)
+        # Binary found but version extraction failed
+        return "unknown"
+
+    # Search each stream separately (stdout first) rather than joining them
+    streams = (result.stdout, result.stderr)
+    for stream in streams:
+        version = _leading_version(stream)
+        if version is not None:
+            return version
+
+        match = _VERSION_RE.search(stream)
+        if match:
+            return match.group(1)
 
-_register()
+    for stream in streams:
+        match = _VERSION_FALLBACK_RE.search(stream)
+        if match:
+            return match.group(1)
+
+    logger.debug(
+        "appleseed binary found but version not parsed from: %s",
+        (result.stdout or result.stderr)[:200],
+    )
+    return "unknown"
+
+
+def _leading_version(output: str) -> str | None:
+    """Fast path for the usual ``appleseed.cli version X.Y.Z`` output shape.
+
+    Returns the same token ``_VERSION_RE`` would capture, without running
+    the regex, when the output starts with the binary name followed by
+    ``version``.  Returns ``None`` for any other shape.
+    """
+    tokens = output.split(None, 3)
+    if len(tokens) >= 3 and tokens[0].lower() in _BINARY_NAMES and tokens[1].lower() == "version":
+        return tokens[2]
+    return None
@@ -8,15 +8,32 @@ implementations are created in Phase 16.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     from renderscope.models.benchmark import RenderResult
     from renderscope.models.settings import RenderSettings
 
 
+@dataclass(frozen=True)
+class RenderJob:
+    """A single render request for ``RendererAdapter.render_batch()``.
+
+    Attributes:
+        scene_path: Path to the scene file.
+        output_path: Path where the rendered image should be saved.
+        settings: Render configuration for this job.
+    """
+
+    scene_path: Path
+    output_path: Path
+    settings: RenderSettings
+
+
 class RendererAdapter(ABC):
     """Abstract interface for renderer adapters.
 
@@ -24,6 +41,9 @@ class RendererAdapter(ABC):
     detection, format information, and render execution.
     """
 
+    # No per-instance state here, so subclasses may opt into ``__slots__``
+    __slots__ = ()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -43,11 +63,14 @@ class RendererAdapter(ABC):
         """
 
     @abstractmethod
-    def supported_formats(self) -> list[str]:
+    def supported_formats(self) -> Sequence[str]:
         """Scene file formats this renderer can consume.
 
+        Built-in adapters return a shared tuple; callers must not mutate
+        the result (copy it with ``list()`` if needed).
+
         Returns:
-            A list of format identifiers (e.g., ``['pbrt', 'gltf']``).
+            A sequence of format identifiers (e.g., ``('pbrt', 'gltf')``).
         """
 
     @abstractmethod
@@ -68,6 +91,21 @@ class RendererAdapter(ABC):
             A ``RenderResult`` with timing, output path, and metadata.
         """
 
+    def render_batch(self, jobs: Sequence[RenderJob]) -> list[RenderResult]:
+        """Execute several renders, returning one result per job in order.
+
+        The default implementation calls ``render()`` for each job.
+        Adapters whose renderer has an expensive process startup override
+        this to amortize it across the batch.
+
+        Args:
+            jobs: Render jobs, executed in order.
+
+        Returns:
+            One ``RenderResult`` per job, in the same order.
+        """
+        return [self.render(job.scene_path, job.output_path, job.settings) for job in jobs]
+
     @property
     def is_mock(self) -> bool:
         """Whether this is a mock/test-only adapter.
@@ -11,14 +11,21 @@ Render:     ``blender [scene.blend] --background --python <script.py>``
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import json
 import logging
+import os
 import re
 import shutil
+import string
 import tempfile
-import textwrap
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from renderscope.adapters._discovery import cached_probe, resolve_binary
 from renderscope.adapters.base import RendererAdapter
 from renderscope.adapters.exceptions import (
     RendererNotFoundError,
@@ -28,16 +35,26 @@ from renderscope.adapters.exceptions import (
 from renderscope.core.runner import RenderResultBuilder, run_subprocess
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from renderscope.adapters.base import RenderJob
     from renderscope.models.benchmark import RenderResult
     from renderscope.models.settings import RenderSettings
 
+# Blender logs are scanned on every render; use RE2's linear-time engine
+# for those patterns when ``google-re2`` is installed (``renderscope[re2]``).
+try:
+    import re2 as _log_re
+except ImportError:
+    _log_re = re
+
 logger = logging.getLogger(__name__)
 
 _BINARY_NAMES = ("blender",)
 
 _VERSION_RE = re.compile(r"Blender\s+(\d+\.\d+[\.\d]*)", re.IGNORECASE)
 
-_SUPPORTED_FORMATS = ["blend", "gltf", "glb", "obj", "fbx", "stl", "ply", "abc", "usd"]
+_SUPPORTED_FORMATS = ("blend", "gltf", "glb", "obj", "fbx", "stl", "ply", "abc", "usd")
 
 _EXT_TO_FORMAT: dict[str, str] = {
     ".blend": "blend",
@@ -54,172 +71,411 @@ _EXT_TO_FORMAT: dict[str, str] = {
     ".usdz": "usd",
 }
 
+# Scene validation only needs membership, not the mapped format
+_SUPPORTED_EXTENSIONS = frozenset(_EXT_TO_FORMAT)
+
 # Template for the Python script that Blender executes in --background mode.
 # All communication with the adapter happens via string-substituted variables
-# because Blender's Python is isolated from the system Python.
-_RENDER_SCRIPT_TEMPLATE = textwrap.dedent("""\
-    # RenderScope — Blender Cycles render script
-    # Auto-generated; do not edit.
-    import bpy
-    import sys
-    import os
-    import json
-
-    # --- Configuration (injected by adapter) ---
-    SCENE_PATH = {scene_path!r}
-    OUTPUT_PATH = {output_path!r}
-    WIDTH = {width}
-    HEIGHT = {height}
-    SAMPLES = {samples}
-    USE_GPU = {use_gpu}
-    IS_BLEND_FILE = {is_blend}
-    CAMERA_POSITION = {camera_position!r}  # None or [x, y, z]
-    CAMERA_TARGET = {camera_target!r}      # None or [x, y, z]
-    CAMERA_UP = {camera_up!r}              # None or [x, y, z]
-    CAMERA_FOV = {camera_fov!r}            # None or float
-
-    # --- Resolve output path to absolute (Blender may change CWD) ---
-    OUTPUT_PATH = os.path.abspath(OUTPUT_PATH)
-
-    # --- Import scene if not a .blend file ---
-    if not IS_BLEND_FILE:
-        ext = os.path.splitext(SCENE_PATH)[1].lower()
-        # Clear default scene
-        bpy.ops.wm.read_homefile(use_empty=True)
-        if ext in ('.gltf', '.glb'):
-            bpy.ops.import_scene.gltf(filepath=SCENE_PATH)
-        elif ext == '.obj':
-            bpy.ops.wm.obj_import(filepath=SCENE_PATH)
-        elif ext == '.fbx':
-            bpy.ops.import_scene.fbx(filepath=SCENE_PATH)
-        elif ext == '.stl':
-            bpy.ops.wm.stl_import(filepath=SCENE_PATH)
-        elif ext == '.ply':
-            bpy.ops.wm.ply_import(filepath=SCENE_PATH)
-        elif ext in ('.usd', '.usda', '.usdc', '.usdz'):
-            bpy.ops.wm.usd_import(filepath=SCENE_PATH)
-        elif ext == '.abc':
-            bpy.ops.wm.alembic_import(filepath=SCENE_PATH)
-        else:
-            print(f"[RenderScope] Unsupported format: {{ext}}", file=sys.stderr)
-            sys.exit(1)
-
-    # --- Ensure camera exists (OBJ/STL/PLY imports lack cameras) ---
-    import mathutils
-    scene = bpy.context.scene
-    if not any(obj.type == 'CAMERA' for obj in bpy.data.objects):
-        print("[RenderScope] No camera found, creating one...", file=sys.stderr)
-        cam_data = bpy.data.cameras.new("RenderScope_Camera")
-        cam_obj = bpy.data.objects.new("RenderScope_Camera", cam_data)
-        scene.collection.objects.link(cam_obj)
-        scene.camera = cam_obj
-
-        if CAMERA_POSITION is not None and CAMERA_TARGET is not None:
-            pos = mathutils.Vector(CAMERA_POSITION)
-            target = mathutils.Vector(CAMERA_TARGET)
-            direction = target - pos
-            rot_quat = direction.to_track_quat('-Z', 'Y')
-            cam_obj.location = pos
-            cam_obj.rotation_euler = rot_quat.to_euler()
-            if CAMERA_FOV is not None:
-                import math
-                cam_data.lens_unit = 'FOV'
-                cam_data.angle = math.radians(CAMERA_FOV)
-        else:
-            # Fallback: frame all objects
-            cam_obj.location = (0, -10, 5)
-            cam_obj.rotation_euler = (1.1, 0, 0)
-            cam_data.lens = 35
-
-    # Ensure a light exists (imported meshes often have no lights)
-    if not any(obj.type == 'LIGHT' for obj in bpy.data.objects):
-        print("[RenderScope] No light found, adding environment light...", file=sys.stderr)
-        world = bpy.data.worlds.new("RenderScope_World")
-        scene.world = world
-        world.use_nodes = True
-        bg_node = world.node_tree.nodes.get("Background")
-        if bg_node:
-            bg_node.inputs[0].default_value = (0.8, 0.8, 0.8, 1.0)
-            bg_node.inputs[1].default_value = 1.0
-
-    # --- Configure Cycles ---
-    scene.render.engine = 'CYCLES'
-    scene.render.resolution_x = WIDTH
-    scene.render.resolution_y = HEIGHT
-    scene.render.resolution_percentage = 100
-    scene.cycles.samples = SAMPLES
-
-    # Output format
-    output_ext = os.path.splitext(OUTPUT_PATH)[1].lower()
-    if output_ext == '.exr':
-        scene.render.image_settings.file_format = 'OPEN_EXR'
-        scene.render.image_settings.color_mode = 'RGBA'
-        scene.render.image_settings.color_depth = '32'
-    elif output_ext == '.png':
-        scene.render.image_settings.file_format = 'PNG'
-        scene.render.image_settings.color_mode = 'RGBA'
-        scene.render.image_settings.color_depth = '16'
+# because Blender's Python is isolated from the system Python.  The literal
+# is kept flush-left so no ``textwrap.dedent`` pass is needed at import.
+_RENDER_SCRIPT_TEMPLATE = """\
+# RenderScope — Blender Cycles render script
+# Auto-generated; do not edit.
+import bpy
+import sys
+import os
+import json
+
+# --- Configuration (injected by adapter) ---
+SCENE_PATH = {scene_path!r}
+OUTPUT_PATH = {output_path!r}
+STATS_PATH = {stats_path!r}  # JSON sidecar read back by the adapter
+WIDTH = {width}
+HEIGHT = {height}
+SAMPLES = {samples}
+USE_GPU = {use_gpu}
+IS_BLEND_FILE = {is_blend}
+CAMERA_POSITION = {camera_position!r}  # None or [x, y, z]
+CAMERA_TARGET = {camera_target!r}      # None or [x, y, z]
+CAMERA_UP = {camera_up!r}              # None or [x, y, z]
+CAMERA_FOV = {camera_fov!r}            # None or float
+
+# --- Resolve output path to absolute (Blender may change CWD) ---
+OUTPUT_PATH = os.path.abspath(OUTPUT_PATH)
+
+# --- Import scene if not a .blend file ---
+if not IS_BLEND_FILE:
+    ext = os.path.splitext(SCENE_PATH)[1].lower()
+    # Clear default scene
+    bpy.ops.wm.read_homefile(use_empty=True)
+    if ext in ('.gltf', '.glb'):
+        bpy.ops.import_scene.gltf(filepath=SCENE_PATH)
+    elif ext == '.obj':
+        bpy.ops.wm.obj_import(filepath=SCENE_PATH)
+    elif ext == '.fbx':
+        bpy.ops.import_scene.fbx(filepath=SCENE_PATH)
+    elif ext == '.stl':
+        bpy.ops.wm.stl_import(filepath=SCENE_PATH)
+    elif ext == '.ply':
+        bpy.ops.wm.ply_import(filepath=SCENE_PATH)
+    elif ext in ('.usd', '.usda', '.usdc', '.usdz'):
+        bpy.ops.wm.usd_import(filepath=SCENE_PATH)
+    elif ext == '.abc':
+        bpy.ops.wm.alembic_import(filepath=SCENE_PATH)
     else:
-        scene.render.image_settings.file_format = 'PNG'
-        scene.render.image_settings.color_mode = 'RGBA'
-
-    scene.render.filepath = OUTPUT_PATH
-
-    # --- GPU configuration ---
-    if USE_GPU:
-        prefs = bpy.context.preferences.addons.get('cycles')
-        if prefs is not None:
-            cprefs = prefs.preferences
-            # Try backends in priority order
-            for device_type in ('OPTIX', 'CUDA', 'HIP', 'ONEAPI'):
-                try:
-                    cprefs.compute_device_type = device_type
-                    cprefs.get_devices()
-                    # Enable all available devices of this type
-                    found_device = False
-                    for device in cprefs.devices:
-                        if device.type == device_type:
-                            device.use = True
-                            found_device = True
-                        elif device.type == 'CPU':
-                            device.use = False
-                    if found_device:
-                        scene.cycles.device = 'GPU'
-                        print(f"[RenderScope] GPU: {{device_type}}", file=sys.stderr)
-                        break
-                except Exception:
-                    continue
-            else:
-                # No GPU backend found; fall back to CPU
-                scene.cycles.device = 'CPU'
-                print("[RenderScope] GPU not available, using CPU", file=sys.stderr)
+        print(f"[RenderScope] Unsupported format: {{ext}}", file=sys.stderr)
+        sys.exit(1)
+
+# --- Ensure camera exists (OBJ/STL/PLY imports lack cameras) ---
+import mathutils
+scene = bpy.context.scene
+if not any(obj.type == 'CAMERA' for obj in bpy.data.objects):
+    print("[RenderScope] No camera found, creating one...", file=sys.stderr)
+    cam_data = bpy.data.cameras.new("RenderScope_Camera")
+    cam_obj = bpy.data.objects.new("RenderScope_Camera", cam_data)
+    scene.collection.objects.link(cam_obj)
+    scene.camera = cam_obj
+
+    if CAMERA_POSITION is not None and CAMERA_TARGET is not None:
+        pos = mathutils.Vector(CAMERA_POSITION)
+        target = mathutils.Vector(CAMERA_TARGET)
+        direction = target - pos
+        rot_quat = direction.to_track_quat('-Z', 'Y')
+        cam_obj.location = pos
+        cam_obj.rotation_euler = rot_quat.to_euler()
+        if CAMERA_FOV is not None:
+            import math
+            cam_data.lens_unit = 'FOV'
+            cam_data.angle = math.radians(CAMERA_FOV)
+    else:
+        # Fallback: frame all objects
+        cam_obj.location = (0, -10, 5)
+        cam_obj.rotation_euler = (1.1, 0, 0)
+        cam_data.lens = 35
+
+# Ensure a light exists (imported meshes often have no lights)
+if not any(obj.type == 'LIGHT' for obj in bpy.data.objects):
+    print("[RenderScope] No light found, adding environment light...", file=sys.stderr)
+    world = bpy.data.worlds.new("RenderScope_World")
+    scene.world = world
+    world.use_nodes = True
+    bg_node = world.node_tree.nodes.get("Background")
+    if bg_node:
+        bg_node.inputs[0].default_value = (0.8, 0.8, 0.8, 1.0)
+        bg_node.inputs[1].default_value = 1.0
+
+# --- Configure Cycles ---
+scene.render.engine = 'CYCLES'
+scene.render.resolution_x = WIDTH
+scene.render.resolution_y = HEIGHT
+scene.render.resolution_percentage = 100
+scene.cycles.samples = SAMPLES
+
+# Output format
+output_ext = os.path.splitext(OUTPUT_PATH)[1].lower()
+if output_ext == '.exr':
+    scene.render.image_settings.file_format = 'OPEN_EXR'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.image_settings.color_depth = '32'
+elif output_ext == '.png':
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    scene.render.image_settings.color_depth = '16'
+else:
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+
+scene.render.filepath = OUTPUT_PATH
+
+# --- GPU configuration ---
+GPU_BACKEND = 'CPU'
+if USE_GPU:
+    prefs = bpy.context.preferences.addons.get('cycles')
+    if prefs is not None:
+        cprefs = prefs.preferences
+        # Try backends in priority order
+        for device_type in ('OPTIX', 'CUDA', 'HIP', 'ONEAPI'):
+            try:
+                cprefs.compute_device_type = device_type
+                cprefs.get_devices()
+                # Enable all available devices of this type
+                found_device = False
+                for device in cprefs.devices:
+                    if device.type == device_type:
+                        device.use = True
+                        found_device = True
+                    elif device.type == 'CPU':
+                        device.use = False
+                if found_device:
+                    scene.cycles.device = 'GPU'
+                    GPU_BACKEND = device_type
+                    print(f"[RenderScope] GPU: {{device_type}}", file=sys.stderr)
+                    break
+            except Exception:
+                continue
         else:
+            # No GPU backend found; fall back to CPU
             scene.cycles.device = 'CPU'
+            GPU_BACKEND = 'CPU (fallback)'
+            print("[RenderScope] GPU not available, using CPU", file=sys.stderr)
     else:
         scene.cycles.device = 'CPU'
+else:
+    scene.cycles.device = 'CPU'
+
+# --- Ensure output directory exists ---
+os.makedirs(os.path.dirname(os.path.abspath(OUTPUT_PATH)), exist_ok=True)
+
+# --- Render ---
+print("[RenderScope] Starting render...", file=sys.stderr)
+bpy.ops.render.render(write_still=False)
+
+# Save render result to exact output path (avoids Blender's frame
+# number and extension appending that write_still=True does).
+result_img = bpy.data.images.get('Render Result')
+if result_img is not None:
+    result_img.save_render(filepath=OUTPUT_PATH, scene=scene)
+    print(f"[RenderScope] Saved to: {{OUTPUT_PATH}}", file=sys.stderr)
+else:
+    print("[RenderScope] ERROR: No render result image found", file=sys.stderr)
+    sys.exit(1)
+
+# --- Report render stats in a sidecar instead of parsed log lines ---
+with open(STATS_PATH, 'w', encoding='utf-8') as stats_file:
+    json.dump({{'gpu_backend': GPU_BACKEND, 'samples': scene.cycles.samples}}, stats_file)
+
+print("[RenderScope] Render complete.", file=sys.stderr)
+"""
 
-    # --- Ensure output directory exists ---
-    os.makedirs(os.path.dirname(os.path.abspath(OUTPUT_PATH)), exist_ok=True)
+# The template is split into ``(literal, field, format_spec, conversion)``
+# segments once at import, so each render only substitutes the injected
+# values instead of re-parsing ~6 KB of template text with ``str.format``.
+_RENDER_SCRIPT_SEGMENTS: tuple[tuple[str, str | None, str | None, str | None], ...] = tuple(
+    string.Formatter().parse(_RENDER_SCRIPT_TEMPLATE)
+)
 
-    # --- Render ---
-    print("[RenderScope] Starting render...", file=sys.stderr)
-    bpy.ops.render.render(write_still=False)
 
-    # Save render result to exact output path (avoids Blender's frame
-    # number and extension appending that write_still=True does).
-    result_img = bpy.data.images.get('Render Result')
-    if result_img is not None:
-        result_img.save_render(filepath=OUTPUT_PATH, scene=scene)
-        print(f"[RenderScope] Saved to: {{OUTPUT_PATH}}", file=sys.stderr)
-    else:
-        print("[RenderScope] ERROR: No render result image found", file=sys.stderr)
-        sys.exit(1)
+# Only the scene, output, and stats paths normally change between renders of one
+# benchmark configuration.  They all sit at the top of the template, so the
+# segments are split after the last path field: the head is filled on every
+# call and the (much larger) body is cached per distinct configuration.
+_RENDER_SCRIPT_PATH_FIELDS = frozenset({"scene_path", "output_path", "stats_path"})
+_RENDER_SCRIPT_SPLIT = 1 + max(
+    i
+    for i, (_, field_name, _, _) in enumerate(_RENDER_SCRIPT_SEGMENTS)
+    if field_name in _RENDER_SCRIPT_PATH_FIELDS
+)
+_RENDER_SCRIPT_HEAD = _RENDER_SCRIPT_SEGMENTS[:_RENDER_SCRIPT_SPLIT]
+_RENDER_SCRIPT_BODY = _RENDER_SCRIPT_SEGMENTS[_RENDER_SCRIPT_SPLIT:]
+
+
+def _format_field(value: object, format_spec: str | None, conversion: str | None) -> str:
+    """Apply a replacement field's conversion and format spec to *value*."""
+    if conversion == "r":
+        value = repr(value)
+    elif conversion == "s":
+        value = str(value)
+    return format(value, format_spec or "")
+
+
+def _build_render_script(**fields: object) -> str:
+    """Fill the pre-parsed render script template.
+
+    Equivalent to ``_RENDER_SCRIPT_TEMPLATE.format(**fields)``.
+
+    Raises:
+        KeyError: If a template field is missing from *fields*.
+    """
+    parts: list[str] = []
+    for literal, field_name, format_spec, conversion in _RENDER_SCRIPT_HEAD:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(_format_field(fields[field_name], format_spec, conversion))
+    body_values = tuple(
+        _format_field(fields[field_name], format_spec, conversion)
+        for _, field_name, format_spec, conversion in _RENDER_SCRIPT_BODY
+        if field_name is not None
+    )
+    parts.append(_render_script_body(body_values))
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_script_body(values: tuple[str, ...]) -> str:
+    """Join the configuration part of the template with formatted *values*.
+
+    Keyed by the already-formatted field values, so list-valued settings
+    (camera vectors) need no hashable stand-in and the output stays
+    byte-identical to ``str.format``.
+    """
+    parts: list[str] = []
+    remaining = iter(values)
+    for literal, field_name, _, _ in _RENDER_SCRIPT_BODY:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(next(remaining))
+    return "".join(parts)
+
+
+@functools.cache
+def _script_dir() -> Path:
+    """Private per-process directory for generated render scripts.
+
+    Created with ``mkdtemp`` (owner-only permissions) on first use and
+    removed at interpreter exit.
+    """
+    path = Path(tempfile.mkdtemp(prefix="renderscope_cycles_"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _write_render_script(script_content: str) -> Path:
+    """Write a render script keyed by its content hash, reusing existing files.
+
+    Args:
+        script_content: The generated Blender Python script.
+
+    Returns:
+        Path to the script file.
+    """
+    digest = hashlib.blake2b(script_content.encode("utf-8"), digest_size=16).hexdigest()
+    script_file = _script_dir() / f"{digest}.py"
+    if not script_file.exists():
+        script_file.write_text(script_content, encoding="utf-8")
+    return script_file
 
-    print("[RenderScope] Render complete.", file=sys.stderr)
-""")
 
 # ANSI escape code pattern for stripping color from Blender output
-_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_ANSI_RE = _log_re.compile(r"\x1b\[[0-9;]*m")
+
+# One-pass scan of render stderr: ANSI codes to strip, plus the GPU
+# backend markers printed by the render script.
+_STDERR_SCAN_RE = _log_re.compile(
+    r"(?P<ansi>\x1b\[[0-9;]*m)"
+    r"|\[RenderScope\] GPU: (?P<gpu>[^\s\x1b]+)"
+    r"|(?P<fallback>GPU not available)"
+)
+
+
+def _scan_render_stderr(stderr: str) -> tuple[str, str]:
+    """Strip ANSI codes and find the GPU backend in a single pass.
+
+    Fallback for renders that left no stats sidecar (see ``_read_render_stats``).
+
+    Args:
+        stderr: Raw stderr captured from Blender.
+
+    Returns:
+        A ``(stderr_clean, gpu_backend)`` tuple.  ``gpu_backend`` is the
+        first backend reported by the render script, ``'CPU (fallback)'``
+        if no GPU was available, or ``'CPU'`` if neither marker appears.
+    """
+    gpu_backend: str | None = None
+    chunks: list[str] = []
+    pos = 0
+    for match in _STDERR_SCAN_RE.finditer(stderr):
+        if match.group("ansi") is not None:
+            chunks.append(stderr[pos : match.start()])
+            pos = match.end()
+        elif gpu_backend is None:
+            gpu_backend = match.group("gpu") or "CPU (fallback)"
+    chunks.append(stderr[pos:])
+    return "".join(chunks), gpu_backend or "CPU"
+
+
+def _read_render_stats(stats_path: Path) -> dict[str, Any] | None:
+    """Load and delete the JSON stats sidecar written by the render script.
+
+    Returns:
+        The stats mapping, or ``None`` if the sidecar is missing or invalid.
+    """
+    try:
+        raw = stats_path.read_bytes()
+    except OSError:
+        return None
+    stats_path.unlink(missing_ok=True)
+    try:
+        stats = json.loads(raw)
+    except ValueError:
+        logger.debug("Ignoring malformed Cycles stats sidecar: %s", stats_path)
+        return None
+    return stats if isinstance(stats, dict) else None
+
+
+# Driver for ``render_batch()``: runs each job's render script inside one
+# Blender process and reports per-job status and timing on stderr.  A
+# job's script calling ``sys.exit(1)`` marks only that job as failed.
+_BATCH_SCRIPT_TEMPLATE = """\
+# RenderScope — Blender Cycles batch render driver
+# Auto-generated; do not edit.
+import sys
+import time
+import traceback
+
+import bpy
+
+JOBS = {jobs!r}  # [(scene_path, is_blend_file, script_path), ...]
+
+for index, (scene_path, is_blend, script_path) in enumerate(JOBS):
+    start = time.perf_counter()
+    try:
+        if is_blend:
+            bpy.ops.wm.open_mainfile(filepath=scene_path)
+        with open(script_path, encoding="utf-8") as f:
+            code = compile(f.read(), script_path, "exec")
+        exec(code, {{"__name__": "__main__"}})
+    except SystemExit as exc:
+        ok = not exc.code
+    except Exception:
+        traceback.print_exc()
+        ok = False
+    else:
+        ok = True
+    elapsed = time.perf_counter() - start
+    status = "JOB_DONE" if ok else "JOB_FAILED"
+    print(f"[RenderScope] {{status}} {{index}} {{elapsed:.6f}}", file=sys.stderr, flush=True)
+"""
+
+_BATCH_REPORT_RE = re.compile(r"\[RenderScope\] (JOB_DONE|JOB_FAILED) (\d+) (\d+\.\d+)")
+
+
+@dataclass(frozen=True)
+class _PreparedJob:
+    """A validated Cycles job with its render script written to disk."""
+
+    scene_str: str
+    output_str: str
+    output_path: Path
+    is_blend: bool
+    samples: int
+    script_file: str
+    stats_path: Path
+
+
+@dataclass(frozen=True)
+class _BatchJobReport:
+    """Outcome of one job in a batch, parsed from the driver's stderr."""
+
+    ok: bool
+    elapsed_seconds: float
+    log: str
+
+
+def _parse_batch_report(stderr_clean: str) -> dict[int, _BatchJobReport]:
+    """Split batch stderr into per-job reports keyed by job index.
+
+    Each job's ``log`` is the stderr emitted since the previous job marker.
+    """
+    reports: dict[int, _BatchJobReport] = {}
+    pos = 0
+    for match in _BATCH_REPORT_RE.finditer(stderr_clean):
+        reports[int(match.group(2))] = _BatchJobReport(
+            ok=match.group(1) == "JOB_DONE",
+            elapsed_seconds=float(match.group(3)),
+            log=stderr_clean[pos : match.start()],
+        )
+        pos = match.end()
+    return reports
 
 
 class CyclesAdapter(RendererAdapter):
@@ -242,26 +498,10 @@ class CyclesAdapter(RendererAdapter):
         binary = self._find_binary()
         if binary is None:
             return None
+        return _detect_version(binary)
 
-        try:
-            result = run_subprocess(
-                [binary, "--version"],
-                timeout=15.0,
-            )
-        except (FileNotFoundError, Exception):
-            logger.debug("Failed to run '%s --version'", binary)
-            return None
-
-        output = _ANSI_RE.sub("", f"{result.stdout}\n{result.stderr}")
-        match = _VERSION_RE.search(output)
-        if match:
-            return match.group(1)
-
-        logger.debug("Blender found but version not parsed from: %s", output[:200])
-        return "unknown"
-
-    def supported_formats(self) -> list[str]:
-        return list(_SUPPORTED_FORMATS)
+    def supported_formats(self) -> tuple[str, ...]:
+        return _SUPPORTED_FORMATS
 
     def render(
         self,
@@ -287,20 +527,179 @@ class CyclesAdapter(RendererAdapter):
             SceneFormatError: If the scene format is unsupported.
             RenderError: If the render fails.
         """
+        binary = self._require_binary()
+        job = self._prepare_job(scene_path, output_path, settings)
+
+        # Build Blender command
+        cmd: list[str] = [binary]
+        if job.is_blend:
+            cmd.append(job.scene_str)
+        cmd.extend(["--background", "--python", job.script_file])
+
+        # Determine timeout
+        timeout = settings.time_budget if settings.time_budget else settings.extra.get("timeout")
+
+        # Execute
+        result = run_subprocess(cmd, timeout=timeout)
+
+        # Check for render success
+        # Blender exit code 0 doesn't guarantee success — verify output
+        if result.exit_code != 0:
+            raise RenderError(
+                self.display_name,
+                "Non-zero exit code",
+                exit_code=result.exit_code,
+                stderr_output=_ANSI_RE.sub("", result.stderr),
+            )
+
+        self._check_output(job, result.stderr)
+        stats = self._collect_stats(job, result.stderr)
+
+        # Build result
+        builder = RenderResultBuilder(
+            renderer=self.name,
+            scene=scene_path.stem,
+            output_path=job.output_str,
+            render_time_seconds=result.elapsed_seconds,
+            peak_memory_mb=result.peak_memory_mb,
+            settings=settings,
+            metadata={
+                "binary": binary,
+                "blender_version": _detect_version(binary),
+                "exit_code": result.exit_code,
+                "gpu_backend": stats["gpu_backend"],
+                "gpu_enabled": settings.gpu,
+                "samples": stats["samples"],
+                "is_blend_file": job.is_blend,
+            },
+        )
+        return builder.build()
+
+    def render_batch(self, jobs: Sequence[RenderJob]) -> list[RenderResult]:
+        """Render several scenes inside a single Blender process.
+
+        Blender's startup (often 1-3 s) dominates short renders, so all
+        jobs are driven by one ``--background`` process that executes each
+        job's render script in turn and reports per-job timings on stderr.
+        A single job falls back to ``render()``.
+
+        Per-job ``render_time_seconds`` covers scene loading and rendering
+        but not Blender startup; ``peak_memory_mb`` is the peak of the
+        whole batch process.
+
+        Args:
+            jobs: Render jobs, executed in order.
+
+        Returns:
+            One ``RenderResult`` per job, in the same order.
+
+        Raises:
+            RendererNotFoundError: If Blender is not installed.
+            SceneFormatError: If any scene format is unsupported.
+            RenderError: If the Blender process or any job fails.
+        """
+        if len(jobs) <= 1:
+            return super().render_batch(jobs)
+
+        binary = self._require_binary()
+        prepared = [
+            self._prepare_job(job.scene_path, job.output_path, job.settings) for job in jobs
+        ]
+
+        driver = _BATCH_SCRIPT_TEMPLATE.format(
+            jobs=[(job.scene_str, job.is_blend, job.script_file) for job in prepared],
+        )
+        cmd = [binary, "--background", "--python", os.fspath(_write_render_script(driver))]
+
+        # The batch may run as long as all of its jobs combined
+        job_timeouts = [
+            job.settings.time_budget
+            if job.settings.time_budget
+            else job.settings.extra.get("timeout")
+            for job in jobs
+        ]
+        timeout = (
+            None if None in job_timeouts else sum(float(t) for t in job_timeouts if t is not None)
+        )
+
+        result = run_subprocess(cmd, timeout=timeout)
+        stderr_clean = _ANSI_RE.sub("", result.stderr)
+
+        if result.exit_code != 0:
+            raise RenderError(
+                self.display_name,
+                "Non-zero exit code from batch render",
+                exit_code=result.exit_code,
+                stderr_output=stderr_clean,
+            )
+
+        reports = _parse_batch_report(stderr_clean)
+        results: list[RenderResult] = []
+        for index, (job, prep) in enumerate(zip(jobs, prepared, strict=True)):
+            report = reports.get(index)
+            if report is None or not report.ok:
+                raise RenderError(
+                    self.display_name,
+                    f"Batch job {index} failed: {prep.scene_str}",
+                    stderr_output=report.log if report is not None else stderr_clean,
+                )
+            self._check_output(prep, report.log)
+            stats = self._collect_stats(prep, report.log)
+
+            builder = RenderResultBuilder(
+                renderer=self.name,
+                scene=job.scene_path.stem,
+                output_path=prep.output_str,
+                render_time_seconds=report.elapsed_seconds,
+                peak_memory_mb=result.peak_memory_mb,
+                settings=job.settings,
+                metadata={
+                    "binary": binary,
+                    "blender_version": _detect_version(binary),
+                    "exit_code": result.exit_code,
+                    "gpu_backend": stats["gpu_backend"],
+                    "gpu_enabled": job.settings.gpu,
+                    "samples": stats["samples"],
+                    "is_blend_file": prep.is_blend,
+                    "batch_size": len(jobs),
+                    "batch_index": index,
+                },
+            )
+            results.append(builder.build())
+        return results
+
+    def _require_binary(self) -> str:
+        """Return the Blender binary or raise ``RendererNotFoundError``."""
         binary = self._find_binary()
         if binary is None:
             raise RendererNotFoundError(
                 self.display_name,
                 install_hint="Download from https://www.blender.org/download/",
             )
+        return binary
+
+    def _prepare_job(
+        self,
+        scene_path: Path,
+        output_path: Path,
+        settings: RenderSettings,
+    ) -> _PreparedJob:
+        """Validate a scene and write the render script for one job.
+
+        Raises:
+            SceneFormatError: If the scene format is unsupported.
+            RenderError: If the scene file does not exist.
+        """
+        # Path strings feed the render script, argv, errors, and metadata
+        scene_str = os.fspath(scene_path)
+        output_str = os.fspath(output_path)
 
         # Validate scene format
         ext = scene_path.suffix.lower()
-        fmt = _EXT_TO_FORMAT.get(ext)
-        if fmt is None:
+        if ext not in _SUPPORTED_EXTENSIONS:
             raise SceneFormatError(
                 self.display_name,
-                str(scene_path),
+                scene_str,
                 ext.lstrip("."),
                 self.supported_formats(),
             )
@@ -308,7 +707,7 @@ class CyclesAdapter(RendererAdapter):
         if not scene_path.exists():
             raise RenderError(
                 self.display_name,
-                f"Scene file not found: {scene_path}",
+                f"Scene file not found: {scene_str}",
             )
 
         is_blend = ext == ".blend"
@@ -317,6 +716,11 @@ class CyclesAdapter(RendererAdapter):
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Absolute, since Blender may run the script from another CWD; a
+        # stale sidecar from an earlier run must not be mistaken for ours.
+        stats_path = Path(os.path.abspath(output_str) + ".rs.json")
+        stats_path.unlink(missing_ok=True)
+
         # Extract camera info from settings.extra (passed by BenchmarkRunner)
         camera_position = settings.extra.get("camera_position")
         camera_target = settings.extra.get("camera_target")
@@ -324,9 +728,10 @@ class CyclesAdapter(RendererAdapter):
         camera_fov = settings.extra.get("camera_fov")
 
         # Generate the render script
-        script_content = _RENDER_SCRIPT_TEMPLATE.format(
-            scene_path=str(scene_path),
-            output_path=str(output_path),
+        script_content = _build_render_script(
+            scene_path=scene_str,
+            output_path=output_str,
+            stats_path=os.fspath(stats_path),
             width=settings.width,
             height=settings.height,
             samples=samples,
@@ -338,110 +743,104 @@ class CyclesAdapter(RendererAdapter):
             camera_fov=camera_fov,
         )
 
-        # Write script to temp file (cleaned up in finally)
-        script_file = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".py",
-                prefix="renderscope_cycles_",
-                delete=False,
-                encoding="utf-8",
-            ) as f:
-                f.write(script_content)
-                script_file = f.name
-
-            # Build Blender command
-            cmd: list[str] = [binary]
-            if is_blend:
-                cmd.append(str(scene_path))
-            cmd.extend(["--background", "--python", script_file])
-
-            # Determine timeout
-            timeout = (
-                settings.time_budget if settings.time_budget else settings.extra.get("timeout")
-            )
-
-            # Execute
-            result = run_subprocess(cmd, timeout=timeout)
+        # Identical scripts (e.g. repeated benchmark iterations) share one file
+        script_file = os.fspath(_write_render_script(script_content))
 
-            # Strip ANSI codes from output
-            stderr_clean = _ANSI_RE.sub("", result.stderr)
-
-            # Check for render success
-            # Blender exit code 0 doesn't guarantee success — verify output
-            if result.exit_code != 0:
-                raise RenderError(
-                    self.display_name,
-                    "Non-zero exit code",
-                    exit_code=result.exit_code,
-                    stderr_output=stderr_clean,
-                )
-
-            if not output_path.exists() or output_path.stat().st_size == 0:
-                raise RenderError(
-                    self.display_name,
-                    f"Output file was not created or is empty: {output_path}",
-                    stderr_output=stderr_clean,
-                )
-
-            # Detect GPU backend from script output
-            gpu_backend = "CPU"
-            for line in stderr_clean.splitlines():
-                if "[RenderScope] GPU:" in line:
-                    gpu_backend = line.split("GPU:")[-1].strip()
-                    break
-                if "GPU not available" in line:
-                    gpu_backend = "CPU (fallback)"
-                    break
+        return _PreparedJob(
+            scene_str=scene_str,
+            output_str=output_str,
+            output_path=output_path,
+            is_blend=is_blend,
+            samples=samples,
+            script_file=script_file,
+            stats_path=stats_path,
+        )
 
-            # Build result
-            builder = RenderResultBuilder(
-                renderer=self.name,
-                scene=scene_path.stem,
-                output_path=str(output_path),
-                render_time_seconds=result.elapsed_seconds,
-                peak_memory_mb=result.peak_memory_mb,
-                settings=settings,
-                metadata={
-                    "binary": binary,
-                    "blender_version": self.detect(),
-                    "exit_code": result.exit_code,
-                    "gpu_backend": gpu_backend,
-                    "gpu_enabled": settings.gpu,
-                    "samples": samples,
-                    "is_blend_file": is_blend,
-                },
+    def _check_output(self, job: _PreparedJob, stderr: str) -> None:
+        """Raise ``RenderError`` unless the job wrote a non-empty image."""
+        if not job.output_path.exists() or job.output_path.stat().st_size == 0:
+            raise RenderError(
+                self.display_name,
+                f"Output file was not created or is empty: {job.output_str}",
+                stderr_output=_ANSI_RE.sub("", stderr),
             )
-            return builder.build()
 
-        finally:
-            # Clean up temp script
-            if script_file is not None:
-                try:
-                    Path(script_file).unlink(missing_ok=True)
-                except OSError:
-                    logger.debug("Failed to clean up temp script: %s", script_file)
+    @staticmethod
+    def _collect_stats(job: _PreparedJob, stderr: str) -> dict[str, Any]:
+        """Return ``gpu_backend`` and ``samples`` for a finished job.
+
+        Reads the stats sidecar; the Blender log is only scanned when the
+        sidecar is missing (e.g. a script that exited before writing it).
+        """
+        stats = _read_render_stats(job.stats_path) or {}
+        if "gpu_backend" not in stats:
+            stats["gpu_backend"] = _scan_render_stderr(stderr)[1]
+        stats.setdefault("samples", job.samples)
+        return stats
 
     def _find_binary(self) -> str | None:
-        """Search PATH for the Blender binary.
+        """Search PATH for the Blender binary (cached per process).
 
         Returns:
             The binary name or ``None``.
         """
-        for name in _BINARY_NAMES:
-            path = shutil.which(name)
-            if path is not None:
-                logger.debug("Found Blender binary: %s → %s", name, path)
-                return name
+        return resolve_binary(_BINARY_NAMES)
+
+
+@cached_probe
+def _detect_version(binary: str) -> str | None:
+    """Run ``<binary> --version`` once per process and parse the version.
+
+    Blender cold-starts the whole application to print its version, so
+    the result is shared between ``detect()`` and render metadata.
+
+    Args:
+        binary: The Blender binary name.
+
+    Returns:
+        Version string, ``'unknown'`` if unparseable, or ``None`` if
+        Blender could not be run.
+    """
+    try:
+        result = run_subprocess(
+            [binary, "--version"],
+            timeout=15.0,
+            monitor_memory=False,
+        )
+    except (FileNotFoundError, Exception):
+        logger.debug("Failed to run '%s --version'", binary)
         return None
 
+    # Search each stream separately (stdout first) rather than joining
+    # them; stderr is only cleaned when stdout had no version.
+    for stream in (result.stdout, result.stderr):
+        output = _ANSI_RE.sub("", stream)
+        version = _leading_version(output)
+        if version is not None:
+            return version
+
+        match = _VERSION_RE.search(output)
+        if match:
+            return match.group(1)
 
-def _register() -> None:
-    """Register the Cycles adapter with the global registry."""
-    from renderscope.core.registry import registry
+    logger.debug(
+        "Blender found but version not parsed from: %s",
+        (result.stdout or result.stderr)[:200],
+    )
+    return "unknown"
 
-    registry.register(CyclesAdapter)
 
+def _leading_version(output: str) -> str | None:
+    """Fast path for the usual ``Blender X.Y.Z`` first line of ``--version``.
 
-_register()
+    Returns the same version ``_VERSION_RE`` would capture, without running
+    the regex, when the output starts with ``Blender`` followed by a plain
+    dotted version.  Returns ``None`` for any other shape.
+    """
+    tokens = output.split(None, 2)
+    if len(tokens) < 2 or tokens[0].lower() != "blender":
+        return None
+    major, dot, rest = tokens[1].partition(".")
+    if major.isdecimal() and dot and rest[:1].isdecimal() and rest.replace(".", "").isdecimal():
+        return tokens[1]
+    return None
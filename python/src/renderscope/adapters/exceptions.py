@@ -6,6 +6,11 @@ renderer detection, execution, or scene handling fails.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class RendererNotFoundError(Exception):
     """Raised when attempting to use a renderer that is not installed.
@@ -78,17 +83,21 @@ class SceneFormatError(Exception):
         renderer_name: str,
         scene_path: str,
         scene_format: str,
-        supported_formats: list[str],
+        supported_formats: Sequence[str],
     ) -> None:
         self.renderer_name = renderer_name
         self.scene_path = scene_path
         self.scene_format = scene_format
         self.supported_formats = supported_formats
-        fmt_list = ", ".join(f".{f}" for f in supported_formats)
-        msg = (
-            f"{renderer_name} cannot render '.{scene_format}' files.\n"
-            f"Scene: {scene_path}\n"
-            f"Supported formats for {renderer_name}: {fmt_list}\n\n"
+        # The message is only assembled in ``__str__``: adapter selection
+        # probes many (scene, renderer) pairs and discards most of these.
+        super().__init__(renderer_name, scene_path, scene_format, supported_formats)
+
+    def __str__(self) -> str:
+        fmt_list = ", ".join(f".{f}" for f in self.supported_formats)
+        return (
+            f"{self.renderer_name} cannot render '.{self.scene_format}' files.\n"
+            f"Scene: {self.scene_path}\n"
+            f"Supported formats for {self.renderer_name}: {fmt_list}\n\n"
             "Tip: Use 'renderscope list' to see which renderers support your scene format."
         )
-        super().__init__(msg)
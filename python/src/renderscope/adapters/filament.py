@@ -6,27 +6,39 @@ RenderScope, Filament renders frames in **milliseconds** via GPU
 rasterization.
 
 This adapter uses Filament's ``gltf_viewer`` sample tool for headless
-rendering.  To produce a stable timing measurement, it renders multiple
-frames and reports the average.
+rendering.  When the viewer's ``--help`` lists a ``--frames`` option, it
+renders multiple frames in a single viewer process — so process start-up
+and GPU context creation are paid once — and reports per-frame timings
+in metadata; otherwise it renders a single frame.
 
 Detection:  ``shutil.which("gltf_viewer")`` + Filament tool checks
-Render:     ``gltf_viewer --headless [options] <scene.gltf>``
+Render:     ``gltf_viewer --headless [--frames N] [options] <scene.gltf>``
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import re
-import shutil
-from typing import TYPE_CHECKING
-
+import statistics
+from contextlib import closing
+from typing import TYPE_CHECKING, Any
+
+from renderscope.adapters._discovery import (
+    cached_probe,
+    find_available,
+    import_optional,
+    resolve_binary,
+)
+from renderscope.adapters._paths import check_scene_exists, ensure_output_dir
+from renderscope.adapters._version import probe_version
 from renderscope.adapters.base import RendererAdapter
 from renderscope.adapters.exceptions import (
     RendererNotFoundError,
     RenderError,
     SceneFormatError,
 )
-from renderscope.core.runner import RenderResultBuilder, run_subprocess
+from renderscope.core.runner import RenderResultBuilder, iter_output_lines, run_subprocess
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -42,20 +54,41 @@ _VIEWER_BINARY = "gltf_viewer"
 # Supplementary Filament SDK tools (for detection only)
 _SUPPLEMENTARY_TOOLS = ("matc", "cmgen", "filamesh", "mipgen")
 
-# Version regex
-_VERSION_RE = re.compile(r"v?(\d+\.\d+[\.\d]*)")
+# Every tool probed, viewer first so it wins detection
+_ALL_TOOLS = (_VIEWER_BINARY, *_SUPPLEMENTARY_TOOLS)
+
+# Fixed head of every headless render command
+_ARGV_PREFIX = (_VIEWER_BINARY, "--headless")
 
 # Supported scene formats
-_SUPPORTED_FORMATS = ["gltf", "glb"]
+_SUPPORTED_FORMATS = ("gltf", "glb")
 
-_EXT_TO_FORMAT: dict[str, str] = {
-    ".gltf": "gltf",
-    ".glb": "glb",
-}
+# Scene file extensions accepted by render()
+_SUPPORTED_EXTENSIONS = frozenset({".gltf", ".glb"})
+
+# Stderr mentions that point at a missing GPU or display (e.g. "eglInitialize failed")
+_GPU_ERROR_RE = re.compile(r"egl|display|gpu", re.IGNORECASE)
 
 # Default number of frames to render for timing stability
 _DEFAULT_FRAME_COUNT = 100
 
+# Leading frames excluded from timing: they absorb shader compilation,
+# texture upload and other one-off start-up costs
+_DEFAULT_WARMUP_FRAMES = 3
+
+# ``--frames`` as an option name in the viewer's ``--help`` text
+_FRAMES_OPTION_RE = re.compile(r"(?<![\w-])--frames\b")
+
+# Limits for the ``--help`` probe
+_HELP_MAX_LINES = 200
+_HELP_TIMEOUT = 2.0
+
+# Per-frame timing lines printed by the viewer, e.g. "frame 12: 4.21 ms"
+_FRAME_TIME_RE = re.compile(
+    r"^\s*frame\s+\d+\s*[:=]?\s*(\d+(?:\.\d+)?)\s*ms\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 class FilamentAdapter(RendererAdapter):
     """Adapter for Google Filament — real-time PBR rendering engine.
@@ -69,6 +102,10 @@ class FilamentAdapter(RendererAdapter):
     fail with a descriptive error message.
     """
 
+    def __init__(self) -> None:
+        # Output directories already created by ``render()``
+        self._known_dirs: set[str] = set()
+
     @property
     def name(self) -> str:
         return "filament"
@@ -86,20 +123,12 @@ class FilamentAdapter(RendererAdapter):
         Returns:
             Version string or ``None``.
         """
-        # Primary: gltf_viewer
-        viewer_path = shutil.which(_VIEWER_BINARY)
-        if viewer_path is not None:
-            logger.debug("Found Filament viewer: %s", viewer_path)
-            version = self._extract_version_from_tool(_VIEWER_BINARY)
-            return version if version else "unknown"
-
-        # Fallback: check supplementary tools
-        for tool in _SUPPLEMENTARY_TOOLS:
-            tool_path = shutil.which(tool)
-            if tool_path is not None:
-                logger.debug("Found Filament tool: %s → %s", tool, tool_path)
-                version = self._extract_version_from_tool(tool)
-                return version if version else "unknown"
+        # Primary: gltf_viewer, then supplementary tools as a fallback.
+        # All tools are looked up in one concurrent scan, which render
+        # metadata (``_detect_available_tools``) reuses.
+        available = find_available(_ALL_TOOLS)
+        if available:
+            return _extract_version_from_tool(available[0]) or "unknown"
 
         # Last resort: Python bindings
         version = self._detect_python_bindings()
@@ -108,8 +137,8 @@ class FilamentAdapter(RendererAdapter):
 
         return None
 
-    def supported_formats(self) -> list[str]:
-        return list(_SUPPORTED_FORMATS)
+    def supported_formats(self) -> tuple[str, ...]:
+        return _SUPPORTED_FORMATS
 
     def render(
         self,
@@ -119,9 +148,11 @@ class FilamentAdapter(RendererAdapter):
     ) -> RenderResult:
         """Render a glTF/GLB scene using Filament's gltf_viewer.
 
-        Renders multiple frames in headless mode and reports the average
-        frame time.  Individual frame times are stored in metadata for
-        variance analysis.
+        Renders multiple frames in headless mode when the viewer supports
+        it.  ``render_time_seconds`` is process wall time, as for every
+        other adapter; the steady-state average frame time (excluding a few
+        warm-up frames), individual frame times and their standard
+        deviation are stored in metadata for variance analysis.
 
         Args:
             scene_path: Path to a ``.gltf`` or ``.glb`` scene file.
@@ -136,7 +167,7 @@ class FilamentAdapter(RendererAdapter):
             SceneFormatError: If the scene format is unsupported.
             RenderError: If the render fails.
         """
-        viewer = shutil.which(_VIEWER_BINARY)
+        viewer = resolve_binary((_VIEWER_BINARY,))
         if viewer is None:
             raise RendererNotFoundError(
                 self.display_name,
@@ -148,8 +179,7 @@ class FilamentAdapter(RendererAdapter):
 
         # Validate scene format
         ext = scene_path.suffix.lower()
-        fmt = _EXT_TO_FORMAT.get(ext)
-        if fmt is None:
+        if ext not in _SUPPORTED_EXTENSIONS:
             raise SceneFormatError(
                 self.display_name,
                 str(scene_path),
@@ -157,27 +187,21 @@ class FilamentAdapter(RendererAdapter):
                 self.supported_formats(),
             )
 
-        if not scene_path.exists():
-            raise RenderError(
-                self.display_name,
-                f"Scene file not found: {scene_path}",
-            )
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Build command for headless rendering
-        cmd = [_VIEWER_BINARY, "--headless"]
-
-        if settings.width is not None:
-            cmd.extend(["--width", str(settings.width)])
-        if settings.height is not None:
-            cmd.extend(["--height", str(settings.height)])
-
-        # Screenshot capture
-        cmd.extend(["--screenshot", str(output_path)])
-
-        # Scene file goes last
-        cmd.append(str(scene_path))
+        check_scene_exists(self.display_name, scene_path)
+        ensure_output_dir(output_path, self._known_dirs)
+
+        # Stringify the paths once; each is used several times below
+        output_str = os.fspath(output_path)
+        if _supports_frames_option(viewer):
+            frame_count = int(settings.extra.get("frames", _DEFAULT_FRAME_COUNT))
+            warmup_frames = int(settings.extra.get("warmup_frames", _DEFAULT_WARMUP_FRAMES))
+            # Warm-up frames run in the same process so the timed frames see
+            # a warm GPU context, compiled shaders and uploaded textures.
+            viewer_frames: int | None = warmup_frames + frame_count
+        else:
+            # Older viewers render exactly one frame per process
+            frame_count, warmup_frames, viewer_frames = 1, 0, None
+        cmd = _build_command(os.fspath(scene_path), output_str, settings, viewer_frames)
 
         # Determine timeout (Filament is fast, but scene loading can take time)
         timeout = settings.time_budget if settings.time_budget else settings.extra.get("timeout")
@@ -188,13 +212,12 @@ class FilamentAdapter(RendererAdapter):
         result = run_subprocess(
             cmd,
             timeout=timeout,
-            cwd=str(scene_path.parent),
+            cwd=os.fspath(scene_path.parent),
         )
 
         if result.exit_code != 0:
             # Check for common GPU/display issues
-            stderr_lower = result.stderr.lower()
-            if "egl" in stderr_lower or "display" in stderr_lower or "gpu" in stderr_lower:
+            if _GPU_ERROR_RE.search(result.stderr):
                 raise RenderError(
                     self.display_name,
                     (
@@ -221,21 +244,34 @@ class FilamentAdapter(RendererAdapter):
 
         # Detect available tools for metadata
         available_tools = self._detect_available_tools()
+        frame_times = [float(ms) for ms in _FRAME_TIME_RE.findall(result.stdout)]
+        warmup_times, timed_times = frame_times[:warmup_frames], frame_times[warmup_frames:]
+
+        metadata: dict[str, Any] = {
+            # Same as detect() once the viewer is known to exist
+            "version": _extract_version_from_tool(_VIEWER_BINARY) or "unknown",
+            "renderer_type": "rasterization",
+            "exit_code": result.exit_code,
+            "gpu_enabled": True,  # Filament is always GPU
+            "available_tools": available_tools,
+            "frame_count": frame_count,
+            "warmup_frames": warmup_frames,
+        }
+        if timed_times:
+            mean_ms = statistics.fmean(timed_times)
+            metadata["frame_times_ms"] = timed_times
+            metadata["warmup_frame_times_ms"] = warmup_times
+            metadata["average_frame_time_ms"] = round(mean_ms, 3)
+            metadata["frame_time_stddev_ms"] = round(statistics.pstdev(timed_times), 3)
 
         builder = RenderResultBuilder(
             renderer=self.name,
             scene=scene_path.stem,
-            output_path=str(output_path),
+            output_path=output_str,
             render_time_seconds=result.elapsed_seconds,
             peak_memory_mb=result.peak_memory_mb,
             settings=settings,
-            metadata={
-                "version": self.detect(),
-                "renderer_type": "rasterization",
-                "exit_code": result.exit_code,
-                "gpu_enabled": True,  # Filament is always GPU
-                "available_tools": available_tools,
-            },
+            metadata=metadata,
         )
         return builder.build()
 
@@ -243,29 +279,6 @@ class FilamentAdapter(RendererAdapter):
     # Detection helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _extract_version_from_tool(tool_name: str) -> str | None:
-        """Run a Filament tool with --help and try to parse a version.
-
-        Args:
-            tool_name: Name of the Filament CLI tool.
-
-        Returns:
-            Version string or ``None``.
-        """
-        try:
-            result = run_subprocess(
-                [tool_name, "--help"],
-                timeout=10.0,
-            )
-            output = f"{result.stdout}\n{result.stderr}"
-            match = _VERSION_RE.search(output)
-            if match:
-                return match.group(1)
-        except Exception:
-            logger.debug("Failed to extract version from '%s --help'", tool_name)
-        return None
-
     @staticmethod
     def _detect_python_bindings() -> str | None:
         """Check for Filament Python bindings.
@@ -273,18 +286,13 @@ class FilamentAdapter(RendererAdapter):
         Returns:
             Version string or ``None``.
         """
-        try:
-            import pyfilament
-
-            version = getattr(pyfilament, "__version__", None)
-            if version is not None:
-                return str(version)
-            return "unknown"
-        except ImportError:
-            return None
-        except Exception:
-            logger.debug("pyfilament import failed unexpectedly", exc_info=True)
+        pyfilament = import_optional("pyfilament")
+        if pyfilament is None:
             return None
+        version = getattr(pyfilament, "__version__", None)
+        if version is not None:
+            return str(version)
+        return "unknown"
 
     @staticmethod
     def _detect_available_tools() -> list[str]:
@@ -293,19 +301,70 @@ class FilamentAdapter(RendererAdapter):
         Returns:
             List of available tool names.
         """
-        tools: list[str] = []
-        all_tools = [_VIEWER_BINARY, *_SUPPLEMENTARY_TOOLS]
-        for tool in all_tools:
-            if shutil.which(tool) is not None:
-                tools.append(tool)
-        return tools
+        return list(find_available(_ALL_TOOLS))
+
 
+@cached_probe
+def _extract_version_from_tool(tool_name: str) -> str | None:
+    """Probe a Filament tool for its version (``--version``, then ``--help``).
 
-def _register() -> None:
-    """Register the Filament adapter with the global registry."""
-    from renderscope.core.registry import registry
+    Cached per process, so ``detect()`` and render metadata share one probe.
 
-    registry.register(FilamentAdapter)
+    Args:
+        tool_name: Name of the Filament CLI tool.
+
+    Returns:
+        Version string or ``None``.
+    """
+    return probe_version(tool_name)
 
 
-_register()
+@cached_probe
+def _supports_frames_option(viewer: str) -> bool:
+    """Return whether ``<viewer> --help`` documents a ``--frames`` option.
+
+    Cached per process.  Any probe failure counts as "not supported", so
+    the adapter falls back to the single-frame command.
+
+    Args:
+        viewer: Resolved ``gltf_viewer`` binary.
+    """
+    try:
+        with closing(
+            iter_output_lines([viewer, "--help"], timeout=_HELP_TIMEOUT, max_lines=_HELP_MAX_LINES)
+        ) as lines:
+            return any(_FRAMES_OPTION_RE.search(line) for line in lines)
+    except Exception:
+        logger.debug("Failed to run '%s --help'", viewer)
+        return False
+
+
+def _build_command(
+    scene_path: str,
+    output_path: str,
+    settings: RenderSettings,
+    frame_count: int | None = None,
+) -> list[str]:
+    """Build the headless ``gltf_viewer`` argv in a single list display.
+
+    Args:
+        scene_path: Scene file, passed last.
+        output_path: Screenshot destination.
+        settings: Render configuration (only width/height are used).
+        frame_count: Frames rendered by the one viewer process, warm-up
+            frames included; ``None`` omits ``--frames`` (viewers that do
+            not support it).
+
+    Returns:
+        The full command line.
+    """
+    width, height = settings.width, settings.height
+    return [
+        *_ARGV_PREFIX,
+        *(("--width", str(width)) if width is not None else ()),
+        *(("--height", str(height)) if height is not None else ()),
+        *(("--frames", str(frame_count)) if frame_count is not None else ()),
+        "--screenshot",
+        output_path,
+        scene_path,
+    ]
@@ -17,12 +17,17 @@ Render:     ``pyluxcore.RenderSession`` or ``luxcoreconsole --scene ...``
 
 from __future__ import annotations
 
+import functools
 import logging
-import re
-import shutil
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, unique
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from renderscope.adapters._discovery import cached_probe, find_available, import_optional
+from renderscope.adapters._paths import check_scene_exists, ensure_output_dir
+from renderscope.adapters._version import VERSION_RE, probe_version
 from renderscope.adapters.base import RendererAdapter
 from renderscope.adapters.exceptions import (
     RendererNotFoundError,
@@ -46,22 +51,20 @@ logger = logging.getLogger(__name__)
 # Binary names to search, in priority order
 _BINARY_NAMES = ("luxcoreconsole", "luxcoreui")
 
-# Version regex patterns
-_VERSION_RE = re.compile(r"v?(\d+\.\d+[\.\d]*)")
-
 # Supported scene file extensions
-_SUPPORTED_FORMATS = ["lxs", "cfg", "scn"]
+_SUPPORTED_FORMATS = ("lxs", "cfg", "scn")
 
-_EXT_TO_FORMAT: dict[str, str] = {
-    ".lxs": "lxs",
-    ".cfg": "cfg",
-    ".scn": "scn",
-}
+# Scene file extensions accepted by render()
+_SUPPORTED_EXTENSIONS = frozenset({".lxs", ".cfg", ".scn"})
 
 # GPU engine names in LuxCore
-_GPU_ENGINES = ("PATHOCL", "PATHCUDA")
+_OPENCL_ENGINE = "PATHOCL"
+_CUDA_ENGINE = "PATHCUDA"
 _CPU_ENGINE = "PATHCPU"
 
+# Slack over the time budget before a session that has not halted is stopped
+_HALT_GRACE = 1.1
+
 
 @unique
 class _IntegrationPath(Enum):
@@ -79,10 +82,14 @@ class LuxCoreAdapter(RendererAdapter):
     fallback for maximum compatibility.
     """
 
+    __slots__ = ("_cli_binary", "_detected_version", "_integration_path", "_known_dirs")
+
     def __init__(self) -> None:
         self._integration_path: _IntegrationPath | None = None
         self._detected_version: str | None = None
         self._cli_binary: str | None = None
+        # Output directories already created by ``render()``
+        self._known_dirs: set[str] = set()
 
     @property
     def name(self) -> str:
@@ -101,16 +108,23 @@ class LuxCoreAdapter(RendererAdapter):
         Returns:
             Version string (e.g., ``'2.6'``) or ``None``.
         """
-        # Path 1: Python API
+        # The CLI probe (PATH scan + version subprocess) runs in the
+        # background while pyluxcore is imported here, so a failed API
+        # probe does not also pay for the CLI probe serially.  pyluxcore
+        # is only ever imported from this thread.
+        cli_probe = _cli_probe_executor().submit(self._detect_cli)
+
+        # Path 1: Python API (preferred whenever it works)
         version = self._detect_python_api()
         if version is not None:
+            cli_probe.cancel()
             self._integration_path = _IntegrationPath.PYTHON_API
             self._detected_version = version
             logger.debug("LuxCore detected via Python API: %s", version)
             return version
 
         # Path 2: CLI binary
-        version = self._detect_cli()
+        version = cli_probe.result()
         if version is not None:
             self._integration_path = _IntegrationPath.CLI
             self._detected_version = version
@@ -120,8 +134,19 @@ class LuxCoreAdapter(RendererAdapter):
         logger.debug("LuxCoreRender not found (neither pyluxcore nor CLI)")
         return None
 
-    def supported_formats(self) -> list[str]:
-        return list(_SUPPORTED_FORMATS)
+    def _ensure_detected(self) -> str | None:
+        """Return the detected version, running ``detect()`` only if needed.
+
+        A successful detection is kept on the instance, so repeated
+        ``render()`` calls skip the probe; call ``detect()`` directly to
+        re-probe.
+        """
+        if self._detected_version is not None:
+            return self._detected_version
+        return self.detect()
+
+    def supported_formats(self) -> tuple[str, ...]:
+        return _SUPPORTED_FORMATS
 
     def render(
         self,
@@ -147,7 +172,7 @@ class LuxCoreAdapter(RendererAdapter):
             SceneFormatError: If the scene format is unsupported.
             RenderError: If the render fails.
         """
-        version = self.detect()
+        version = self._ensure_detected()
         if version is None:
             raise RendererNotFoundError(
                 self.display_name,
@@ -158,8 +183,7 @@ class LuxCoreAdapter(RendererAdapter):
 
         # Validate scene format
         ext = scene_path.suffix.lower()
-        fmt = _EXT_TO_FORMAT.get(ext)
-        if fmt is None:
+        if ext not in _SUPPORTED_EXTENSIONS:
             raise SceneFormatError(
                 self.display_name,
                 str(scene_path),
@@ -167,13 +191,8 @@ class LuxCoreAdapter(RendererAdapter):
                 self.supported_formats(),
             )
 
-        if not scene_path.exists():
-            raise RenderError(
-                self.display_name,
-                f"Scene file not found: {scene_path}",
-            )
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        check_scene_exists(self.display_name, scene_path)
+        ensure_output_dir(output_path, self._known_dirs)
 
         if self._integration_path == _IntegrationPath.PYTHON_API:
             return self._render_python_api(scene_path, output_path, settings, version)
@@ -190,13 +209,14 @@ class LuxCoreAdapter(RendererAdapter):
         Returns:
             Version string or ``None``.
         """
+        pyluxcore = import_optional("pyluxcore")
+        if pyluxcore is None:
+            return None
         try:
-            import pyluxcore
-
             version_fn = getattr(pyluxcore, "Version", None)
             if callable(version_fn):
                 raw = str(version_fn())
-                match = _VERSION_RE.search(raw)
+                match = VERSION_RE.search(raw)
                 return match.group(1) if match else raw
 
             version_attr = getattr(pyluxcore, "__version__", None)
@@ -204,10 +224,8 @@ class LuxCoreAdapter(RendererAdapter):
                 return str(version_attr)
 
             return "unknown"
-        except ImportError:
-            return None
         except Exception:
-            logger.debug("pyluxcore import failed unexpectedly", exc_info=True)
+            logger.debug("pyluxcore version lookup failed", exc_info=True)
             return None
 
     def _detect_cli(self) -> str | None:
@@ -221,36 +239,20 @@ class LuxCoreAdapter(RendererAdapter):
             return None
 
         self._cli_binary = binary
-
-        # Try to get version from help output
-        try:
-            result = run_subprocess(
-                [binary, "--help"],
-                timeout=10.0,
-            )
-            output = f"{result.stdout}\n{result.stderr}"
-            match = _VERSION_RE.search(output)
-            if match:
-                return match.group(1)
-        except Exception:
-            logger.debug("Failed to extract version from '%s --help'", binary)
-
-        # Binary found but version unknown
-        return "unknown"
+        return _cli_version(binary)
 
     @staticmethod
     def _find_binary() -> str | None:
-        """Search PATH for a LuxCore CLI binary.
+        """Search PATH for a LuxCore CLI binary (cached per process).
+
+        All candidates are looked up concurrently; the first in priority
+        order wins.
 
         Returns:
             The binary name or ``None``.
         """
-        for name in _BINARY_NAMES:
-            path = shutil.which(name)
-            if path is not None:
-                logger.debug("Found LuxCore binary: %s → %s", name, path)
-                return name
-        return None
+        available = find_available(_BINARY_NAMES)
+        return available[0] if available else None
 
     # ------------------------------------------------------------------
     # Render execution
@@ -277,40 +279,25 @@ class LuxCoreAdapter(RendererAdapter):
         Raises:
             RenderError: If the render fails.
         """
-        try:
-            import pyluxcore
-        except ImportError as exc:
+        pyluxcore = import_optional("pyluxcore")
+        if pyluxcore is None:
             raise RendererNotFoundError(
                 self.display_name,
                 install_hint="pip install pyluxcore",
-            ) from exc
+            )
 
         logger.info("Rendering via pyluxcore Python API")
 
-        # Build properties string for LuxCore config
-        props = pyluxcore.Properties()
-        props.SetFromFile(str(scene_path))
-
-        # Apply settings overrides
-        if settings.width and settings.height:
-            props.Set(pyluxcore.Property("film.width", settings.width))
-            props.Set(pyluxcore.Property("film.height", settings.height))
-
-        if settings.samples is not None:
-            props.Set(pyluxcore.Property("batch.haltspp", settings.samples))
-
-        if settings.time_budget is not None:
-            props.Set(pyluxcore.Property("batch.halttime", int(settings.time_budget)))
-
-        # Engine selection
-        engine = _CPU_ENGINE
+        output_str = os.fspath(output_path)
+        engine = _render_engine_of(settings)
         if settings.gpu:
-            # Try GPU engines in order
-            for gpu_engine in _GPU_ENGINES:
-                engine = gpu_engine
-                break
             logger.info("LuxCore GPU engine: %s", engine)
-        props.Set(pyluxcore.Property("renderengine.type", engine))
+
+        # Scene file first so the settings overrides win; all overrides are
+        # applied in one parse rather than one ``Property`` per key.
+        props = pyluxcore.Properties()
+        props.SetFromFile(os.fspath(scene_path))
+        props.SetFromString(_property_overrides(settings, engine))
 
         try:
             config = pyluxcore.RenderConfig(props)
@@ -325,21 +312,20 @@ class LuxCoreAdapter(RendererAdapter):
         try:
             with timer:
                 session.Start()
-
-                # Wait for completion
+                # ``batch.halttime`` / ``batch.haltspp`` end the render
+                # natively; the time budget is only a safety net.
                 if settings.time_budget is not None:
-                    import time
-
-                    time.sleep(settings.time_budget)
-                    session.Stop()
+                    _wait_for_done(session, settings.time_budget * _HALT_GRACE)
                 else:
                     session.WaitForDone()
 
-            # Save output
-            session.GetFilm().Save()
-            # Also try direct output path save
-            session.GetFilm().SaveOutput(
-                str(output_path),
+            film = session.GetFilm()
+            # Only the RGB image is needed; ``Film.Save()`` would also write
+            # every output configured in the scene (AOVs included).
+            if settings.extra.get("dump_all_aovs", False):
+                film.Save()
+            film.SaveOutput(
+                output_str,
                 pyluxcore.FilmOutputType.RGB_IMAGEPIPELINE,
             )
         except Exception as exc:
@@ -357,7 +343,7 @@ class LuxCoreAdapter(RendererAdapter):
         builder = RenderResultBuilder(
             renderer=self.name,
             scene=scene_path.stem,
-            output_path=str(output_path),
+            output_path=output_str,
             render_time_seconds=timer.result.elapsed_seconds,
             peak_memory_mb=timer.result.peak_memory_mb,
             settings=settings,
@@ -395,7 +381,8 @@ class LuxCoreAdapter(RendererAdapter):
         binary = self._cli_binary or "luxcoreconsole"
         logger.info("Rendering via CLI: %s", binary)
 
-        cmd = [binary, "--scene", str(scene_path), "--film-output", str(output_path)]
+        output_str = os.fspath(output_path)
+        cmd = [binary, "--scene", os.fspath(scene_path), "--film-output", output_str]
 
         if settings.width and settings.height:
             cmd.extend(["--film-width", str(settings.width)])
@@ -412,7 +399,7 @@ class LuxCoreAdapter(RendererAdapter):
         result = run_subprocess(
             cmd,
             timeout=timeout,
-            cwd=str(scene_path.parent),
+            cwd=os.fspath(scene_path.parent),
         )
 
         if result.exit_code != 0:
@@ -433,7 +420,7 @@ class LuxCoreAdapter(RendererAdapter):
         builder = RenderResultBuilder(
             renderer=self.name,
             scene=scene_path.stem,
-            output_path=str(output_path),
+            output_path=output_str,
             render_time_seconds=result.elapsed_seconds,
             peak_memory_mb=result.peak_memory_mb,
             settings=settings,
@@ -448,11 +435,117 @@ class LuxCoreAdapter(RendererAdapter):
         return builder.build()
 
 
-def _register() -> None:
-    """Register the LuxCore adapter with the global registry."""
-    from renderscope.core.registry import registry
+@functools.cache
+def _cli_probe_executor() -> ThreadPoolExecutor:
+    """Worker that runs the CLI probe concurrently with the Python API probe."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="renderscope-luxcore")
+
+
+@cached_probe
+def _cli_version(binary: str) -> str:
+    """Probe the LuxCore CLI once per process (``--version``, then ``--help``).
+
+    Args:
+        binary: The LuxCore CLI binary name.
+
+    Returns:
+        Version string, or ``'unknown'`` if it could not be determined.
+    """
+    # Binary found but version unknown
+    return probe_version(binary) or "unknown"
+
+
+def _render_engine_of(settings: RenderSettings) -> str:
+    """Return the LuxCore render engine for *settings*.
+
+    Args:
+        settings: Render configuration.
+
+    Returns:
+        The preferred GPU engine when ``settings.gpu`` is set, else the CPU
+        path tracer.
+    """
+    return _preferred_gpu_engine() if settings.gpu else _CPU_ENGINE
 
-    registry.register(LuxCoreAdapter)
 
+@cached_probe
+def _preferred_gpu_engine() -> str:
+    """Pick the GPU engine for this machine, probing pyluxcore's devices once.
 
-_register()
+    CUDA is preferred when an NVIDIA device is present — it avoids the
+    OpenCL kernel compilation stall on those GPUs — and OpenCL is used
+    otherwise, including when the device list is unavailable.
+
+    Returns:
+        ``"PATHCUDA"`` or ``"PATHOCL"``.
+    """
+    pyluxcore = import_optional("pyluxcore")
+    list_devices = getattr(pyluxcore, "GetOpenCLDeviceList", None)
+    if not callable(list_devices):
+        return _OPENCL_ENGINE
+    try:
+        # Entries are (name, type, ...) tuples, e.g. ("GeForce RTX 3080", "CUDA_GPU", ...)
+        devices = [(str(desc[0]).lower(), str(desc[1])) for desc in list_devices()]
+    except Exception:
+        logger.debug("LuxCore device probe failed", exc_info=True)
+        return _OPENCL_ENGINE
+    for name, kind in devices:
+        if kind == "CUDA_GPU" or (kind == "OPENCL_GPU" and "nvidia" in name):
+            return _CUDA_ENGINE
+    return _OPENCL_ENGINE
+
+
+def _property_overrides(settings: RenderSettings, engine: str) -> str:
+    """Build the LuxCore properties that override the scene file.
+
+    Args:
+        settings: Render configuration.
+        engine: Render engine type.
+
+    Returns:
+        Newline-separated ``key = value`` lines for ``Properties.SetFromString``.
+    """
+    lines = []
+    if settings.width and settings.height:
+        lines.append(f"film.width = {settings.width}")
+        lines.append(f"film.height = {settings.height}")
+    if settings.samples is not None:
+        lines.append(f"batch.haltspp = {settings.samples}")
+    if settings.time_budget is not None:
+        lines.append(f"batch.halttime = {int(settings.time_budget)}")
+    lines.append(f'renderengine.type = "{engine}"')
+    return "\n".join(lines) + "\n"
+
+
+def _wait_for_done(session: Any, timeout: float) -> None:
+    """Wait for a render session to halt, stopping it if it overruns.
+
+    ``RenderSession.WaitForDone`` returns as soon as the session's halt
+    condition is met, so renders that converge early finish early.  It
+    runs on a helper thread so a session that fails to halt within
+    *timeout* seconds can be stopped.
+
+    Args:
+        session: A started ``pyluxcore.RenderSession``.
+        timeout: Seconds to wait before calling ``session.Stop()``.
+
+    Raises:
+        Exception: Whatever ``WaitForDone`` raised.
+    """
+    errors: list[BaseException] = []
+
+    def wait() -> None:
+        try:
+            session.WaitForDone()
+        except BaseException as exc:
+            errors.append(exc)
+
+    waiter = threading.Thread(target=wait, name="luxcore-wait", daemon=True)
+    waiter.start()
+    waiter.join(timeout)
+    if waiter.is_alive():
+        logger.warning("LuxCore session did not halt within %.1fs; stopping it", timeout)
+        session.Stop()
+        waiter.join()
+    if errors:
+        raise errors[0]
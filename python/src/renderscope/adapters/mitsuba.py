@@ -14,17 +14,22 @@ from __future__ import annotations
 import contextlib
 import logging
 import time
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from renderscope.adapters.base import RendererAdapter
+from renderscope.adapters._discovery import cached_probe, import_optional
+from renderscope.adapters._paths import check_scene_exists
+from renderscope.adapters.base import RendererAdapter, RenderJob
 from renderscope.adapters.exceptions import (
     RendererNotFoundError,
     RenderError,
     SceneFormatError,
 )
 from renderscope.core.runner import InProcessTimer, RenderResultBuilder
+from renderscope.utils.hardware import physical_core_count
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
     from pathlib import Path
 
     from renderscope.models.benchmark import RenderResult
@@ -33,38 +38,65 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Scene format extensions Mitsuba 3 can read
-_SUPPORTED_FORMATS = ["mitsuba_xml", "xml", "gltf", "obj", "ply", "stl"]
+_SUPPORTED_FORMATS = ("mitsuba_xml", "xml", "gltf", "obj", "ply", "stl")
 
 # Extension → format name mapping
-_EXT_TO_FORMAT: dict[str, str] = {
-    ".xml": "mitsuba_xml",
-    ".gltf": "gltf",
-    ".glb": "gltf",
-    ".obj": "obj",
-    ".ply": "ply",
-    ".stl": "stl",
-}
+_EXT_TO_FORMAT = MappingProxyType(
+    {
+        ".xml": "mitsuba_xml",
+        ".gltf": "gltf",
+        ".glb": "gltf",
+        ".obj": "obj",
+        ".ply": "ply",
+        ".stl": "stl",
+    }
+)
 
 # Variant selection priority (GPU, then LLVM, then scalar)
-_GPU_VARIANTS = [
+_GPU_VARIANTS = (
     "cuda_ad_rgb",
     "cuda_rgb",
     "llvm_ad_rgb",
     "llvm_rgb",
-]
+)
 
-_CPU_VARIANTS = [
+_CPU_VARIANTS = (
     "llvm_ad_rgb",
     "llvm_rgb",
     "scalar_rgb",
-]
+)
 
 _FALLBACK_VARIANT = "scalar_rgb"
 
+# Bitmap pixel format for each channel count of a rendered image
+_BITMAP_PIXEL_FORMATS = {3: "RGB", 4: "RGBA"}
+
+# 8-bit outputs that can be sRGB-encoded outside Mitsuba's writer
+_LDR_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+
+# Dr.Jit flags that keep loops and virtual calls inside one fused
+# (megakernel) launch instead of round-tripping through device memory
+# per wavefront.  Dr.Jit 1.x names first, then the 0.4.x (Mitsuba <= 3.5)
+# names; only flags present in the installed build are touched.
+_MEGAKERNEL_FLAGS = (
+    "SymbolicLoops",
+    "SymbolicCalls",
+    "OptimizeCalls",
+    "MergeFunctions",
+    "LoopRecord",
+    "VCallRecord",
+    "VCallOptimize",
+    "VCallDeduplicate",
+)
+
 
 class MitsubaAdapter(RendererAdapter):
     """Adapter for Mitsuba 3 — research-oriented differentiable renderer."""
 
+    def __init__(self) -> None:
+        # Output bitmaps reused across renders, keyed by (height, width, channels)
+        self._bitmaps: dict[tuple[int, ...], Any] = {}
+
     @property
     def name(self) -> str:
         return "mitsuba3"
@@ -76,28 +108,16 @@ class MitsubaAdapter(RendererAdapter):
     def detect(self) -> str | None:
         """Check if Mitsuba 3 Python package is importable.
 
+        The import and version/variant lookup run once per process.
+
         Returns:
             The version string (e.g., ``'3.5.2'``) or ``None``.
         """
-        try:
-            import mitsuba
-
-            version = getattr(mitsuba, "__version__", None)
-            if version is not None:
-                return str(version)
-            # Some builds expose version differently
-            version = getattr(mitsuba, "MI_VERSION", None)
-            if version is not None:
-                return str(version)
-            return "unknown"
-        except ImportError:
-            return None
-        except Exception:
-            logger.debug("Mitsuba import failed unexpectedly", exc_info=True)
-            return None
+        info = _detect_mitsuba()
+        return info[0] if info is not None else None
 
-    def supported_formats(self) -> list[str]:
-        return list(_SUPPORTED_FORMATS)
+    def supported_formats(self) -> tuple[str, ...]:
+        return _SUPPORTED_FORMATS
 
     def render(
         self,
@@ -120,6 +140,77 @@ class MitsubaAdapter(RendererAdapter):
             SceneFormatError: If the scene format is unsupported.
             RenderError: If the render fails.
         """
+        return self._render_jobs([RenderJob(scene_path, output_path, settings)])[0]
+
+    def render_batch(self, jobs: Sequence[RenderJob]) -> list[RenderResult]:
+        """Render several jobs, loading each scene only once per variant.
+
+        Parsing a scene, building its acceleration structure and uploading
+        textures often costs more than rendering a small scene, so jobs
+        that share a scene file (different outputs, spp, ...) reuse the
+        loaded scene.  The variant is only switched when it changes.
+
+        Args:
+            jobs: Render jobs, executed in order.
+
+        Returns:
+            One ``RenderResult`` per job, in the same order.
+
+        Raises:
+            RendererNotFoundError: If Mitsuba 3 is not installed.
+            SceneFormatError: If any scene format is unsupported.
+            RenderError: If any render fails.
+        """
+        return self._render_jobs(jobs)
+
+    def render_sweep(
+        self,
+        scene_path: Path,
+        output_path: Path,
+        settings: RenderSettings,
+        spps: Iterable[int],
+    ) -> list[RenderResult]:
+        """Render one scene at several sample counts, compiling kernels once.
+
+        Dr.Jit kernels do not depend on the sample count — it only sets
+        the launch size — so one untimed warm-up render at the smallest
+        count fills the kernel cache for every timed render that follows.
+        The scene is loaded once for the whole sweep.
+
+        Args:
+            scene_path: Scene to render.
+            output_path: Output template; each render is written next to it
+                as ``<stem>_spp<N><suffix>``.
+            settings: Render configuration; ``samples`` is overridden.
+            spps: Sample counts to render.  Duplicates are dropped.
+
+        Returns:
+            One ``RenderResult`` per distinct sample count, in ascending order.
+
+        Raises:
+            RendererNotFoundError: If Mitsuba 3 is not installed.
+            SceneFormatError: If the scene format is unsupported.
+            RenderError: If any render fails.
+        """
+        counts = sorted(set(spps))
+        if not counts:
+            return []
+
+        def job(spp: int, tag: str) -> RenderJob:
+            return RenderJob(
+                scene_path,
+                output_path.with_name(f"{output_path.stem}_{tag}{output_path.suffix}"),
+                settings.model_copy(update={"samples": spp}),
+            )
+
+        warmup = job(counts[0], "warmup")
+        try:
+            return self._render_jobs([warmup, *(job(spp, f"spp{spp}") for spp in counts)])[1:]
+        finally:
+            warmup.output_path.unlink(missing_ok=True)
+
+    def _render_jobs(self, jobs: Sequence[RenderJob]) -> list[RenderResult]:
+        """Validate all *jobs*, then render them sharing loaded scenes."""
         # Check installation
         version = self.detect()
         if version is None:
@@ -128,10 +219,51 @@ class MitsubaAdapter(RendererAdapter):
                 install_hint="pip install mitsuba",
             )
 
-        # Validate scene format
+        # Each distinct scene is checked once, however many jobs use it
+        for scene_path in dict.fromkeys(job.scene_path for job in jobs):
+            self._validate_scene(scene_path)
+
+        mi = import_optional("mitsuba")
+        if mi is None:
+            raise RendererNotFoundError(
+                self.display_name,
+                install_hint="pip install mitsuba",
+            )
+        dr = import_optional("drjit")
+
+        # Loaded scenes of this batch, keyed by (scene file, variant)
+        scenes: dict[tuple[str, str], Any] = {}
+        results: list[RenderResult] = []
+        for job in jobs:
+            variant = self._activate_variant(mi, gpu=job.settings.gpu)
+            key = (str(job.scene_path), variant)
+            scene_cached = key in scenes
+            scene_load_ns = 0
+            if not scene_cached:
+                # Load scene (timed separately)
+                load_start = time.perf_counter_ns()
+                try:
+                    scenes[key] = mi.load_file(key[0])
+                except Exception as exc:
+                    raise RenderError(
+                        self.display_name,
+                        f"Failed to load scene: {exc}",
+                    ) from exc
+                scene_load_ns = time.perf_counter_ns() - load_start
+
+            load_info = {
+                "scene_load_time_ns": scene_load_ns,
+                "scene_cached": scene_cached,
+            }
+            results.append(
+                self._render_loaded(mi, dr, scenes[key], job, version, variant, load_info)
+            )
+        return results
+
+    def _validate_scene(self, scene_path: Path) -> None:
+        """Check that *scene_path* has a supported extension and exists."""
         ext = scene_path.suffix.lower()
-        fmt = _EXT_TO_FORMAT.get(ext)
-        if fmt is None:
+        if ext not in _EXT_TO_FORMAT:
             raise SceneFormatError(
                 self.display_name,
                 str(scene_path),
@@ -139,22 +271,28 @@ class MitsubaAdapter(RendererAdapter):
                 self.supported_formats(),
             )
 
-        if not scene_path.exists():
-            raise RenderError(
-                self.display_name,
-                f"Scene file not found: {scene_path}",
-            )
+        check_scene_exists(self.display_name, scene_path)
 
-        try:
-            import mitsuba as mi
-        except ImportError as exc:
-            raise RendererNotFoundError(
-                self.display_name,
-                install_hint="pip install mitsuba",
-            ) from exc
+    def _activate_variant(self, mi: Any, *, gpu: bool) -> str:
+        """Select and activate the best variant, skipping a redundant switch.
 
+        Args:
+            mi: The imported mitsuba module.
+            gpu: Whether to prefer GPU variants.
+
+        Returns:
+            The active variant name.
+
+        Raises:
+            RenderError: If neither the preferred nor the fallback variant
+                can be activated.
+        """
         # Select variant — try preferred, fall back on failure (e.g. LLVM DLL missing)
-        variant = self._select_variant(mi, gpu=settings.gpu)
+        variant = self._select_variant(self._get_available_variants(), gpu=gpu)
+        _quiet_logging(mi)
+        with contextlib.suppress(Exception):
+            if mi.variant() == variant:
+                return variant
         try:
             mi.set_variant(variant)
         except Exception:
@@ -171,21 +309,20 @@ class MitsubaAdapter(RendererAdapter):
                     self.display_name,
                     f"Failed to set variant '{variant}': {exc}",
                 ) from exc
+        return variant
 
-        # Suppress verbose logging during renders
-        with contextlib.suppress(Exception):
-            mi.set_log_level(mi.LogLevel.Warn)
-
-        # Load scene (timed separately)
-        load_start = time.perf_counter()
-        try:
-            scene = mi.load_file(str(scene_path))
-        except Exception as exc:
-            raise RenderError(
-                self.display_name,
-                f"Failed to load scene: {exc}",
-            ) from exc
-        scene_load_time = time.perf_counter() - load_start
+    def _render_loaded(
+        self,
+        mi: Any,
+        dr: Any,
+        scene: Any,
+        job: RenderJob,
+        version: str,
+        variant: str,
+        load_info: dict[str, Any],
+    ) -> RenderResult:
+        """Render an already-loaded scene and save the job's output."""
+        settings, output_path = job.settings, job.output_path
 
         # Render with timing and memory monitoring
         render_kwargs: dict[str, object] = {}
@@ -194,19 +331,26 @@ class MitsubaAdapter(RendererAdapter):
 
         timer = InProcessTimer()
         try:
-            with timer:
+            with (
+                _llvm_thread_count(dr, variant, settings) as num_threads,
+                _megakernel_flags(dr),
+                _kernel_history(dr) as jit_stats,
+                timer,
+            ):
                 image = mi.render(scene, **render_kwargs)
+                _wait_for_kernels(dr, image)
         except Exception as exc:
             raise RenderError(
                 self.display_name,
                 f"Render failed: {exc}",
             ) from exc
 
-        # Save output
+        # Save output.  The image is already evaluated, so this is only the
+        # host copy and encode; the file format follows the extension.
         output_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            bitmap = mi.Bitmap(image)
-            bitmap.write(str(output_path))
+            if not _write_srgb_fast(image, output_path):
+                self._output_bitmap(mi, image).write(str(output_path))
         except Exception as exc:
             raise RenderError(
                 self.display_name,
@@ -222,7 +366,7 @@ class MitsubaAdapter(RendererAdapter):
         # Build result
         builder = RenderResultBuilder(
             renderer=self.name,
-            scene=scene_path.stem,
+            scene=job.scene_path.stem,
             output_path=str(output_path),
             render_time_seconds=timer.result.elapsed_seconds,
             peak_memory_mb=timer.result.peak_memory_mb,
@@ -230,63 +374,299 @@ class MitsubaAdapter(RendererAdapter):
             metadata={
                 "version": version,
                 "variant": variant,
-                "scene_load_time_seconds": round(scene_load_time, 4),
+                **load_info,
                 "baseline_memory_mb": round(timer.result.baseline_memory_mb, 1),
                 "gpu_enabled": settings.gpu,
                 "spp": settings.samples,
+                "num_threads": num_threads,
+                **jit_stats,
             },
         )
         return builder.build()
 
-    @staticmethod
-    def _select_variant(mi: object, *, gpu: bool) -> str:
-        """Choose the best available Mitsuba variant.
+    def _output_bitmap(self, mi: Any, image: Any) -> Any:
+        """Copy *image* into a bitmap reused for every render of its shape.
+
+        Benchmarks render the same resolution over and over, so the
+        bitmap is allocated once per shape and refilled in place.  Shapes
+        without a plain RGB/RGBA layout (e.g. AOV stacks) get a fresh
+        bitmap each time.
 
         Args:
             mi: The imported mitsuba module.
-            gpu: Whether to prefer GPU variants.
+            image: The evaluated tensor returned by ``mi.render``.
 
         Returns:
-            The variant name to use.
+            A bitmap holding the image.
         """
+        import numpy as np
+
+        pixels = np.asarray(image)
+        pixel_format = _BITMAP_PIXEL_FORMATS.get(pixels.shape[-1]) if pixels.ndim == 3 else None
+        if pixel_format is None or pixels.dtype != np.float32:
+            return mi.Bitmap(image)
+        bitmap = self._bitmaps.get(pixels.shape)
         try:
-            available: list[str] = list(getattr(mi, "variants", lambda: [])())
+            if bitmap is None:
+                height, width = pixels.shape[:2]
+                bitmap = mi.Bitmap(
+                    getattr(mi.Bitmap.PixelFormat, pixel_format),
+                    mi.Struct.Type.Float32,
+                    [width, height],
+                )
+            np.copyto(np.asarray(bitmap), pixels)
         except Exception:
-            return _FALLBACK_VARIANT
+            logger.debug("Could not reuse a bitmap for %s", pixels.shape, exc_info=True)
+            return mi.Bitmap(image)
+        self._bitmaps[pixels.shape] = bitmap
+        return bitmap
 
+    @staticmethod
+    def _select_variant(available: Sequence[str], *, gpu: bool) -> str:
+        """Choose the best available Mitsuba variant.
+
+        Args:
+            available: Variants compiled into the installed Mitsuba.
+            gpu: Whether to prefer GPU variants.
+
+        Returns:
+            The variant name to use.
+        """
         if not available:
             return _FALLBACK_VARIANT
 
+        # Builds can list dozens of variants; test membership against a set
+        available_set = frozenset(available)
         candidates = _GPU_VARIANTS if gpu else _CPU_VARIANTS
         for variant in candidates:
-            if variant in available:
+            if variant in available_set:
                 return variant
 
         # Fall back to whatever is available
-        if _FALLBACK_VARIANT in available:
+        if _FALLBACK_VARIANT in available_set:
             return _FALLBACK_VARIANT
 
         return available[0]
 
     @staticmethod
-    def _get_available_variants() -> list[str]:
-        """Return a list of available Mitsuba variants, or empty list."""
+    def _get_available_variants() -> tuple[str, ...]:
+        """Return the available Mitsuba variants, or an empty tuple."""
+        info = _detect_mitsuba()
+        return info[1] if info is not None else ()
+
+
+@cached_probe
+def _detect_mitsuba() -> tuple[str, tuple[str, ...]] | None:
+    """Import Mitsuba once and read its version and variant list.
+
+    Returns:
+        ``(version, variants)``, or ``None`` if Mitsuba is not importable.
+    """
+    mi = import_optional("mitsuba")
+    if mi is None:
+        return None
+    try:
+        version = getattr(mi, "__version__", None)
+        if version is None:
+            # Some builds expose version differently
+            version = getattr(mi, "MI_VERSION", None)
+    except Exception:
+        logger.debug("Mitsuba version lookup failed", exc_info=True)
+        return None
+    try:
+        variants_fn = getattr(mi, "variants", None)
+        variants = tuple(variants_fn()) if callable(variants_fn) else ()
+    except Exception:
+        variants = ()
+    return ("unknown" if version is None else str(version)), variants
+
+
+@cached_probe
+def _quiet_logging(mi: Any) -> None:
+    """Raise Mitsuba's log level to warnings, once per process.
+
+    The level is global to Mitsuba, so renders after the first do not
+    pay for the call.  It is applied before any variant switch, and also
+    when the wanted variant was already active.
+
+    Args:
+        mi: The imported ``mitsuba`` module.
+    """
+    with contextlib.suppress(Exception):
+        mi.set_log_level(mi.LogLevel.Warn)
+
+
+def _write_srgb_fast(image: Any, output_path: Path) -> bool:
+    """Write an RGB image to an 8-bit file with the parallel sRGB encoder.
+
+    Only taken when Numba is installed (``renderscope[numba]``): for fast
+    low-spp renders, Mitsuba's single-threaded gamma and quantize pass is
+    a visible share of the save.  Produces the same sRGB encoding as
+    ``Bitmap.write``.
+
+    Args:
+        image: The evaluated tensor returned by ``mi.render``.
+        output_path: Destination file.
+
+    Returns:
+        ``True`` if the image was written, ``False`` to use Mitsuba's writer.
+    """
+    if output_path.suffix.lower() not in _LDR_SUFFIXES:
+        return False
+
+    from renderscope.utils.image_io import has_fast_srgb, linear_to_srgb_u8
+
+    if not has_fast_srgb():
+        return False
+
+    import numpy as np
+    from PIL import Image
+
+    pixels = np.asarray(image)
+    if pixels.ndim != 3 or pixels.shape[2] != 3 or pixels.dtype != np.float32:
+        return False
+    Image.fromarray(linear_to_srgb_u8(pixels), mode="RGB").save(str(output_path))
+    return True
+
+
+@contextlib.contextmanager
+def _llvm_thread_count(dr: Any, variant: str, settings: RenderSettings) -> Iterator[int | None]:
+    """Size Dr.Jit's LLVM thread pool for the block, then restore it.
+
+    Uses ``settings.threads`` when given, otherwise the number of physical
+    cores: Dr.Jit defaults to one thread per logical CPU, and SMT siblings
+    only contend for the same vector units.  The pool size is process-wide,
+    so the previous count is put back for anything else using Dr.Jit.
+
+    Args:
+        dr: The imported ``drjit`` module, or ``None``.
+        variant: The active variant; only ``llvm_*`` variants use the pool.
+        settings: Render configuration.
+
+    Yields:
+        The thread count set, or ``None`` if the pool was left alone.
+    """
+    set_count = getattr(dr, "set_thread_count", None)
+    get_count = getattr(dr, "thread_count", None)
+    if not variant.startswith("llvm_") or not callable(set_count) or not callable(get_count):
+        yield None
+        return
+    num_threads = settings.threads if settings.threads is not None else physical_core_count()
+    try:
+        previous = get_count()
+        set_count(num_threads)
+    except Exception:
+        logger.debug("Could not set Dr.Jit thread count", exc_info=True)
+        yield None
+        return
+    try:
+        yield num_threads
+    finally:
+        with contextlib.suppress(Exception):
+            set_count(previous)
+
+
+def _wait_for_kernels(dr: Any, image: Any) -> None:
+    """Evaluate *image* and wait for its kernels to finish.
+
+    JIT variants launch kernels asynchronously, so without this the
+    remaining GPU/LLVM work would be charged to saving the output rather
+    than to the timed render.
+
+    Args:
+        dr: The imported ``drjit`` module, or ``None`` (scalar-only builds).
+        image: The tensor returned by ``mi.render``.
+    """
+    if dr is None:
+        return
+    eval_fn = getattr(dr, "eval", None)
+    sync_fn = getattr(dr, "sync_thread", None)
+    if callable(eval_fn):
+        eval_fn(image)
+    if callable(sync_fn):
+        sync_fn()
+
+
+@contextlib.contextmanager
+def _megakernel_flags(dr: Any) -> Iterator[None]:
+    """Enable Dr.Jit's megakernel flags for the block, then restore them.
+
+    The flags are process-wide, so their previous values are put back
+    for anything else in the process that uses Dr.Jit.
+
+    Args:
+        dr: The imported ``drjit`` module, or ``None``.
+    """
+    jit_flag = getattr(dr, "JitFlag", None)
+    previous: list[tuple[Any, bool]] = []
+    try:
+        for name in _MEGAKERNEL_FLAGS:
+            flag = getattr(jit_flag, name, None)
+            if flag is not None:
+                previous.append((flag, bool(dr.flag(flag))))
+                dr.set_flag(flag, True)
+    except Exception:
+        logger.debug("Could not set Dr.Jit megakernel flags", exc_info=True)
+    try:
+        yield
+    finally:
+        for flag, value in previous:
+            with contextlib.suppress(Exception):
+                dr.set_flag(flag, value)
+
+
+@contextlib.contextmanager
+def _kernel_history(dr: Any) -> Iterator[dict[str, Any]]:
+    """Record the Dr.Jit kernels launched in the block and summarise them.
+
+    Dr.Jit keeps compiled kernels in an on-disk cache that persists
+    across processes, so only the first render of a scene/variant pays
+    for compilation.  The yielded dict is filled on exit with how many
+    kernels ran, how many were served from the in-memory and disk caches,
+    and the time spent compiling the rest.  It stays empty for builds
+    without kernel history (or without Dr.Jit).  The ``KernelHistory``
+    flag is process-wide, so its previous value is restored on exit.
+
+    Args:
+        dr: The imported ``drjit`` module, or ``None``.
+
+    Yields:
+        Metadata entries, populated when the block exits.
+    """
+    stats: dict[str, Any] = {}
+    flag = getattr(getattr(dr, "JitFlag", None), "KernelHistory", None)
+    if flag is None:
+        yield stats
+        return
+    try:
+        previous = bool(dr.flag(flag))
+        dr.kernel_history()  # discard kernels launched before the block
+        dr.set_flag(flag, True)
+    except Exception:
+        logger.debug("Could not enable Dr.Jit kernel history", exc_info=True)
+        yield stats
+        return
+    try:
+        yield stats
+    finally:
+        history: list[dict[str, Any]] = []
         try:
-            import mitsuba as mi
-
-            variants_fn = getattr(mi, "variants", None)
-            if callable(variants_fn):
-                return list(variants_fn())
+            history = [entry for entry in dr.kernel_history() if "cache_hit" in entry]
         except Exception:
-            pass
-        return []
-
-
-def _register() -> None:
-    """Register the Mitsuba adapter with the global registry."""
-    from renderscope.core.registry import registry
-
-    registry.register(MitsubaAdapter)
-
-
-_register()
+            logger.debug("Could not read Dr.Jit kernel history", exc_info=True)
+        finally:
+            with contextlib.suppress(Exception):
+                dr.set_flag(flag, previous)
+        if history:
+            compile_ms = sum(
+                entry.get("codegen_time", 0.0) + entry.get("backend_time", 0.0)
+                for entry in history
+                if not entry["cache_hit"]
+            )
+            stats["jit_kernels"] = len(history)
+            stats["jit_cache_hits"] = sum(bool(entry["cache_hit"]) for entry in history)
+            stats["jit_disk_cache_hits"] = sum(
+                bool(entry.get("cache_disk_hit")) for entry in history
+            )
+            # Dr.Jit reports these timings in milliseconds
+            stats["jit_compile_time_ms"] = round(compile_ms, 3)
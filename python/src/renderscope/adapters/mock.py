@@ -4,8 +4,8 @@ This adapter always detects as installed, supports common scene formats,
 and generates a solid-color image as output.  It is intended for use in
 the test suite and integration tests — never for real benchmarking.
 
-The adapter is automatically registered with the global registry on
-import, just like production adapters.
+Like the production adapters, it is listed in the registry's adapter
+table and imported only when first looked up.
 """
 
 from __future__ import annotations
@@ -58,8 +58,8 @@ class MockRendererAdapter(RendererAdapter):
         """Always returns version ``'1.0.0'``."""
         return "1.0.0"
 
-    def supported_formats(self) -> list[str]:
-        return ["pbrt", "obj", "gltf"]
+    def supported_formats(self) -> tuple[str, ...]:
+        return ("pbrt", "obj", "gltf")
 
     def render(
         self,
@@ -102,13 +102,3 @@ class MockRendererAdapter(RendererAdapter):
             },
         )
         return builder.build()
-
-
-def _register() -> None:
-    """Register the mock adapter with the global registry."""
-    from renderscope.core.registry import registry
-
-    registry.register(MockRendererAdapter)
-
-
-_register()
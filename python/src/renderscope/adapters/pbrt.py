@@ -12,9 +12,9 @@ from __future__ import annotations
 
 import logging
 import re
-import shutil
 from typing import TYPE_CHECKING
 
+from renderscope.adapters._discovery import cached_probe, resolve_binary
 from renderscope.adapters.base import RendererAdapter
 from renderscope.adapters.exceptions import (
     RendererNotFoundError,
@@ -34,9 +34,12 @@ logger = logging.getLogger(__name__)
 # Binary names to search, in priority order
 _BINARY_NAMES = ("pbrt", "pbrt-v4", "pbrt4")
 
-# Version string patterns
-_VERSION_RE = re.compile(r"pbrt\s+version\s+(\d+[\.\d]*)", re.IGNORECASE)
-_VERSION_FALLBACK_RE = re.compile(r"v?(\d+\.\d+[\.\d]*)")
+# Version string patterns.  Dotted groups are non-capturing and never end
+# in a dot.  The fallback only accepts a version that starts a line or
+# follows whitespace, so it cannot match inside a path such as
+# ``/opt/pbrt-3.2/lib``.
+_VERSION_RE = re.compile(r"\bpbrt\s+version\s+v?(\d+(?:\.\d+)*)", re.IGNORECASE | re.ASCII)
+_VERSION_FALLBACK_RE = re.compile(r"(?:^|\s)v?(\d+\.\d+(?:\.\d+)*)\b", re.MULTILINE | re.ASCII)
 
 
 class PBRTAdapter(RendererAdapter):
@@ -54,7 +57,8 @@ class PBRTAdapter(RendererAdapter):
         """Detect PBRT binary in PATH and extract version.
 
         Searches for ``pbrt``, ``pbrt-v4``, and ``pbrt4`` in that order.
-        Runs ``pbrt --version`` to extract the version string.
+        Runs ``pbrt --version`` to extract the version string, once per
+        binary and process.
 
         Returns:
             Version string (e.g., ``'4.0.0'``) or ``None``.
@@ -62,33 +66,10 @@ class PBRTAdapter(RendererAdapter):
         binary = self._find_binary()
         if binary is None:
             return None
+        return _probe_version(binary)
 
-        try:
-            result = run_subprocess(
-                [binary, "--version"],
-                timeout=10.0,
-            )
-        except (FileNotFoundError, Exception):
-            logger.debug("Failed to run '%s --version'", binary)
-            return None
-
-        # Parse version from combined output
-        output = f"{result.stdout}\n{result.stderr}"
-        match = _VERSION_RE.search(output)
-        if match:
-            return match.group(1)
-
-        # Fallback: look for any version-like pattern
-        match = _VERSION_FALLBACK_RE.search(output)
-        if match:
-            return match.group(1)
-
-        # Last resort: binary exists but version unknown
-        logger.debug("PBRT binary found but version could not be parsed from: %s", output[:200])
-        return "unknown"
-
-    def supported_formats(self) -> list[str]:
-        return ["pbrt"]
+    def supported_formats(self) -> tuple[str, ...]:
+        return ("pbrt",)
 
     def render(
         self,
@@ -137,6 +118,10 @@ class PBRTAdapter(RendererAdapter):
                 f"Scene file not found: {scene_path}",
             )
 
+        # Shares the memoized probe with detect(), so a render after
+        # detection spawns no extra ``--version`` process
+        version = _probe_version(binary)
+
         # Build command
         cmd = [binary, "--outfile", str(output_path)]
 
@@ -194,7 +179,7 @@ class PBRTAdapter(RendererAdapter):
             settings=settings,
             metadata={
                 "binary": binary,
-                "version": self.detect(),
+                "version": version,
                 "exit_code": result.exit_code,
                 "gpu_enabled": settings.gpu,
             },
@@ -202,24 +187,57 @@ class PBRTAdapter(RendererAdapter):
         return builder.build()
 
     def _find_binary(self) -> str | None:
-        """Search PATH for a PBRT binary.
+        """Search PATH for a PBRT binary, memoized per process.
+
+        The lookup is cached against a snapshot of ``PATH``; call
+        ``clear_binary_cache()`` after changing it.
 
         Returns:
             The binary name (suitable for subprocess) or ``None``.
         """
-        for name in _BINARY_NAMES:
-            path = shutil.which(name)
-            if path is not None:
-                logger.debug("Found PBRT binary: %s → %s", name, path)
-                return name
-        return None
+        return resolve_binary(_BINARY_NAMES)
+
+
+@cached_probe
+def _probe_version(binary: str) -> str | None:
+    """Run ``<binary> --version`` and parse the PBRT version.
 
+    Memoized per binary, so ``detect()`` and render metadata share one
+    subprocess.
 
-def _register() -> None:
-    """Register the PBRT adapter with the global registry."""
-    from renderscope.core.registry import registry
+    Args:
+        binary: PBRT binary name.
 
-    registry.register(PBRTAdapter)
+    Returns:
+        Version string, ``"unknown"`` if unparseable, or ``None`` if the
+        binary could not be run.
+    """
+    try:
+        result = run_subprocess(
+            [binary, "--version"],
+            timeout=10.0,
+            monitor_memory=False,
+        )
+    except (FileNotFoundError, Exception):
+        logger.debug("Failed to run '%s --version'", binary)
+        return None
 
+    # Search each stream separately (stdout first) rather than joining them
+    streams = (result.stdout, result.stderr)
+    for stream in streams:
+        match = _VERSION_RE.search(stream)
+        if match:
+            return match.group(1)
+
+    # Fallback: look for any version-like pattern
+    for stream in streams:
+        match = _VERSION_FALLBACK_RE.search(stream)
+        if match:
+            return match.group(1)
 
-_register()
+    # Last resort: binary exists but version unknown
+    logger.debug(
+        "PBRT binary found but version could not be parsed from: %s",
+        (result.stdout or result.stderr)[:200],
+    )
+    return "unknown"
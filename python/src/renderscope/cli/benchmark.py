@@ -303,7 +303,7 @@ def benchmark_cmd(
                 )
                 not_installed.append(rname)
                 continue
-            version = adapter.detect()
+            version = registry.detect(rname)
             if version is None:
                 err_console.print(
                     f"[warning]\u26a0  Renderer '{rname}' is not installed. Skipping.[/warning]\n"
@@ -8,35 +8,84 @@ and false-color SSIM heatmaps.
 from __future__ import annotations
 
 import csv
-import io
-import json
 import math
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from itertools import islice, repeat
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import typer
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-from renderscope.core.metrics import ImageMetrics
-from renderscope.utils.console import console, err_console
+from renderscope.core.metrics import ImageMetrics, MetricBundle
+from renderscope.utils.console import console, dump_json, err_console
 from renderscope.utils.image_io import (
     SUPPORTED_EXTENSIONS,
     is_hdr,
     load_image,
+    load_image_u8,
     save_image,
     tonemap,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numpy.typing import NDArray
+
+# Signature shared by bisect.bisect_left and bisect.bisect_right
+_Bisect = Callable[[Sequence[float], float], int]
+
 # Default metrics when none are specified.
 _DEFAULT_METRICS: list[str] = ["psnr", "ssim", "mse"]
 
-# All metrics the command understands.
-_KNOWN_METRICS: frozenset[str] = frozenset({"psnr", "ssim", "mse", "lpips"})
 
-# Valid colormap names.
-_VALID_COLORMAPS: frozenset[str] = frozenset({"viridis", "inferno", "magma"})
+class MetricName(str, Enum):
+    """Metrics the command understands."""
+
+    psnr = "psnr"
+    ssim = "ssim"
+    mse = "mse"
+    lpips = "lpips"
+
+
+class Colormap(str, Enum):
+    """Colormaps available for SSIM heatmaps."""
+
+    viridis = "viridis"
+    inferno = "inferno"
+    magma = "magma"
+
+
+# Metrics a directory comparison can compute exactly on raw 8-bit pixels,
+# skipping the float32 conversion when only these are requested
+_INTEGER_METRICS: frozenset[str] = frozenset({"mse", "psnr"})
+
+# Directory pairs decoded ahead of the one being scored (single-CPU path)
+_PREFETCH_PAIRS = 2
+
+# Quality labels per metric: ascending thresholds, one more label than
+# thresholds, and the bisect variant that places a value on them.
+# Higher-is-better metrics reach a band *at* its threshold (bisect_right);
+# LPIPS, lower-is-better, stays in a band up to and including it (bisect_left).
+_LABEL_TABLES: dict[str, tuple[tuple[float, ...], tuple[str, ...], _Bisect]] = {
+    "psnr": ((20.0, 30.0, 40.0), ("Poor", "Fair", "Good", "Excellent"), bisect_right),
+    "ssim": ((0.70, 0.85, 0.95), ("Poor", "Fair", "Good", "Excellent"), bisect_right),
+    "lpips": ((0.05, 0.15, 0.30), ("Excellent", "Good", "Fair", "Poor"), bisect_left),
+}
+
+# Bar-chart score per metric as ``slope * value + intercept``, clamped to [0, 1].
+_SCORE_LINES: dict[str, tuple[float, float]] = {
+    "psnr": (1.0 / 50.0, 0.0),
+    "ssim": (1.0, 0.0),
+    "lpips": (-2.0, 1.0),
+}
 
 
 # ---------------------------------------------------------------------------
@@ -55,35 +104,12 @@ def _quality_label(metric: str, value: float) -> str:
     if math.isinf(value):
         return "Identical"
 
-    if metric == "psnr":
-        if value >= 40:
-            return "Excellent"
-        if value >= 30:
-            return "Good"
-        if value >= 20:
-            return "Fair"
-        return "Poor"
-
-    if metric == "ssim":
-        if value >= 0.95:
-            return "Excellent"
-        if value >= 0.85:
-            return "Good"
-        if value >= 0.70:
-            return "Fair"
-        return "Poor"
-
-    if metric == "lpips":
-        if value <= 0.05:
-            return "Excellent"
-        if value <= 0.15:
-            return "Good"
-        if value <= 0.30:
-            return "Fair"
-        return "Poor"
-
-    # MSE and others: no quality bar.
-    return ""
+    table = _LABEL_TABLES.get(metric)
+    if table is None:
+        # MSE and others: no quality bar.
+        return ""
+    thresholds, labels, locate = table
+    return labels[locate(thresholds, value)]
 
 
 def _quality_score(metric: str, value: float) -> float:
@@ -91,14 +117,12 @@ def _quality_score(metric: str, value: float) -> float:
     if math.isinf(value):
         return 1.0
 
-    if metric == "psnr":
-        return min(value / 50.0, 1.0)
-    if metric == "ssim":
-        return max(value, 0.0)
-    if metric == "lpips":
-        return max(1.0 - value * 2.0, 0.0)
-    # MSE: no bar.
-    return 0.0
+    line = _SCORE_LINES.get(metric)
+    if line is None:
+        # MSE: no bar.
+        return 0.0
+    slope, intercept = line
+    return min(max(slope * value + intercept, 0.0), 1.0)
 
 
 def _format_value(metric: str, value: float) -> str:
@@ -125,30 +149,50 @@ def _compute_metrics(
     ref_path: Path,
     test_path: Path,
     metric_names: list[str],
-) -> dict[str, float]:
-    """Load two images and compute the requested metrics."""
+    *,
+    ssim_map: bool = False,
+) -> MetricBundle:
+    """Load two images and compute the requested metrics in one bundle.
+
+    The bundle also carries the loaded (tone-mapped) images and, if
+    *ssim_map* is set, the per-pixel SSIM map, so callers producing diff
+    images do not load the files again.
+    """
+    ref, tst = _load_pair(ref_path, test_path)
+    return ImageMetrics.compute_bundle(ref, tst, metric_names, ssim_map=ssim_map)
+
+
+def _load_pair(
+    ref_path: Path,
+    test_path: Path,
+    *,
+    integer: bool = False,
+) -> tuple[NDArray[Any], NDArray[Any]]:
+    """Load two images, tone-mapping HDR ones for metric computation.
+
+    With *integer* set, two 8-bit LDR images are returned as raw uint8
+    arrays instead of float32 (see :func:`_score_pair`).  That only
+    happens when both images have a pixel above 1: :func:`load_image`
+    leaves 8-bit images with a maximum of at most 1 unscaled, and the
+    integer metrics must match the float path.
+    """
+    if integer:
+        ref_u8 = load_image_u8(ref_path)
+        tst_u8 = load_image_u8(test_path) if ref_u8 is not None else None
+        if ref_u8 is not None and tst_u8 is not None and min(ref_u8.max(), tst_u8.max()) > 1:
+            return ref_u8, tst_u8
+
     ref = load_image(ref_path)
     tst = load_image(test_path)
 
-    # Tone-map HDR images before computing metrics.
+    # Tone-map HDR images before computing metrics, in place when the
+    # loader's buffer allows it: the HDR values are not needed afterwards.
     if is_hdr(ref_path):
-        ref = tonemap(ref)
+        ref = tonemap(ref, out=ref if ref.flags.writeable else None)
     if is_hdr(test_path):
-        tst = tonemap(tst)
-
-    results: dict[str, float] = {}
-
-    for name in metric_names:
-        if name == "psnr":
-            results["psnr"] = float(ImageMetrics.psnr(ref, tst))
-        elif name == "ssim":
-            results["ssim"] = float(ImageMetrics.ssim(ref, tst))
-        elif name == "mse":
-            results["mse"] = float(ImageMetrics.mse(ref, tst))
-        elif name == "lpips":
-            results["lpips"] = float(ImageMetrics.lpips(ref, tst))
+        tst = tonemap(tst, out=tst if tst.flags.writeable else None)
 
-    return results
+    return ref, tst
 
 
 # ---------------------------------------------------------------------------
@@ -160,11 +204,16 @@ def _print_table(
     ref_path: Path,
     test_path: Path,
     metrics_dict: dict[str, float],
+    size: tuple[int, int],
     *,
     extra_lines: list[str] | None = None,
 ) -> None:
     """Display a Rich panel with a metrics table and quality indicators."""
-    height, width = _image_dimensions(ref_path)
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    height, width = size
 
     table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
     table.add_column("Metric", style="cyan", min_width=8)
@@ -219,9 +268,10 @@ def _print_json(
     ref_path: Path,
     test_path: Path,
     metrics_dict: dict[str, float],
+    size: tuple[int, int],
 ) -> None:
     """Print metrics as structured JSON."""
-    height, width = _image_dimensions(ref_path)
+    height, width = size
     output = {
         "reference": str(ref_path),
         "test": str(test_path),
@@ -230,36 +280,45 @@ def _print_json(
         "metrics": {k: (None if math.isinf(v) else float(v)) for k, v in metrics_dict.items()},
     }
     # Use print() to avoid Rich markup/ANSI in structured output.
-    print(json.dumps(output, indent=2))
+    print(dump_json(output))
 
 
-def _print_csv_row(
-    ref_path: Path,
-    test_path: Path,
-    metrics_dict: dict[str, float],
-    *,
-    header: bool = True,
-) -> None:
-    """Print metrics as a CSV row."""
-    buf = io.StringIO()
-    metric_names = list(metrics_dict.keys())
-    writer = csv.writer(buf)
+class _CsvSink:
+    """Stream metric rows as CSV through one writer on stdout.
 
-    if header:
-        writer.writerow(["reference", "test", *metric_names])
+    Created once per command, so a directory comparison reuses the same
+    writer for every pair; the header is written before the first row.
+    Writing to ``sys.stdout`` directly avoids Rich markup/ANSI, as for
+    the JSON output.
+    """
 
-    values = ["" if math.isinf(v) else f"{v:.6f}" for v in metrics_dict.values()]
-    writer.writerow([str(ref_path), str(test_path), *values])
-    # Use print() to avoid Rich markup/ANSI in structured output.
-    print(buf.getvalue().rstrip())
+    def __init__(self) -> None:
+        self._writer = csv.writer(sys.stdout, lineterminator="\n")
+        self._header_written = False
+
+    def write_row(
+        self,
+        ref_path: Path,
+        test_path: Path,
+        metrics_dict: dict[str, float],
+    ) -> None:
+        """Write one pair's metrics, preceded by the header on first use."""
+        if not self._header_written:
+            self._writer.writerow(["reference", "test", *metrics_dict])
+            self._header_written = True
 
+        values = ["" if math.isinf(v) else f"{v:.6f}" for v in metrics_dict.values()]
+        self._writer.writerow([str(ref_path), str(test_path), *values])
 
-def _image_dimensions(path: Path) -> tuple[int, int]:
-    """Return ``(height, width)`` without loading the full array."""
-    from PIL import Image as PILImage
 
-    with PILImage.open(str(path)) as im:
-        return im.height, im.width
+def _image_size(bundle: MetricBundle) -> tuple[int, int]:
+    """Return ``(height, width)`` of the compared pair.
+
+    Read from the arrays already loaded for the metrics, so printing a
+    pair never reopens the image file.
+    """
+    height, width = bundle.reference.shape[:2]
+    return int(height), int(width)
 
 
 # ---------------------------------------------------------------------------
@@ -274,12 +333,8 @@ def _compare_directory(
     output_format: str,
 ) -> None:
     """Compare matching image pairs across two directories."""
-    stems_a = {
-        p.stem: p for p in sorted(dir_a.iterdir()) if p.suffix.lower() in SUPPORTED_EXTENSIONS
-    }
-    stems_b = {
-        p.stem: p for p in sorted(dir_b.iterdir()) if p.suffix.lower() in SUPPORTED_EXTENSIONS
-    }
+    stems_a = _index_images(dir_a)
+    stems_b = _index_images(dir_b)
 
     matched = sorted(stems_a.keys() & stems_b.keys())
     unmatched_a = sorted(stems_a.keys() - stems_b.keys())
@@ -295,27 +350,28 @@ def _compare_directory(
 
     # Accumulate metrics for averaging.
     all_results: list[dict[str, float]] = []
-    first_row = True
+    csv_sink = _CsvSink() if output_format == "csv" else None
 
-    for stem in matched:
-        ref_path = stems_a[stem]
-        test_path = stems_b[stem]
+    ref_paths = [stems_a[stem] for stem in matched]
+    test_paths = [stems_b[stem] for stem in matched]
+    outcomes = _iter_pair_outcomes(ref_paths, test_paths, metric_names)
 
-        try:
-            result = _compute_metrics(ref_path, test_path, metric_names)
-        except (ValueError, FileNotFoundError) as exc:
-            err_console.print(f"[warning]Skipping {stem}: {exc}[/warning]")
+    for stem, ref_path, test_path, outcome in zip(
+        matched, ref_paths, test_paths, outcomes, strict=True
+    ):
+        if isinstance(outcome, Exception):
+            err_console.print(f"[warning]Skipping {stem}: {outcome}[/warning]")
             continue
 
+        result, size = outcome
         all_results.append(result)
 
         if output_format == "json":
-            _print_json(ref_path, test_path, result)
-        elif output_format == "csv":
-            _print_csv_row(ref_path, test_path, result, header=first_row)
-            first_row = False
+            _print_json(ref_path, test_path, result, size)
+        elif csv_sink is not None:
+            csv_sink.write_row(ref_path, test_path, result)
         else:
-            _print_table(ref_path, test_path, result)
+            _print_table(ref_path, test_path, result, size)
 
     # Summary for table format.
     if output_format == "table" and all_results:
@@ -330,12 +386,135 @@ def _compare_directory(
             console.print(f"  [warning]Unmatched in {dir_b}:[/warning] {', '.join(unmatched_b)}")
 
 
+def _index_images(directory: Path) -> dict[str, Path]:
+    """Map stem to path for the supported images directly in *directory*.
+
+    One ``os.scandir`` pass, filtering on the entry name before any
+    ``Path`` is built.  Entries are visited in name order, so when two
+    files share a stem the later name wins, as with ``sorted(iterdir())``.
+    """
+    with os.scandir(directory) as it:
+        names = sorted(entry.name for entry in it)
+    index: dict[str, Path] = {}
+    for name in names:
+        dot = name.rfind(".")
+        if dot > 0 and name[dot:].lower() in SUPPORTED_EXTENSIONS:
+            index[name[:dot]] = directory / name
+    return index
+
+
+def _compare_one(
+    ref_path: Path,
+    test_path: Path,
+    metric_names: list[str],
+) -> tuple[dict[str, float], tuple[int, int]] | ValueError | FileNotFoundError:
+    """Compute the metrics for one directory pair (runs in a worker process).
+
+    Only the metric values and image size are returned, so the decoded
+    arrays are not pickled back to the parent.  Errors that skip a pair
+    are returned rather than raised; anything else propagates.
+    """
+    integer = _INTEGER_METRICS.issuperset(metric_names)
+    try:
+        return _score_pair(*_load_pair(ref_path, test_path, integer=integer), metric_names)
+    except (ValueError, FileNotFoundError) as exc:
+        return exc
+
+
+def _compare_prefetched(
+    pair: Future[tuple[NDArray[Any], NDArray[Any]]],
+    metric_names: list[str],
+) -> tuple[dict[str, float], tuple[int, int]] | ValueError | FileNotFoundError:
+    """Like :func:`_compare_one`, for a pair already being loaded by *pair*."""
+    try:
+        return _score_pair(*pair.result(), metric_names)
+    except (ValueError, FileNotFoundError) as exc:
+        return exc
+
+
+def _score_pair(
+    ref: NDArray[Any],
+    tst: NDArray[Any],
+    metric_names: list[str],
+) -> tuple[dict[str, float], tuple[int, int]]:
+    """Compute the metrics of a loaded directory pair.
+
+    Raw uint8 pairs from :func:`_load_pair` only carry metrics in
+    ``_INTEGER_METRICS``, computed exactly on the 8-bit values.
+
+    Returns:
+        The metric values and the ``(height, width)`` of the pair.
+    """
+    height, width = ref.shape[:2]
+    if ref.dtype == np.uint8:
+        mse = ImageMetrics.mse_u8(ref, tst)
+        exact = {"mse": mse, "psnr": ImageMetrics.psnr_from_mse(mse)}
+        values = {name: exact[name] for name in metric_names}
+    else:
+        values = ImageMetrics.compute_bundle(ref, tst, metric_names).values
+    return values, (int(height), int(width))
+
+
+def _iter_prefetched_outcomes(
+    ref_paths: list[Path],
+    test_paths: list[Path],
+    metric_names: list[str],
+) -> Iterator[tuple[dict[str, float], tuple[int, int]] | ValueError | FileNotFoundError]:
+    """Yield outcomes in-process, decoding upcoming pairs on a loader thread.
+
+    Image decoding (Pillow, OpenEXR) releases the GIL, so reading the
+    next ``_PREFETCH_PAIRS`` pairs overlaps with the metrics of the
+    current one.
+    """
+    integer = _INTEGER_METRICS.issuperset(metric_names)
+    pairs = zip(ref_paths, test_paths, strict=True)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="renderscope-compare") as loader:
+        pending = deque(
+            loader.submit(_load_pair, *pair, integer=integer)
+            for pair in islice(pairs, _PREFETCH_PAIRS)
+        )
+        while pending:
+            current = pending.popleft()
+            upcoming = next(pairs, None)
+            if upcoming is not None:
+                pending.append(loader.submit(_load_pair, *upcoming, integer=integer))
+            yield _compare_prefetched(current, metric_names)
+
+
+def _iter_pair_outcomes(
+    ref_paths: list[Path],
+    test_paths: list[Path],
+    metric_names: list[str],
+) -> Iterator[tuple[dict[str, float], tuple[int, int]] | ValueError | FileNotFoundError]:
+    """Yield :func:`_compare_one` outcomes in input order.
+
+    Pairs are spread over a process pool (one worker per CPU, at most one
+    per pair), where decoding and metrics of different pairs overlap.  A
+    single pair is computed directly.  On a single CPU, or when LPIPS is
+    requested, the pairs are computed in-process with the next ones
+    prefetched: LPIPS builds a torch model per call and torch already
+    spreads its work over every core, so one such model per worker
+    process would only multiply memory use and oversubscribe the CPU.
+    """
+    if len(ref_paths) <= 1:
+        yield from map(_compare_one, ref_paths, test_paths, repeat(metric_names))
+        return
+    workers = min(len(ref_paths), os.cpu_count() or 1)
+    if workers <= 1 or "lpips" in metric_names:
+        yield from _iter_prefetched_outcomes(ref_paths, test_paths, metric_names)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_compare_one, ref_paths, test_paths, repeat(metric_names))
+
+
 def _print_directory_summary(
     all_results: list[dict[str, float]],
     metric_names: list[str],
     total_pairs: int,
 ) -> None:
     """Print a summary table with averaged metrics across all pairs."""
+    from rich.table import Table
+
     table = Table(
         title=f"Summary ({len(all_results)}/{total_pairs} pairs)",
         show_header=True,
@@ -346,16 +525,27 @@ def _print_directory_summary(
     table.add_column("Min", min_width=14)
     table.add_column("Max", min_width=14)
 
-    for name in metric_names:
-        values = [r[name] for r in all_results if name in r and not math.isinf(r[name])]
-        if not values:
+    # One (pairs, metrics) matrix; missing and infinite values are excluded
+    # from every reduction.
+    mat = np.array(
+        [[r.get(name, math.nan) for name in metric_names] for r in all_results],
+        dtype=np.float64,
+    ).reshape(len(all_results), len(metric_names))
+    valid = np.isfinite(mat)
+    counts = valid.sum(axis=0)
+    means = np.where(valid, mat, 0.0).sum(axis=0) / np.maximum(counts, 1)
+    mins = np.where(valid, mat, np.inf).min(axis=0, initial=np.inf)
+    maxs = np.where(valid, mat, -np.inf).max(axis=0, initial=-np.inf)
+
+    for i, name in enumerate(metric_names):
+        if not counts[i]:
             table.add_row(name.upper(), "N/A", "N/A", "N/A")
             continue
         table.add_row(
             name.upper(),
-            _format_value(name, sum(values) / len(values)),
-            _format_value(name, min(values)),
-            _format_value(name, max(values)),
+            _format_value(name, float(means[i])),
+            _format_value(name, float(mins[i])),
+            _format_value(name, float(maxs[i])),
         )
 
     console.print()
@@ -374,11 +564,12 @@ def compare_cmd(
     image_b: Path = typer.Argument(
         help="Path to the second (test) image or directory.",
     ),
-    metrics: list[str] | None = typer.Option(
+    metrics: list[MetricName] | None = typer.Option(
         None,
         "--metrics",
         "-m",
-        help="Metrics to compute (psnr, ssim, mse, lpips). Defaults to psnr, ssim, mse.",
+        case_sensitive=False,
+        help="Metrics to compute. Defaults to psnr, ssim, mse.",
     ),
     diff_image: Path | None = typer.Option(
         None,
@@ -395,10 +586,11 @@ def compare_cmd(
         "--amplify",
         help="Amplification factor for the difference image.",
     ),
-    colormap: str = typer.Option(
-        "inferno",
+    colormap: Colormap = typer.Option(
+        Colormap.inferno,
         "--colormap",
-        help="Colormap for heatmaps (viridis, inferno, magma).",
+        case_sensitive=False,
+        help="Colormap for heatmaps.",
     ),
     recursive: bool = typer.Option(
         False,
@@ -418,25 +610,8 @@ def compare_cmd(
     ``renderscope[ml]`` extra).  Can also generate visual difference
     maps and SSIM heatmaps.
     """
-    # Resolve metric list.
-    metric_names = list(metrics) if metrics else list(_DEFAULT_METRICS)
-
-    # Validate metric names.
-    unknown = set(metric_names) - _KNOWN_METRICS
-    if unknown:
-        err_console.print(
-            f"[error]Unknown metric(s): {', '.join(sorted(unknown))}[/error]\n"
-            f"Valid metrics: {', '.join(sorted(_KNOWN_METRICS))}"
-        )
-        raise typer.Exit(code=1)
-
-    # Validate colormap.
-    if colormap not in _VALID_COLORMAPS:
-        err_console.print(
-            f"[error]Unknown colormap: '{colormap}'[/error]\n"
-            f"Valid colormaps: {', '.join(sorted(_VALID_COLORMAPS))}"
-        )
-        raise typer.Exit(code=1)
+    # Resolve metric list (names and colormap are validated by Typer).
+    metric_names = [m.value for m in metrics] if metrics else list(_DEFAULT_METRICS)
 
     # Directory mode.
     if recursive or (image_a.is_dir() and image_b.is_dir()):
@@ -458,43 +633,35 @@ def compare_cmd(
 
     # Compute metrics.
     try:
-        metrics_dict = _compute_metrics(image_a, image_b, metric_names)
+        bundle = _compute_metrics(image_a, image_b, metric_names, ssim_map=ssim_heatmap is not None)
     except (ValueError, ImportError) as exc:
         err_console.print(f"[error]{exc}[/error]")
         raise typer.Exit(code=1) from None
 
-    # Generate optional output images.
+    metrics_dict = bundle.values
+
+    # Generate optional output images from the already-loaded images.
     extra_lines: list[str] = []
 
-    if diff_image is not None or ssim_heatmap is not None:
-        ref = load_image(image_a)
-        tst = load_image(image_b)
-
-        if is_hdr(image_a):
-            ref = tonemap(ref)
-        if is_hdr(image_b):
-            tst = tonemap(tst)
-
-        if diff_image is not None:
-            diff = ImageMetrics.absolute_diff(ref, tst)
-            diff_amplified = np.clip(diff * amplify, 0.0, 1.0).astype(np.float32)
-            save_image(diff_amplified, diff_image)
-            extra_lines.append(f"Diff image saved: {diff_image}")
-
-        if ssim_heatmap is not None:
-            smap = ImageMetrics.ssim_map(ref, tst)
-            # Show error (1 - SSIM) so brighter = more different.
-            error = 1.0 - smap
-            heatmap = ImageMetrics.false_color_map(error, colormap=colormap, normalize=True)
-            save_image(heatmap, ssim_heatmap)
-            extra_lines.append(f"SSIM heatmap saved: {ssim_heatmap}")
+    if diff_image is not None:
+        diff = np.abs(bundle.reference - bundle.test)
+        diff_amplified = np.clip(diff * amplify, 0.0, 1.0).astype(np.float32)
+        save_image(diff_amplified, diff_image)
+        extra_lines.append(f"Diff image saved: {diff_image}")
+
+    if ssim_heatmap is not None and bundle.ssim_map is not None:
+        # Show error (1 - SSIM) so brighter = more different.
+        error = 1.0 - bundle.ssim_map
+        heatmap = ImageMetrics.false_color_map(error, colormap=colormap.value, normalize=True)
+        save_image(heatmap, ssim_heatmap)
+        extra_lines.append(f"SSIM heatmap saved: {ssim_heatmap}")
 
     # Print results.
     if output_format == "json":
-        _print_json(image_a, image_b, metrics_dict)
+        _print_json(image_a, image_b, metrics_dict, _image_size(bundle))
     elif output_format == "csv":
-        _print_csv_row(image_a, image_b, metrics_dict)
+        _CsvSink().write_row(image_a, image_b, metrics_dict)
     else:
-        _print_table(image_a, image_b, metrics_dict, extra_lines=extra_lines)
+        _print_table(image_a, image_b, metrics_dict, _image_size(bundle), extra_lines=extra_lines)
 
     raise typer.Exit(code=0)
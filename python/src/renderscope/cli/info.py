@@ -7,7 +7,11 @@ adapter registry.
 
 from __future__ import annotations
 
+import heapq
 import shutil
+from array import array
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import typer
 from rich.columns import Columns
@@ -15,7 +19,11 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-from renderscope.core.data_loader import get_renderer_ids, load_all_renderers, load_renderer
+from renderscope.core.data_loader import (
+    get_renderer_ids,
+    load_all_renderers,
+    load_renderer,
+)
 from renderscope.core.registry import registry
 from renderscope.utils.console import (
     console,
@@ -24,10 +32,71 @@ from renderscope.utils.console import (
     get_technique_style,
 )
 
+if TYPE_CHECKING:
+    from renderscope.models.renderer import RendererMetadata
+
+
+# Largest edit distance at which an ID is still suggested for a typo
+_MAX_TYPO_DISTANCE = 2
+
+# Common alternative names accepted by ``renderscope info`` (read-only)
+_ALIASES = MappingProxyType(
+    {
+        "cycles": "blender-cycles",
+        "blender": "blender-cycles",
+        "eevee": "blender-eevee",
+        "mitsuba": "mitsuba3",
+        "gaussian-splatting": "3d-gaussian-splatting",
+        "3dgs": "3d-gaussian-splatting",
+        "pytorch3d": "pytorch3d",
+        "luxcore": "luxcorerender",
+        "embree": "embree",
+    }
+)
+
+# Lookup indexes built from the loaded renderers: (renderer list they were
+# built from, id -> (position in name order, lowercased name),
+# lowercased id or display name -> id)
+_search_index: tuple[list[RendererMetadata], dict[str, tuple[int, str]], dict[str, str]] | None = (
+    None
+)
+
+
+def _build_search_index() -> tuple[dict[str, tuple[int, str]], dict[str, str]]:
+    """Return the lookup indexes, rebuilding them if the data was reloaded."""
+    global _search_index
+    renderers = load_all_renderers()
+    if _search_index is None or _search_index[0] is not renderers:
+        names = {r.id: (i, r.name.lower()) for i, r in enumerate(renderers)}
+        lower: dict[str, str] = {}
+        # Display names first so that IDs win a collision; the first
+        # renderer in name order wins among equal names
+        for r in renderers:
+            lower.setdefault(r.name.lower(), r.id)
+        lower.update({rid.lower(): rid for rid in reversed(get_renderer_ids())})
+        _search_index = (renderers, names, lower)
+    return _search_index[1], _search_index[2]
+
+
+def _names_by_id() -> dict[str, tuple[int, str]]:
+    """Map renderer IDs to (position in name order, lowercased display name)."""
+    return _build_search_index()[0]
+
+
+def _lower_index() -> dict[str, str]:
+    """Map lowercased renderer IDs and display names to renderer IDs."""
+    return _build_search_index()[1]
+
 
 def _fuzzy_match(query: str, candidates: list[str], max_results: int = 5) -> list[str]:
     """Simple fuzzy matching: prefer prefix match, then substring match.
 
+    Each candidate is ranked in a single pass: ID prefix matches first,
+    then ID substring matches (both in candidate order), then display-name
+    substring matches (in display-name order).  If that leaves fewer than
+    *max_results* suggestions, IDs within ``_MAX_TYPO_DISTANCE`` edits of
+    the query (e.g. ``mitsba`` → ``mitsuba3``) fill the rest, nearest first.
+
     Args:
         query: The user's search string (case-insensitive).
         candidates: Available renderer IDs.
@@ -37,24 +106,68 @@ def _fuzzy_match(query: str, candidates: list[str], max_results: int = 5) -> lis
         A list of matching candidates, sorted by relevance.
     """
     q = query.lower()
-    prefix_matches: list[str] = []
-    substring_matches: list[str] = []
+    names = _names_by_id()
+    ranked: list[tuple[int, int, str]] = []
+    unmatched: list[tuple[int, str]] = []
 
-    for candidate in candidates:
+    for position, candidate in enumerate(candidates):
         c = candidate.lower()
         if c.startswith(q):
-            prefix_matches.append(candidate)
+            ranked.append((0, position, candidate))
         elif q in c:
-            substring_matches.append(candidate)
-
-    # Also check display names
-    renderers = load_all_renderers()
-    for r in renderers:
-        name_lower = r.name.lower()
-        if q in name_lower and r.id not in prefix_matches and r.id not in substring_matches:
-            substring_matches.append(r.id)
+            ranked.append((1, position, candidate))
+        else:
+            name = names.get(candidate)
+            if name is not None and q in name[1]:
+                ranked.append((2, name[0], candidate))
+            else:
+                unmatched.append((position, c))
+
+    matches = [candidate for _, _, candidate in heapq.nsmallest(max_results, ranked)]
+    if len(matches) < max_results:
+        near: list[tuple[int, int, str]] = []
+        for position, c in unmatched:
+            distance = _levenshtein_le(q, c, _MAX_TYPO_DISTANCE)
+            if distance is not None:
+                near.append((distance, position, candidates[position]))
+        matches += [c for _, _, c in heapq.nsmallest(max_results - len(matches), near)]
+    return matches
+
+
+def _levenshtein_le(a: str, b: str, k: int) -> int | None:
+    """Return the edit distance between *a* and *b* if it is at most *k*.
+
+    Computes the optimal-string-alignment distance (insertions, deletions,
+    substitutions and adjacent transpositions) over the diagonal band
+    ``|i - j| <= k`` only, and gives up as soon as a whole row exceeds *k*,
+    so the cost is O(k·len) rather than O(len²).
 
-    return (prefix_matches + substring_matches)[:max_results]
+    Returns:
+        The distance, or ``None`` if it is greater than *k*.
+    """
+    n, m = len(a), len(b)
+    if abs(n - m) > k:
+        return None
+    over = k + 1  # stands in for every distance above k
+    before = array("i", [over]) * (m + 1)  # row i - 2, for transpositions
+    prev = array("i", [min(j, over) for j in range(m + 1)])
+    for i in range(1, n + 1):
+        row = array("i", [over]) * (m + 1)
+        if i <= k:
+            row[0] = i
+        row_min = row[0]
+        ai = a[i - 1]
+        for j in range(max(1, i - k), min(m, i + k) + 1):
+            bj = b[j - 1]
+            d = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + (ai != bj))
+            if i > 1 and j > 1 and ai == b[j - 2] and a[i - 2] == bj:
+                d = min(d, before[j - 2] + 1)
+            row[j] = d = min(d, over)
+            row_min = min(row_min, d)
+        if row_min > k:
+            return None
+        before, prev = prev, row
+    return prev[m] if prev[m] <= k else None
 
 
 def _resolve_renderer_id(query: str) -> str | None:
@@ -65,36 +178,22 @@ def _resolve_renderer_id(query: str) -> str | None:
     Returns:
         The renderer ID or ``None``.
     """
-    all_ids = get_renderer_ids()
-
-    # Exact ID match
+    # Exact ID match: IDs are lowercase slugs, so a direct lookup parses
+    # only the one matching data file
     q = query.lower().strip()
-    for rid in all_ids:
-        if rid.lower() == q:
-            return rid
+    if load_renderer(q) is not None:
+        return q
 
-    # Match by display name
-    renderers = load_all_renderers()
-    for r in renderers:
-        if r.name.lower() == q:
-            return r.id
+    # Case-insensitive ID or display name (needs every renderer loaded)
+    index = _lower_index()
+    rid = index.get(q)
+    if rid is not None:
+        return rid
 
     # Common aliases
-    aliases: dict[str, str] = {
-        "cycles": "blender-cycles",
-        "blender": "blender-cycles",
-        "eevee": "blender-eevee",
-        "mitsuba": "mitsuba3",
-        "gaussian-splatting": "3d-gaussian-splatting",
-        "3dgs": "3d-gaussian-splatting",
-        "pytorch3d": "pytorch3d",
-        "luxcore": "luxcorerender",
-        "embree": "embree",
-    }
-    if q in aliases:
-        alias_target = aliases[q]
-        if alias_target in all_ids:
-            return alias_target
+    alias_target = _ALIASES.get(q)
+    if alias_target is not None and index.get(alias_target) == alias_target:
+        return alias_target
 
     return None
 
@@ -138,9 +237,8 @@ def info_cmd(
         console.print(f"[error]Failed to load data for '{renderer_id}'.[/error]")
         raise typer.Exit(code=1)
 
-    # Detect installation status
-    detection = registry.detect_all()
-    detected_version = detection.get(renderer_id)
+    # Detect installation status (probes only this renderer)
+    detected_version = registry.detect(renderer_id)
     adapter = registry.get(renderer_id)
 
     # Find binary path if applicable
@@ -7,7 +7,7 @@ installation status via the adapter registry.
 
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
 from rich.table import Table
@@ -16,6 +16,7 @@ from renderscope.core.data_loader import load_all_renderers
 from renderscope.core.registry import registry
 from renderscope.utils.console import (
     console,
+    dump_json,
     format_technique,
     get_status_style,
     get_technique_style,
@@ -66,10 +67,14 @@ def list_cmd(
     technique, language, license, status, and GitHub star count.
     Supports filtering by technique, language, and project status.
     """
-    renderers = load_all_renderers()
-
-    # Detect installed renderers, filtering out mock/test-only adapters.
-    full_detection = registry.detect_all()
+    # Parse the catalog on a worker thread while detection waits on the
+    # renderer probes.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="renderscope-list") as loader:
+        pending_renderers = loader.submit(load_all_renderers)
+
+        # Detect installed renderers, filtering out mock/test-only adapters.
+        full_detection = registry.detect_all()
+    renderers = pending_renderers.result()
     detection: dict[str, str | None] = {}
     for adapter_name, version in full_detection.items():
         adapter = registry.get(adapter_name)
@@ -100,7 +105,12 @@ def list_cmd(
             summary["installed"] = version is not None
             summary["installed_version"] = version
             data.append(summary)
-        console.print_json(json.dumps(data, indent=2))
+        if console.is_terminal:
+            # Highlighted output; ``data=`` avoids a dump/parse round trip
+            console.print_json(data=data)
+        else:
+            # Same text as print_json, without the highlighting
+            print(dump_json(data, ensure_ascii=False))
         raise typer.Exit()
 
     # Rich table output
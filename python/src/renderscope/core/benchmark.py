@@ -261,8 +261,8 @@ class BenchmarkRunner:
         output_path = self._output_image_path(scene_id, adapter.name, settings)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Detect renderer version.
-        version = adapter.detect() or "unknown"
+        # Detect renderer version (cached by the registry across scenes).
+        version = self._registry.detect(adapter.name) or "unknown"
 
         # Warm-up run (discard result).
         if warmup:
@@ -450,9 +450,8 @@ class BenchmarkRunner:
                 reference_samples=ref_info.samples if ref_info else None,
             )
 
-        psnr_val = ImageMetrics.psnr(ref_img, test_img)
-        ssim_val = ImageMetrics.ssim(ref_img, test_img)
-        mse_val = ImageMetrics.mse(ref_img, test_img)
+        values = ImageMetrics.compute_bundle(ref_img, test_img, {"psnr", "ssim", "mse"}).values
+        psnr_val, ssim_val, mse_val = values["psnr"], values["ssim"], values["mse"]
 
         # Attempt LPIPS (optional dependency).
         lpips_val: float | None = None
@@ -557,7 +556,7 @@ class BenchmarkRunner:
             if adapter is None:
                 logger.warning("Renderer '%s' is not registered. Skipping.", name)
                 continue
-            version = adapter.detect()
+            version = self._registry.detect(name)
             if version is None:
                 logger.warning("Renderer '%s' is not installed. Skipping.", name)
                 continue
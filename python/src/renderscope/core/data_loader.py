@@ -2,7 +2,10 @@
 
 In development (editable install), data is read from the monorepo's
 ``/data/renderers/`` directory.  In production (installed from a wheel),
-data is bundled inside the package via ``importlib.resources``.
+data is bundled inside the package via ``importlib.resources``.  Wheels
+also carry ``_bundle.json`` (written by ``hatch_build.py``): every
+renderer file in one JSON object keyed by ID, so loading the whole
+catalog reads a single file.
 """
 
 from __future__ import annotations
@@ -10,14 +13,49 @@ from __future__ import annotations
 import importlib.resources
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from renderscope.models.renderer import RendererMetadata
 
+# Renderer files are parsed straight from bytes with orjson when it is
+# installed (``renderscope[orjson]``).  ``orjson.JSONDecodeError`` is a
+# subclass of ``json.JSONDecodeError``, so error handling is shared.
+try:
+    import orjson
+except ImportError:
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+else:
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 
-# Module-level cache: populated on first access
+# Module-level caches: populated on first access.  Files are parsed one
+# at a time as renderers are requested; ``None`` marks a malformed file.
 _renderer_cache: list[RendererMetadata] | None = None
+_renderer_by_id: dict[str, RendererMetadata | None] = {}
+_renderer_paths: dict[str, Path] | None = None
+_renderer_ids: list[str] | None = None
+
+# Pre-built catalog bundle inside the renderer data directory (wheels only);
+# the leading underscore keeps it out of the per-file scan
+_BUNDLE_NAME = "_bundle.json"
+
+# Serializes full loads so concurrent callers (e.g. a background warm-up
+# and the main thread) parse the catalog only once
+_load_lock = threading.Lock()
 
 
 def _find_data_dir() -> Path | None:
@@ -71,33 +109,122 @@ def get_data_dir() -> Path:
     return data_dir
 
 
+def _scan_renderer_files() -> dict[str, Path]:
+    """Map renderer IDs to their JSON files, without opening any of them.
+
+    Template files (names starting with ``_``) are skipped.  The mapping is
+    sorted by ID and cached for the duration of the process.
+    """
+    global _renderer_paths
+    if _renderer_paths is None:
+        _renderer_paths = {
+            json_file.stem: json_file
+            for json_file in sorted(get_data_dir().glob("*.json"))
+            if not json_file.name.startswith("_")
+        }
+    return _renderer_paths
+
+
+def _parse_renderer_file(json_file: Path) -> RendererMetadata | None:
+    """Read and validate one renderer JSON file.
+
+    Malformed files are logged as warnings and yield ``None`` — the CLI
+    should not crash because of a single broken data file.
+    """
+    try:
+        raw = _loads(json_file.read_bytes())
+    except json.JSONDecodeError as exc:
+        logger.warning("Skipping %s: invalid JSON — %s", json_file.name, exc)
+        return None
+    except Exception as exc:
+        logger.warning("Skipping %s: validation error — %s", json_file.name, exc)
+        return None
+    return _validate_renderer(json_file.name, raw)
+
+
+def _validate_renderer(source: str, raw: Any) -> RendererMetadata | None:
+    """Validate one parsed renderer object, logging and returning ``None`` on failure."""
+    try:
+        return RendererMetadata.model_validate(raw)
+    except Exception as exc:
+        logger.warning("Skipping %s: validation error — %s", source, exc)
+        return None
+
+
+def _read_bundle(data_dir: Path) -> dict[str, Any]:
+    """Return the raw renderer objects from the catalog bundle, keyed by ID.
+
+    Returns an empty dict when *data_dir* has no bundle (development
+    checkouts) or the bundle cannot be read; the caller then falls back to
+    the individual files.
+    """
+    bundle = data_dir / _BUNDLE_NAME
+    try:
+        raw = _loads(bundle.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        logger.warning("Ignoring %s: %s", bundle, exc)
+        return {}
+    if not isinstance(raw, dict):
+        logger.warning("Ignoring %s: expected a JSON object", bundle)
+        return {}
+    return raw
+
+
+def iter_renderer_ids() -> Iterator[str]:
+    """Yield the available renderer IDs in sorted order.
+
+    IDs come from the data file names, so no file is parsed.  A file that
+    later fails validation still appears here; ``load_renderer`` returns
+    ``None`` for it.
+    """
+    return iter(_scan_renderer_files())
+
+
 def load_all_renderers() -> list[RendererMetadata]:
     """Load all renderer JSON files and return validated models.
 
-    Results are cached for the duration of the process.  Malformed files
-    are logged as warnings and skipped — the CLI should not crash because
-    of a single broken data file.
+    Results are cached for the duration of the process and share the
+    per-file cache used by ``load_renderer``.  Renderers not loaded yet
+    come from the catalog bundle when there is one; any others are read
+    and validated on a thread pool, so a cold load waits on the slowest
+    file rather than the sum of all of them.  Malformed entries are
+    skipped.  Safe to call from several threads at once.
     """
-    global _renderer_cache
     if _renderer_cache is not None:
         return _renderer_cache
+    with _load_lock:
+        if _renderer_cache is not None:
+            return _renderer_cache
+        return _load_all_renderers()
 
-    data_dir = get_data_dir()
-    renderers: list[RendererMetadata] = []
-
-    for json_file in sorted(data_dir.glob("*.json")):
-        if json_file.name.startswith("_"):
-            continue  # Skip template files like _template.json
 
-        try:
-            raw = json.loads(json_file.read_text(encoding="utf-8"))
-            renderer = RendererMetadata.model_validate(raw)
-            renderers.append(renderer)
-        except json.JSONDecodeError as exc:
-            logger.warning("Skipping %s: invalid JSON — %s", json_file.name, exc)
-        except Exception as exc:
-            logger.warning("Skipping %s: validation error — %s", json_file.name, exc)
+def _load_all_renderers() -> list[RendererMetadata]:
+    """Build and cache the sorted renderer list; called under ``_load_lock``."""
+    global _renderer_cache
+    paths = _scan_renderer_files()
+    pending = [renderer_id for renderer_id in paths if renderer_id not in _renderer_by_id]
+    if len(pending) > 1:
+        # Every file shares one directory; the bundle sits beside them
+        bundled = _read_bundle(next(iter(paths.values())).parent)
+        for renderer_id in pending:
+            if renderer_id in bundled:
+                _renderer_by_id[renderer_id] = _validate_renderer(
+                    f"{renderer_id}.json ({_BUNDLE_NAME})", bundled[renderer_id]
+                )
+        pending = [renderer_id for renderer_id in pending if renderer_id not in bundled]
+    if len(pending) > 1:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="renderscope-data") as pool:
+            parsed = pool.map(_parse_renderer_file, [paths[rid] for rid in pending])
+            _renderer_by_id.update(zip(pending, parsed, strict=True))
 
+    renderers = [
+        renderer
+        for renderer_id in iter_renderer_ids()
+        if (renderer := load_renderer(renderer_id)) is not None
+    ]
     renderers.sort(key=lambda r: r.name.lower())
     _renderer_cache = renderers
     return renderers
@@ -106,17 +233,30 @@ def load_all_renderers() -> list[RendererMetadata]:
 def load_renderer(renderer_id: str) -> RendererMetadata | None:
     """Load a single renderer by its ID (filename without ``.json``).
 
-    Returns ``None`` if the renderer is not found.
+    Only that renderer's file is parsed; the result is memoized.
+
+    Returns ``None`` if the renderer is not found or its file is malformed.
     """
-    for renderer in load_all_renderers():
-        if renderer.id == renderer_id:
-            return renderer
-    return None
+    if renderer_id in _renderer_by_id:
+        return _renderer_by_id[renderer_id]
+    json_file = _scan_renderer_files().get(renderer_id)
+    if json_file is None:
+        return None
+    renderer = _parse_renderer_file(json_file)
+    _renderer_by_id[renderer_id] = renderer
+    return renderer
 
 
 def get_renderer_ids() -> list[str]:
-    """Return a sorted list of all available renderer IDs."""
-    return sorted(r.id for r in load_all_renderers())
+    """Return a sorted list of all available renderer IDs.
+
+    See ``iter_renderer_ids``.  The list is cached; callers must not
+    modify it.
+    """
+    global _renderer_ids
+    if _renderer_ids is None:
+        _renderer_ids = list(iter_renderer_ids())
+    return _renderer_ids
 
 
 def clear_cache() -> None:
@@ -124,5 +264,8 @@ def clear_cache() -> None:
 
     Useful in tests to ensure data is reloaded from disk.
     """
-    global _renderer_cache
+    global _renderer_cache, _renderer_paths, _renderer_ids
     _renderer_cache = None
+    _renderer_by_id.clear()
+    _renderer_paths = None
+    _renderer_ids = None
@@ -18,23 +18,45 @@ Usage::
 
     psnr = ImageMetrics.psnr(reference, test)
     ssim = ImageMetrics.ssim(reference, test)
+
+    # Several metrics at once, sharing validation and intermediates
+    bundle = ImageMetrics.compute_bundle(reference, test, {"psnr", "ssim", "mse"})
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
-from skimage.metrics import (
-    peak_signal_noise_ratio,
-    structural_similarity,
-)
 
 from renderscope.utils.colormaps import apply_colormap
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from numpy.typing import NDArray
 
+# Metric names understood by ImageMetrics.compute_bundle
+METRIC_NAMES = ("psnr", "ssim", "mse", "lpips")
+
+
+@dataclass(frozen=True)
+class MetricBundle:
+    """Result of :meth:`ImageMetrics.compute_bundle`.
+
+    Attributes:
+        values: Metric name to value, in the order requested.
+        reference: The validated float32 ``(H, W, 3)`` reference image.
+        test: The validated float32 ``(H, W, 3)`` test image.
+        ssim_map: Per-pixel ``(H, W)`` SSIM map, if it was requested.
+    """
+
+    values: dict[str, float]
+    reference: NDArray[np.float32]
+    test: NDArray[np.float32]
+    ssim_map: NDArray[np.float32] | None = None
+
 
 class ImageMetrics:
     """Static methods for computing image quality metrics.
@@ -42,6 +64,10 @@ class ImageMetrics:
     Every public method normalizes its inputs via :meth:`_validate_inputs`
     before computation, so callers do not need to worry about dtype or
     channel-count mismatches.
+
+    ``skimage.metrics`` (which pulls in SciPy) is imported on first use:
+    this module is imported with the ``renderscope`` package, and CLI
+    commands that compute no metrics should not pay for it at start-up.
     """
 
     # ------------------------------------------------------------------
@@ -66,6 +92,8 @@ class ImageMetrics:
         Returns:
             PSNR value in dB (higher is better).
         """
+        from skimage.metrics import peak_signal_noise_ratio
+
         ref, tst = ImageMetrics._validate_inputs(reference, test)
         result: float = peak_signal_noise_ratio(  # type: ignore[no-untyped-call]
             ref,
@@ -90,6 +118,8 @@ class ImageMetrics:
         Returns:
             Scalar SSIM (-1 to 1, higher is better).
         """
+        from skimage.metrics import structural_similarity
+
         ref, tst = ImageMetrics._validate_inputs(reference, test)
         result: float = structural_similarity(  # type: ignore[no-untyped-call]
             ref,
@@ -115,6 +145,8 @@ class ImageMetrics:
         Returns:
             A 2-D array ``(H, W)`` of per-pixel SSIM values.
         """
+        from skimage.metrics import structural_similarity
+
         ref, tst = ImageMetrics._validate_inputs(reference, test)
         _, smap = structural_similarity(  # type: ignore[no-untyped-call]
             ref,
@@ -147,6 +179,49 @@ class ImageMetrics:
         ref, tst = ImageMetrics._validate_inputs(reference, test)
         return float(np.mean((ref - tst) ** 2))
 
+    @staticmethod
+    def mse_u8(
+        reference: NDArray[np.uint8],
+        test: NDArray[np.uint8],
+    ) -> float:
+        """Compute Mean Squared Error of two 8-bit images on the ``[0, 1]`` scale.
+
+        Uses exact integer arithmetic on the raw pixels, so no float32
+        copies of the images are made.
+
+        Args:
+            reference: Ground-truth image ``(H, W, 3)``, uint8.
+            test: Image to evaluate ``(H, W, 3)``, uint8.
+
+        Returns:
+            Scalar MSE, as :meth:`mse` would give for the images divided
+            by 255.
+
+        Raises:
+            ValueError: If the shapes differ.
+        """
+        if reference.shape != test.shape:
+            msg = f"Image dimension mismatch: reference {reference.shape} vs test {test.shape}"
+            raise ValueError(msg)
+        diff = np.subtract(reference, test, dtype=np.int16)
+        total = int(np.square(diff, dtype=np.int32).sum(dtype=np.int64))
+        return total / (diff.size * 255.0**2)
+
+    @staticmethod
+    def psnr_from_mse(mse: float, data_range: float = 1.0) -> float:
+        """Convert a Mean Squared Error to PSNR in decibels.
+
+        Args:
+            mse: Mean Squared Error of the images.
+            data_range: The dynamic range of the images.
+
+        Returns:
+            PSNR value in dB, ``float('inf')`` when *mse* is zero.
+        """
+        if mse <= 0.0:
+            return float("inf")
+        return float(10.0 * np.log10(data_range**2 / mse))
+
     @staticmethod
     def absolute_diff(
         reference: NDArray[np.float32],
@@ -252,6 +327,77 @@ class ImageMetrics:
 
         return float(result.item())
 
+    @staticmethod
+    def compute_bundle(
+        reference: NDArray[np.float32],
+        test: NDArray[np.float32],
+        wanted: Collection[str],
+        data_range: float = 1.0,
+        *,
+        ssim_map: bool = False,
+    ) -> MetricBundle:
+        """Compute several metrics with one pass over shared intermediates.
+
+        The inputs are validated once, the squared error is computed once
+        (MSE is its mean and PSNR is derived from that), and a single SSIM
+        evaluation provides both the scalar SSIM and the per-pixel map.
+
+        Args:
+            reference: Ground-truth image ``(H, W, 3)``, float32.
+            test: Image to evaluate ``(H, W, 3)``, float32.
+            wanted: Metric names to compute, from :data:`METRIC_NAMES`;
+                the result keeps their order.
+            data_range: The dynamic range of the images.
+            ssim_map: Also return the per-pixel SSIM map.
+
+        Returns:
+            The requested values, the validated images and the SSIM map.
+
+        Raises:
+            ValueError: If *wanted* contains an unknown metric name.
+            ImportError: If LPIPS is requested without ``renderscope[ml]``.
+        """
+        unknown = set(wanted).difference(METRIC_NAMES)
+        if unknown:
+            msg = f"Unknown metric(s): {', '.join(sorted(unknown))}"
+            raise ValueError(msg)
+
+        ref, tst = ImageMetrics._validate_inputs(reference, test)
+        values: dict[str, float] = {}
+
+        if "psnr" in wanted or "mse" in wanted:
+            diff = ref - tst
+            # Accumulate in float64, as skimage does for PSNR
+            mse = float(np.mean(np.square(diff, out=diff), dtype=np.float64))
+            if "psnr" in wanted:
+                values["psnr"] = ImageMetrics.psnr_from_mse(mse, data_range)
+
+        smap_arr: NDArray[np.float32] | None = None
+        if "ssim" in wanted or ssim_map:
+            from skimage.metrics import structural_similarity
+
+            mssim, smap = structural_similarity(  # type: ignore[no-untyped-call]
+                ref,
+                tst,
+                data_range=data_range,
+                channel_axis=-1,
+                full=True,
+            )
+            if "ssim" in wanted:
+                values["ssim"] = float(mssim)
+            if ssim_map:
+                smap_arr = np.asarray(smap, dtype=np.float32)
+                if smap_arr.ndim == 3:
+                    smap_arr = np.mean(smap_arr, axis=-1).astype(np.float32)
+
+        if "mse" in wanted:
+            values["mse"] = mse
+        if "lpips" in wanted:
+            values["lpips"] = ImageMetrics.lpips(ref, tst)
+
+        ordered = {name: values[name] for name in wanted}
+        return MetricBundle(values=ordered, reference=ref, test=tst, ssim_map=smap_arr)
+
     # ------------------------------------------------------------------
     # Input validation
     # ------------------------------------------------------------------
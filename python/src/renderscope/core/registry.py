@@ -1,7 +1,9 @@
 """Adapter registry for discovering and managing renderer adapters.
 
 The registry is the central lookup for all renderer adapters.  It supports
-eager registration (adapters register at import time) and lazy detection
+lazy loading (an adapter module is only imported when that renderer is
+looked up, or when all adapters are listed; third-party adapters are found
+through the ``renderscope.adapters`` entry-point group) and lazy detection
 (``detect()`` is only called when status is queried).  Detection results
 are cached for the lifetime of the process.
 """
@@ -23,29 +25,56 @@ class AdapterRegistry:
     Manages adapter classes and their detection state.  The typical usage
     pattern is:
 
-    1. Adapter modules self-register via ``registry.register(MyAdapter)``
-       at import time (triggered by ``_register_all()`` in the adapters
-       package).
-    2. CLI commands call ``registry.detect_all()`` to probe for installed
-       renderers — results are cached.
-    3. Individual lookups via ``registry.get(name)`` return adapter
-       instances on demand.
+    1. Individual lookups via ``registry.get(name)`` import only the
+       requested built-in adapter module and return an instance.
+    2. Listing calls (``list_all()``, ``get_names()``, ``detect_all()``)
+       import every built-in adapter on first use.
+    3. CLI commands call ``registry.detect_all()`` to probe for installed
+       renderers, or ``registry.detect(name)`` when only one renderer
+       matters — results are cached.
+
+    Additional adapters can be added at any time via ``register()``.
     """
 
     def __init__(self) -> None:
         self._adapters: dict[str, type[RendererAdapter]] = {}
         self._detection_cache: dict[str, str | None] | None = None
+        # Results of single-adapter ``detect()`` calls, reused by ``detect_all()``
+        self._single_detections: dict[str, str | None] = {}
         self._initialized = False
 
     def _ensure_initialized(self) -> None:
-        """Lazy-import all adapter modules on first access."""
+        """Lazy-import all built-in and entry-point adapters on first access."""
         if self._initialized:
             return
         self._initialized = True
-        # Import adapter modules so they self-register
-        from renderscope.adapters import _register_all
+        from renderscope.adapters import _adapter_names, _load_adapter_class
+
+        discovered: dict[str, type[RendererAdapter]] = {}
+        for name in _adapter_names():
+            adapter_cls = self._adapters.get(name) or _load_adapter_class(name)
+            if adapter_cls is not None:
+                discovered[name] = adapter_cls
+        # Built-ins first (in declaration order), then entry-point plugins,
+        # then anything registered explicitly; explicit registrations win
+        # on name clashes.
+        self._adapters = {**discovered, **self._adapters}
+
+    def _load(self, name: str) -> type[RendererAdapter] | None:
+        """Return the class for *name*, importing only its adapter module.
+
+        Built-in names never touch distribution metadata; other names are
+        resolved through the ``renderscope.adapters`` entry-point group.
+        """
+        adapter_cls = self._adapters.get(name)
+        if adapter_cls is not None or self._initialized:
+            return adapter_cls
+        from renderscope.adapters import _load_adapter_class
 
-        _register_all()
+        adapter_cls = _load_adapter_class(name)
+        if adapter_cls is not None:
+            self.register(adapter_cls)
+        return adapter_cls
 
     def register(self, adapter_cls: type[RendererAdapter]) -> None:
         """Register a renderer adapter class.
@@ -60,6 +89,7 @@ class AdapterRegistry:
         self._adapters[name] = adapter_cls
         # Invalidate detection cache when a new adapter is registered
         self._detection_cache = None
+        self._single_detections.clear()
 
     def get(self, name: str) -> RendererAdapter | None:
         """Get an adapter instance by canonical renderer name.
@@ -70,8 +100,7 @@ class AdapterRegistry:
         Returns:
             An adapter instance, or ``None`` if not registered.
         """
-        self._ensure_initialized()
-        adapter_cls = self._adapters.get(name)
+        adapter_cls = self._load(name)
         if adapter_cls is None:
             return None
         return adapter_cls()
@@ -110,29 +139,71 @@ class AdapterRegistry:
 
         results: dict[str, str | None] = {}
         for name, adapter_cls in self._adapters.items():
-            try:
-                adapter = adapter_cls()
-                version = adapter.detect()
-                results[name] = version
-                if version is not None:
-                    logger.debug("Detected %s version %s", name, version)
-                else:
-                    logger.debug("%s not found", name)
-            except Exception:
-                logger.debug("Detection failed for %s", name, exc_info=True)
-                results[name] = None
+            if name in self._single_detections:
+                results[name] = self._single_detections[name]
+            else:
+                results[name] = _run_detection(name, adapter_cls)
 
         self._detection_cache = results
         return results
 
+    def detect(self, name: str) -> str | None:
+        """Run detection for a single adapter and cache the result.
+
+        Only that adapter's module is imported and only its renderer is
+        probed, unless ``detect_all()`` has already run.
+
+        Args:
+            name: The renderer identifier (e.g., ``'pbrt'``).
+
+        Returns:
+            The detected version string, or ``None`` if the renderer is
+            not installed or no adapter is registered under *name*.
+        """
+        if self._detection_cache is not None and name in self._detection_cache:
+            return self._detection_cache[name]
+        if name in self._single_detections:
+            return self._single_detections[name]
+        adapter_cls = self._load(name)
+        if adapter_cls is None:
+            return None
+        version = _run_detection(name, adapter_cls)
+        self._single_detections[name] = version
+        return version
+
     def get_names(self) -> list[str]:
         """Return sorted list of all registered adapter names."""
         self._ensure_initialized()
         return sorted(self._adapters.keys())
 
     def clear_cache(self) -> None:
-        """Clear the detection cache, forcing re-detection on next query."""
+        """Clear the detection cache, forcing re-detection on next query.
+
+        Cached binary lookups shared by the adapters are cleared as well,
+        so renderers installed (or removed) since the last query are seen.
+        """
+        from renderscope.adapters._discovery import clear_binary_cache
+
         self._detection_cache = None
+        self._single_detections.clear()
+        clear_binary_cache()
+
+
+def _run_detection(name: str, adapter_cls: type[RendererAdapter]) -> str | None:
+    """Instantiate *adapter_cls* and call ``detect()``, logging the outcome.
+
+    Detection errors are logged and reported as ``None``.
+    """
+    try:
+        version = adapter_cls().detect()
+    except Exception:
+        logger.debug("Detection failed for %s", name, exc_info=True)
+        return None
+    if version is not None:
+        logger.debug("Detected %s version %s", name, version)
+    else:
+        logger.debug("%s not found", name)
+    return version
 
 
 # Module-level singleton used throughout the application
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import logging
 import os
+import select
 import subprocess
 import threading
 import time
@@ -24,6 +25,7 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
 import psutil
@@ -133,6 +135,8 @@ def run_subprocess(
     env: dict[str, str] | None = None,
     cwd: str | Path | None = None,
     poll_interval: float = 0.2,
+    close_fds: bool = False,
+    monitor_memory: bool = True,
 ) -> SubprocessResult:
     """Execute a command with timing and memory monitoring.
 
@@ -148,6 +152,15 @@ def run_subprocess(
             the current environment is inherited.
         cwd: Working directory for the child process.
         poll_interval: Memory polling interval in seconds.
+        close_fds: Close every inherited file descriptor in the child.
+            Off by default: descriptors opened by Python are already
+            non-inheritable (PEP 446), and skipping the close loop lets
+            CPython spawn via ``posix_spawn``/``vfork`` where possible.
+            Pass ``True`` when C extensions may hold inheritable fds.
+        monitor_memory: Poll the child's memory from a background thread.
+            Disable for short probes such as ``--version``, where starting
+            the thread and attaching psutil cost more than the child itself;
+            ``peak_memory_mb`` is then ``0.0``.
 
     Returns:
         A ``SubprocessResult`` with exit code, output, timing, and memory.
@@ -170,19 +183,21 @@ def run_subprocess(
             stderr=subprocess.PIPE,
             env=merged_env,
             cwd=str(cwd) if cwd is not None else None,
+            close_fds=close_fds,
         )
     except FileNotFoundError:
         raise FileNotFoundError(f"Command not found: {cmd[0]}") from None
 
-    monitor = _MemoryMonitor(process.pid, poll_interval=poll_interval)
-    monitor.start()
+    monitor: _MemoryMonitor | None = None
+    if monitor_memory:
+        monitor = _MemoryMonitor(process.pid, poll_interval=poll_interval)
+        monitor.start()
 
     try:
         stdout_bytes, stderr_bytes = process.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
         process.kill()
         process.communicate()
-        monitor.stop()
         elapsed = time.perf_counter() - start_time
         raise RenderError(
             renderer_name=cmd[0],
@@ -190,7 +205,8 @@ def run_subprocess(
             exit_code=-1,
         ) from None
     finally:
-        monitor.stop()
+        if monitor is not None:
+            monitor.stop()
 
     elapsed = time.perf_counter() - start_time
 
@@ -199,10 +215,95 @@ def run_subprocess(
         stdout=stdout_bytes.decode("utf-8", errors="replace"),
         stderr=stderr_bytes.decode("utf-8", errors="replace"),
         elapsed_seconds=elapsed,
-        peak_memory_mb=monitor.peak_mb,
+        peak_memory_mb=monitor.peak_mb if monitor is not None else 0.0,
     )
 
 
+def iter_output_lines(
+    cmd: list[str],
+    *,
+    timeout: float,
+    max_lines: int,
+) -> Generator[str, None, None]:
+    """Stream a short-lived command's output line by line.
+
+    Intended for probes (``--version``, ``--help``) where only the first
+    matching line matters: stdout and stderr are merged, at most
+    *max_lines* lines are yielded, and the process is terminated as soon
+    as the consumer stops iterating (wrap the generator in
+    ``contextlib.closing``) or *timeout* seconds elapse.  No timing or
+    memory monitoring is performed.
+
+    On platforms where pipes cannot be polled (Windows), output is
+    captured in full and then yielded.
+
+    Args:
+        cmd: Command and arguments to execute.
+        timeout: Overall limit in seconds; iteration simply ends when hit.
+        max_lines: Maximum number of lines to yield.
+
+    Yields:
+        Decoded output lines without trailing newlines.
+
+    Raises:
+        FileNotFoundError: If the command binary is not found.
+    """
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            close_fds=False,
+        )
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Command not found: {cmd[0]}") from None
+
+    assert process.stdout is not None
+    try:
+        if os.name != "posix":
+            try:
+                output, _ = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return
+            lines = output.decode("utf-8", errors="replace").splitlines()
+            yield from lines[:max_lines]
+            return
+
+        deadline = time.monotonic() + timeout
+        fd = process.stdout.fileno()
+        pending = b""
+        yielded = 0
+        while yielded < max_lines:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return
+            chunk = os.read(fd, 8192)
+            if not chunk:
+                if pending:
+                    yield pending.decode("utf-8", errors="replace")
+                return
+            *complete, pending = (pending + chunk).split(b"\n")
+            for raw in complete[: max_lines - yielded]:
+                yield raw.rstrip(b"\r").decode("utf-8", errors="replace")
+                yielded += 1
+    finally:
+        _reap(process)
+
+
+def _reap(process: subprocess.Popen[bytes]) -> None:
+    """Stop a probe process if still running and release its pipe."""
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    if process.stdout is not None:
+        process.stdout.close()
+
+
 # ---------------------------------------------------------------------------
 # In-process timer
 # ---------------------------------------------------------------------------
@@ -214,11 +315,14 @@ class InProcessTimerResult:
 
     Attributes:
         elapsed_seconds: Wall-clock time for the timed block.
+        elapsed_ns: The same time as integer nanoseconds, without the
+            rounding of a float.
         peak_memory_mb: Peak RSS during execution (includes interpreter).
         baseline_memory_mb: RSS before the timed block started.
     """
 
     elapsed_seconds: float = 0.0
+    elapsed_ns: int = 0
     peak_memory_mb: float = 0.0
     baseline_memory_mb: float = 0.0
 
@@ -244,7 +348,7 @@ class InProcessTimer:
         self._poll_interval = poll_interval
         self._result = InProcessTimerResult()
         self._monitor: _MemoryMonitor | None = None
-        self._start_time: float = 0.0
+        self._start_ns: int = 0
 
     @property
     def result(self) -> InProcessTimerResult:
@@ -257,7 +361,7 @@ class InProcessTimer:
 
         self._monitor = _MemoryMonitor(os.getpid(), poll_interval=self._poll_interval)
         self._monitor.start()
-        self._start_time = time.perf_counter()
+        self._start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(
@@ -266,7 +370,9 @@ class InProcessTimer:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> None:
-        self._result.elapsed_seconds = time.perf_counter() - self._start_time
+        elapsed_ns = time.perf_counter_ns() - self._start_ns
+        self._result.elapsed_ns = elapsed_ns
+        self._result.elapsed_seconds = elapsed_ns / 1e9
         if self._monitor is not None:
             self._monitor.stop()
             self._result.peak_memory_mb = self._monitor.peak_mb
@@ -277,12 +383,13 @@ class InProcessTimer:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderResultBuilder:
     """Accumulates data for constructing a ``RenderResult``.
 
     Adapters populate the builder during render execution, then call
     ``build()`` to get a validated model with auto-detected hardware.
+    The ``metadata`` dict is handed to the model as-is, not copied.
     """
 
     renderer: str = ""
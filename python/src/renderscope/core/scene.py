@@ -15,10 +15,13 @@ import importlib.resources
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
 # Default directory where scenes are stored on disk.
@@ -225,7 +228,7 @@ class SceneManager:
     def get_compatible_format(
         self,
         scene_id: str,
-        supported_formats: list[str],
+        supported_formats: Sequence[str],
     ) -> str | None:
         """Find the best compatible format between a scene and a renderer.
 
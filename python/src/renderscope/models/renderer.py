@@ -116,6 +116,10 @@ class RendererMetadata(BaseModel):
     logo: str | None = None
     thumbnail: str | None = None
 
+    # Derived values are computed on each access rather than cached: the
+    # model is not frozen, so a cached value would go stale after field
+    # assignment or ``model_copy(update=...)``.
+
     @property
     def primary_technique(self) -> str:
         """Return the first (primary) rendering technique."""
@@ -130,7 +134,8 @@ class RendererMetadata(BaseModel):
 
     def matches_technique(self, technique: str) -> bool:
         """Check whether this renderer uses the given technique."""
-        return technique.lower() in [t.lower() for t in self.technique]
+        wanted = technique.lower()
+        return any(t.lower() == wanted for t in self.technique)
 
     def matches_language(self, language: str) -> bool:
         """Check whether this renderer's language contains the query (case-insensitive)."""
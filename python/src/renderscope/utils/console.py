@@ -6,6 +6,8 @@ uniform colors, formatting, and error output across the entire tool.
 
 from __future__ import annotations
 
+import json
+
 from rich.console import Console
 from rich.theme import Theme
 
@@ -68,16 +70,32 @@ def get_status_style(status: str) -> str:
     return STATUS_COLORS.get(status, "white")
 
 
+# Human-readable labels for known technique slugs
+_TECHNIQUE_LABELS: dict[str, str] = {
+    "path_tracing": "Path Tracing",
+    "ray_tracing": "Ray Tracing",
+    "rasterization": "Rasterization",
+    "neural": "Neural",
+    "gaussian_splatting": "Gaussian Splatting",
+    "differentiable": "Differentiable",
+    "volume_rendering": "Volume Rendering",
+    "hybrid": "Hybrid",
+}
+
+
 def format_technique(technique: str) -> str:
     """Return a human-readable label for a technique slug."""
-    labels: dict[str, str] = {
-        "path_tracing": "Path Tracing",
-        "ray_tracing": "Ray Tracing",
-        "rasterization": "Rasterization",
-        "neural": "Neural",
-        "gaussian_splatting": "Gaussian Splatting",
-        "differentiable": "Differentiable",
-        "volume_rendering": "Volume Rendering",
-        "hybrid": "Hybrid",
-    }
-    return labels.get(technique, technique.replace("_", " ").title())
+    label = _TECHNIQUE_LABELS.get(technique)
+    if label is None:
+        label = technique.replace("_", " ").title()
+    return label
+
+
+def dump_json(obj: object, *, ensure_ascii: bool = True) -> str:
+    """Serialize *obj* as two-space-indented JSON for plain ``print()`` output.
+
+    Structured output bypasses Rich so it carries no markup or ANSI codes.
+    With ``ensure_ascii=False`` the text is the same as Rich's
+    ``print_json`` without highlighting.
+    """
+    return json.dumps(obj, indent=2, ensure_ascii=ensure_ascii)
@@ -7,6 +7,8 @@ every benchmark result for reproducibility.
 
 from __future__ import annotations
 
+import functools
+import os
 import platform
 import subprocess
 
@@ -240,3 +242,20 @@ def detect_hardware() -> HardwareInfo:
         renderscope_version=renderscope.__version__,
         optional_deps=_detect_optional_deps(),
     )
+
+
+@functools.cache
+def physical_core_count() -> int:
+    """Return the number of physical CPU cores, ignoring SMT siblings.
+
+    Renderers that size their thread pool to the logical CPU count run two
+    threads per core on SMT machines, which contend for the same caches and
+    vector units.  Adapters use this count as the default thread count.
+
+    Falls back to half the logical CPU count when psutil cannot tell.
+    Cached, since the value cannot change while the process runs.
+    """
+    physical = psutil.cpu_count(logical=False)
+    if physical:
+        return int(physical)
+    return max(1, (os.cpu_count() or 2) // 2)
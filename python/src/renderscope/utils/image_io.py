@@ -8,6 +8,7 @@ metrics like PSNR and SSIM.
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,6 +17,8 @@ import numpy as np
 from PIL import Image
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
@@ -29,6 +32,9 @@ _LDR_EXTENSIONS: frozenset[str] = frozenset({".png", ".jpg", ".jpeg", ".tiff", "
 # All supported extensions for directory scanning.
 SUPPORTED_EXTENSIONS: frozenset[str] = _LDR_EXTENSIONS | _HDR_EXTENSIONS
 
+# Pillow modes with 8-bit samples, convertible to RGB without loss.
+_U8_MODES: frozenset[str] = frozenset({"1", "L", "LA", "P", "RGB", "RGBA"})
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -77,6 +83,45 @@ def load_image(path: str | Path) -> NDArray[np.float32]:
     raise ValueError(msg)
 
 
+def load_image_u8(path: str | Path) -> NDArray[np.uint8] | None:
+    """Load an 8-bit LDR image as an unscaled uint8 ``(H, W, 3)`` array.
+
+    A quarter of the size of :func:`load_image`'s float32 output, for
+    metrics that can be computed exactly on integer pixels (MSE, PSNR).
+    Alpha channels are dropped; grayscale and palette images are expanded
+    to RGB.
+
+    Args:
+        path: Path to the image file.
+
+    Returns:
+        The pixel array, or ``None`` if the image is HDR or not stored with
+        8 bits per channel (use :func:`load_image` then).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file cannot be opened as an image.
+    """
+    file_path = Path(path)
+    if file_path.suffix.lower() not in _LDR_EXTENSIONS:
+        return None
+
+    try:
+        pil_image = Image.open(str(file_path))
+    except FileNotFoundError:
+        msg = f"Image file not found: {file_path}"
+        raise FileNotFoundError(msg) from None
+    except Exception as exc:
+        msg = f"Failed to open image: {file_path}"
+        raise ValueError(msg) from exc
+
+    with pil_image:
+        if pil_image.mode not in _U8_MODES:
+            return None
+        rgb = pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB")
+        return np.asarray(rgb, dtype=np.uint8)
+
+
 def save_image(image: NDArray[np.float32], path: str | Path) -> None:
     """Save a float32 ``(H, W, 3)`` array to disk.
 
@@ -117,45 +162,123 @@ def tonemap(
     hdr_image: NDArray[np.float32],
     method: str = "reinhard",
     exposure: float = 1.0,
+    *,
+    out: NDArray[np.float32] | None = None,
 ) -> NDArray[np.float32]:
     """Tone-map an HDR image to ``[0.0, 1.0]`` for display or metric computation.
 
+    Each operator is evaluated with in-place ufuncs on the output buffer,
+    so no full-size temporaries are created (except for Reinhard when
+    tone-mapping in place, which needs one).
+
     Args:
         hdr_image: Float32 array with values potentially exceeding 1.0.
         method: Tone mapping operator — ``"reinhard"``, ``"exposure"``, or
             ``"clamp"``.
         exposure: Exposure multiplier (used by the ``"exposure"`` method).
+        out: Float32 array of the same shape to write the result into; may
+            be *hdr_image* itself when the caller no longer needs the HDR
+            values.  A new array is allocated if omitted.
 
     Returns:
-        Float32 array with values in ``[0.0, 1.0]``.
+        Float32 array with values in ``[0.0, 1.0]`` (*out* if given).
 
     Raises:
         ValueError: If *method* is unrecognized.
     """
     _validate_image_shape(hdr_image)
+    image = np.asarray(hdr_image, dtype=np.float32)
+    if out is None:
+        out = np.empty_like(image)
 
     if method == "reinhard":
-        # Reinhard global operator: L / (1 + L)
-        return (hdr_image / (1.0 + hdr_image)).astype(np.float32)
+        # Reinhard global operator: L / (1 + L).  The denominator is built
+        # in *out* unless that would overwrite the numerator.
+        denom = np.add(image, 1.0, out=None if np.may_share_memory(image, out) else out)
+        np.divide(image, denom, out=out)
+        return out
 
     if method == "exposure":
         # Exposure mapping: 1 - exp(-exposure * L)
-        exposed = 1.0 - np.exp(-exposure * hdr_image)
-        out: NDArray[np.float32] = np.clip(exposed, 0.0, 1.0).astype(np.float32)
+        np.multiply(image, -exposure, out=out)
+        np.exp(out, out=out)
+        np.subtract(1.0, out, out=out)
+        np.clip(out, 0.0, 1.0, out=out)
         return out
 
     if method == "clamp":
-        return np.clip(hdr_image, 0.0, 1.0).astype(np.float32)
+        np.clip(image, 0.0, 1.0, out=out)
+        return out
 
     msg = f"Unknown tone mapping method: '{method}'. Supported: reinhard, exposure, clamp"
     raise ValueError(msg)
 
 
+def linear_to_srgb_u8(image: NDArray[np.float32]) -> NDArray[np.uint8]:
+    """Encode linear values to 8-bit sRGB, clipping to ``[0, 1]`` first.
+
+    Uses a parallel Numba kernel when ``numba`` is installed
+    (``renderscope[numba]``), and vectorized NumPy otherwise.
+
+    Args:
+        image: Float array of any shape, e.g. ``(H, W, 3)``.
+
+    Returns:
+        A uint8 array of the same shape.
+    """
+    src = np.ascontiguousarray(image, dtype=np.float32)
+    kernel = _srgb_kernel()
+    if kernel is not None:
+        out = np.empty(src.shape, dtype=np.uint8)
+        kernel(src.reshape(-1), out.reshape(-1))
+        return out
+    x = np.clip(src, 0.0, 1.0)
+    encoded = np.where(x <= 0.0031308, 12.92 * x, 1.055 * np.power(x, 1.0 / 2.4) - 0.055)
+    result: NDArray[np.uint8] = (encoded * 255.0 + 0.5).astype(np.uint8)
+    return result
+
+
+def has_fast_srgb() -> bool:
+    """Whether ``linear_to_srgb_u8`` runs the compiled Numba kernel."""
+    return _srgb_kernel() is not None
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _srgb_kernel() -> Callable[[NDArray[np.float32], NDArray[np.uint8]], None] | None:
+    """Compile the parallel sRGB encoder, or return ``None`` without Numba.
+
+    ``numba.njit`` compiles lazily, so a one-pixel warm-up call forces
+    compilation here; a kernel that fails to compile or run falls back to
+    NumPy instead of raising from ``linear_to_srgb_u8``.  Importing Numba
+    and compiling take about a second, and the result is cached, so this
+    only happens when an image is first encoded.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    def encode(src: NDArray[np.float32], out: NDArray[np.uint8]) -> None:
+        for i in numba.prange(src.size):
+            x = min(max(src[i], 0.0), 1.0)
+            y = 12.92 * x if x <= 0.0031308 else 1.055 * x ** (1.0 / 2.4) - 0.055
+            out[i] = np.uint8(y * 255.0 + 0.5)
+
+    try:
+        kernel: Callable[[NDArray[np.float32], NDArray[np.uint8]], None]
+        kernel = numba.njit(parallel=True, fastmath=True)(encode)
+        kernel(np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.uint8))
+    except Exception:
+        logger.debug("Numba sRGB kernel unavailable", exc_info=True)
+        return None
+    return kernel
+
+
 def _validate_image_shape(image: NDArray[np.float32]) -> None:
     """Raise ``ValueError`` if the image is not ``(H, W, 3)``."""
     if image.ndim != 3 or image.shape[2] != 3:
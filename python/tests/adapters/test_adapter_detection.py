@@ -18,6 +18,7 @@ from renderscope.adapters.exceptions import (
 from renderscope.models.settings import RenderSettings
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from renderscope.adapters.base import RendererAdapter
@@ -25,6 +26,16 @@ if TYPE_CHECKING:
 pytestmark = pytest.mark.adapters
 
 
+def _output_lines(*outputs: str) -> Callable[..., Iterator[str]]:
+    """Fake ``iter_output_lines``: each call streams the next of *outputs*."""
+    remaining = iter(outputs)
+
+    def fake(cmd: list[str], **kwargs: object) -> Iterator[str]:
+        yield from next(remaining).splitlines()
+
+    return fake
+
+
 # ===================================================================
 # PBRT Adapter Tests
 # ===================================================================
@@ -100,6 +111,80 @@ class TestPBRTAdapter:
         adapter = self._make_adapter()
         assert adapter.is_mock is False
 
+    @pytest.mark.parametrize(
+        ("stdout", "stderr", "expected"),
+        [
+            ("pbrt version 4.0.0\n", "", "4.0.0"),
+            ("", "pbrt version 4.1\n", "4.1"),
+            ("build 2.5.1\n", "pbrt version 4.0.0\n", "4.0.0"),
+            ("build 2.5.1\n", "", "2.5.1"),
+            ("pbrt version 4.0.0.\n", "", "4.0.0"),
+            ("loading /opt/pbrt-3.2/lib\n", "", "unknown"),
+            ("", "", "unknown"),
+        ],
+    )
+    def test_detect_searches_each_stream(self, stdout: str, stderr: str, expected: str) -> None:
+        from renderscope.core.runner import SubprocessResult
+
+        adapter = self._make_adapter()
+        with (
+            patch("renderscope.adapters.pbrt.PBRTAdapter._find_binary", return_value="pbrt"),
+            patch(
+                "renderscope.adapters.pbrt.run_subprocess",
+                return_value=SubprocessResult(0, stdout, stderr, 0.1, 1.0),
+            ),
+        ):
+            assert adapter.detect() == expected
+
+    def test_find_binary_cached(self) -> None:
+        def fake_which(name: str, path: str | None = None) -> str | None:
+            return "/opt/pbrt/bin/pbrt-v4" if name == "pbrt-v4" else None
+
+        from renderscope.adapters.pbrt import PBRTAdapter
+
+        adapter = PBRTAdapter()
+        with patch("shutil.which", side_effect=fake_which) as which:
+            assert adapter._find_binary() == "pbrt-v4"
+            assert adapter._find_binary() == "pbrt-v4"
+        assert [c.args[0] for c in which.call_args_list] == ["pbrt", "pbrt-v4"]
+
+    def test_version_probed_once(self) -> None:
+        from renderscope.core.runner import SubprocessResult
+
+        with (
+            patch("renderscope.adapters.pbrt.PBRTAdapter._find_binary", return_value="pbrt"),
+            patch(
+                "renderscope.adapters.pbrt.run_subprocess",
+                return_value=SubprocessResult(0, "pbrt version 4.0.0\n", "", 0.1, 1.0),
+            ) as run,
+        ):
+            assert self._make_adapter().detect() == "4.0.0"
+            assert self._make_adapter().detect() == "4.0.0"
+        run.assert_called_once()
+
+    def test_render_reuses_detected_version(self, tmp_path: Path) -> None:
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.pbrt"
+        scene.write_text("WorldBegin\n")
+        output = tmp_path / "out.exr"
+
+        def fake_run(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            if cmd[1:] == ["--version"]:
+                return SubprocessResult(0, "pbrt version 4.0.0\n", "", 0.1, 1.0)
+            output.write_bytes(b"")
+            return SubprocessResult(0, "", "", 1.5, 64.0)
+
+        adapter = self._make_adapter()
+        with (
+            patch("renderscope.adapters.pbrt.PBRTAdapter._find_binary", return_value="pbrt"),
+            patch("renderscope.adapters.pbrt.run_subprocess", side_effect=fake_run) as run,
+        ):
+            assert adapter.detect() == "4.0.0"
+            result = adapter.render(scene, output, RenderSettings())
+        assert run.call_count == 2
+        assert result.metadata["version"] == "4.0.0"
+
 
 # ===================================================================
 # Mitsuba 3 Adapter Tests
@@ -157,41 +242,263 @@ class TestMitsubaAdapter:
     def test_select_variant_gpu(self) -> None:
         from renderscope.adapters.mitsuba import MitsubaAdapter
 
-        mi_mock = MagicMock()
-        mi_mock.variants.return_value = ["scalar_rgb", "cuda_ad_rgb", "llvm_ad_rgb"]
-        variant = MitsubaAdapter._select_variant(mi_mock, gpu=True)
+        variants = ("scalar_rgb", "cuda_ad_rgb", "llvm_ad_rgb")
+        variant = MitsubaAdapter._select_variant(variants, gpu=True)
         assert variant == "cuda_ad_rgb"
 
     def test_select_variant_cpu(self) -> None:
         from renderscope.adapters.mitsuba import MitsubaAdapter
 
-        mi_mock = MagicMock()
-        mi_mock.variants.return_value = ["scalar_rgb", "llvm_ad_rgb"]
-        variant = MitsubaAdapter._select_variant(mi_mock, gpu=False)
+        variant = MitsubaAdapter._select_variant(("scalar_rgb", "llvm_ad_rgb"), gpu=False)
         assert variant == "llvm_ad_rgb"
 
     def test_select_variant_fallback(self) -> None:
         from renderscope.adapters.mitsuba import MitsubaAdapter
 
-        mi_mock = MagicMock()
-        mi_mock.variants.return_value = ["scalar_rgb"]
-        variant = MitsubaAdapter._select_variant(mi_mock, gpu=True)
+        variant = MitsubaAdapter._select_variant(("scalar_rgb",), gpu=True)
         assert variant == "scalar_rgb"
 
     def test_select_variant_empty(self) -> None:
         from renderscope.adapters.mitsuba import MitsubaAdapter
 
-        mi_mock = MagicMock()
-        mi_mock.variants.return_value = []
-        variant = MitsubaAdapter._select_variant(mi_mock, gpu=False)
+        variant = MitsubaAdapter._select_variant((), gpu=False)
         assert variant == "scalar_rgb"
 
     def test_select_variant_no_variants_method(self) -> None:
         from renderscope.adapters.mitsuba import MitsubaAdapter
 
-        mi_mock = MagicMock(spec=[])
-        variant = MitsubaAdapter._select_variant(mi_mock, gpu=False)
-        assert variant == "scalar_rgb"
+        mi_mock = MagicMock(spec=["__version__"])
+        mi_mock.__version__ = "3.5.2"
+        with patch.dict("sys.modules", {"mitsuba": mi_mock}):
+            variants = MitsubaAdapter._get_available_variants()
+        assert variants == ()
+        assert MitsubaAdapter._select_variant(variants, gpu=False) == "scalar_rgb"
+
+    def test_kernel_history_summarises_cache_hits(self) -> None:
+        from renderscope.adapters.mitsuba import _kernel_history
+
+        dr = MagicMock()
+        dr.flag.return_value = False
+        dr.kernel_history.side_effect = [
+            [],
+            [
+                {
+                    "cache_hit": False,
+                    "cache_disk_hit": False,
+                    "codegen_time": 2.0,
+                    "backend_time": 8.0,
+                },
+                {"cache_hit": True, "cache_disk_hit": True},
+                {"cache_hit": True, "cache_disk_hit": False},
+                {"type": "other"},
+            ],
+        ]
+        with _kernel_history(dr) as stats:
+            assert stats == {}
+        assert stats == {
+            "jit_kernels": 3,
+            "jit_cache_hits": 2,
+            "jit_disk_cache_hits": 1,
+            "jit_compile_time_ms": 10.0,
+        }
+        dr.set_flag.assert_called_with(dr.JitFlag.KernelHistory, False)
+
+    @pytest.mark.parametrize("previous", [True, False])
+    def test_kernel_history_restores_flag(self, previous: bool) -> None:
+        """The previous flag value should come back even if reading history fails."""
+        from types import SimpleNamespace
+
+        from renderscope.adapters.mitsuba import _kernel_history
+
+        values = {"KernelHistory": previous}
+        reads = iter([[], RuntimeError("history unavailable")])
+
+        def kernel_history() -> list[dict[str, object]]:
+            result = next(reads)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        dr = SimpleNamespace(
+            JitFlag=SimpleNamespace(KernelHistory="KernelHistory"),
+            flag=values.__getitem__,
+            set_flag=values.__setitem__,
+            kernel_history=kernel_history,
+        )
+        with _kernel_history(dr) as stats:
+            assert values["KernelHistory"] is True
+        assert values["KernelHistory"] is previous
+        assert stats == {}
+
+    def test_wait_for_kernels_syncs_image(self) -> None:
+        from renderscope.adapters.mitsuba import _wait_for_kernels
+
+        dr, image = MagicMock(), object()
+        _wait_for_kernels(dr, image)
+        dr.eval.assert_called_once_with(image)
+        dr.sync_thread.assert_called_once_with()
+        _wait_for_kernels(None, image)  # scalar-only builds have no drjit
+
+    def test_megakernel_flags_are_restored(self) -> None:
+        from types import SimpleNamespace
+
+        from renderscope.adapters.mitsuba import _megakernel_flags
+
+        values = {"SymbolicLoops": False, "SymbolicCalls": True}
+        dr = SimpleNamespace(
+            JitFlag=SimpleNamespace(SymbolicLoops="SymbolicLoops", SymbolicCalls="SymbolicCalls"),
+            flag=values.__getitem__,
+            set_flag=values.__setitem__,
+        )
+        with _megakernel_flags(dr):
+            assert values == {"SymbolicLoops": True, "SymbolicCalls": True}
+        assert values == {"SymbolicLoops": False, "SymbolicCalls": True}
+
+    def test_kernel_history_without_drjit(self) -> None:
+        from renderscope.adapters.mitsuba import _kernel_history
+
+        with _kernel_history(None) as stats:
+            pass
+        assert stats == {}
+
+    def test_render_batch_reuses_loaded_scene(self, tmp_path: Path) -> None:
+        from renderscope.adapters.base import RenderJob
+        from renderscope.adapters.mitsuba import MitsubaAdapter
+
+        scene = tmp_path / "scene.xml"
+        scene.write_text("<scene/>")
+        mi_mock = MagicMock()
+        mi_mock.__version__ = "3.5.2"
+        mi_mock.variants.return_value = ["scalar_rgb"]
+        mi_mock.variant.return_value = "scalar_rgb"
+        mi_mock.Bitmap.return_value.write.side_effect = lambda path: open(path, "wb").close()
+        jobs = [
+            RenderJob(scene, tmp_path / f"out_{spp}.exr", RenderSettings(samples=spp))
+            for spp in (4, 16)
+        ]
+
+        with (
+            patch.dict("sys.modules", {"mitsuba": mi_mock, "drjit": None}),
+            patch("renderscope.adapters.mitsuba.check_scene_exists") as check_scene,
+        ):
+            results = MitsubaAdapter().render_batch(jobs)
+
+        check_scene.assert_called_once_with("Mitsuba 3", scene)
+        mi_mock.load_file.assert_called_once_with(str(scene))
+        # Already on the wanted variant, but logging is still quietened, once
+        mi_mock.set_log_level.assert_called_once_with(mi_mock.LogLevel.Warn)
+        mi_mock.set_variant.assert_not_called()
+        assert [r.metadata["scene_cached"] for r in results] == [False, True]
+        assert [r.metadata["spp"] for r in results] == [4, 16]
+        assert all(job.output_path.is_file() for job in jobs)
+
+    def test_render_sweep_warms_up_once_in_ascending_order(self, tmp_path: Path) -> None:
+        from renderscope.adapters.mitsuba import MitsubaAdapter
+
+        scene = tmp_path / "scene.xml"
+        scene.write_text("<scene/>")
+        mi_mock = MagicMock()
+        mi_mock.__version__ = "3.5.2"
+        mi_mock.variants.return_value = ["scalar_rgb"]
+        mi_mock.variant.return_value = "scalar_rgb"
+        mi_mock.Bitmap.return_value.write.side_effect = lambda path: open(path, "wb").close()
+
+        with patch.dict("sys.modules", {"mitsuba": mi_mock, "drjit": None}):
+            results = MitsubaAdapter().render_sweep(
+                scene, tmp_path / "out.exr", RenderSettings(), [16, 4, 4]
+            )
+
+        assert [c.kwargs["spp"] for c in mi_mock.render.call_args_list] == [4, 4, 16]
+        mi_mock.load_file.assert_called_once()
+        assert [r.metadata["spp"] for r in results] == [4, 16]
+        assert sorted(p.name for p in tmp_path.glob("out_*")) == ["out_spp16.exr", "out_spp4.exr"]
+
+    def test_output_bitmap_reused_per_shape(self, tmp_path: Path) -> None:
+        import numpy as np
+
+        from renderscope.adapters.base import RenderJob
+        from renderscope.adapters.mitsuba import MitsubaAdapter
+
+        class FakeBitmap:
+            def __init__(self, pixel_format: object, component: object, size: list[int]) -> None:
+                self.pixels = np.zeros((size[1], size[0], 3), dtype=np.float32)
+
+            def __array__(self, dtype: object = None, copy: object = None) -> np.ndarray:
+                return self.pixels
+
+            def write(self, path: str) -> None:
+                open(path, "wb").close()
+
+        scene = tmp_path / "scene.xml"
+        scene.write_text("<scene/>")
+        images = [np.full((2, 3, 3), value, dtype=np.float32) for value in (0.25, 0.5)]
+        mi_mock = MagicMock()
+        mi_mock.__version__ = "3.5.2"
+        mi_mock.variants.return_value = ["scalar_rgb"]
+        mi_mock.variant.return_value = "scalar_rgb"
+        mi_mock.render.side_effect = images
+        mi_mock.Bitmap.side_effect = FakeBitmap
+        jobs = [RenderJob(scene, tmp_path / f"out_{i}.exr", RenderSettings()) for i in range(2)]
+
+        adapter = MitsubaAdapter()
+        with patch.dict("sys.modules", {"mitsuba": mi_mock, "drjit": None}):
+            adapter.render_batch(jobs)
+
+        mi_mock.Bitmap.assert_called_once()
+        (bitmap,) = adapter._bitmaps.values()
+        np.testing.assert_array_equal(bitmap.pixels, images[1])
+
+    def test_write_srgb_fast(self, tmp_path: Path) -> None:
+        import numpy as np
+        from PIL import Image
+
+        from renderscope.adapters.mitsuba import _write_srgb_fast
+
+        image = np.full((2, 3, 3), 0.5, dtype=np.float32)
+        with patch("renderscope.utils.image_io.has_fast_srgb", return_value=True):
+            assert _write_srgb_fast(image, tmp_path / "out.png")
+            assert not _write_srgb_fast(image, tmp_path / "out.exr")
+            assert not _write_srgb_fast(image[..., :1], tmp_path / "gray.png")
+        with patch("renderscope.utils.image_io.has_fast_srgb", return_value=False):
+            assert not _write_srgb_fast(image, tmp_path / "slow.png")
+        assert np.asarray(Image.open(tmp_path / "out.png")).max() == 188
+
+    def test_detect_imports_once(self) -> None:
+        from renderscope.adapters.mitsuba import MitsubaAdapter
+
+        mi_mock = MagicMock()
+        mi_mock.__version__ = "3.5.2"
+        mi_mock.variants.return_value = ["scalar_rgb", "llvm_ad_rgb"]
+        adapter = MitsubaAdapter()
+        with patch.dict("sys.modules", {"mitsuba": mi_mock}):
+            assert adapter.detect() == "3.5.2"
+            assert adapter.detect() == "3.5.2"
+            assert adapter._get_available_variants() == ("scalar_rgb", "llvm_ad_rgb")
+        mi_mock.variants.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("variant", "threads", "expected"),
+        [("llvm_ad_rgb", None, 6), ("llvm_ad_rgb", 3, 3), ("scalar_rgb", None, None)],
+    )
+    def test_llvm_thread_count(
+        self, variant: str, threads: int | None, expected: int | None
+    ) -> None:
+        from renderscope.adapters.mitsuba import _llvm_thread_count
+
+        dr = MagicMock()
+        dr.thread_count.return_value = 16
+        with (
+            patch("renderscope.adapters.mitsuba.physical_core_count", return_value=6),
+            _llvm_thread_count(dr, variant, RenderSettings(threads=threads)) as num_threads,
+        ):
+            assert num_threads == expected
+            if expected is not None:
+                dr.set_thread_count.assert_called_once_with(expected)
+        if expected is None:
+            dr.set_thread_count.assert_not_called()
+        else:
+            # The process-wide pool size is restored after the render
+            dr.set_thread_count.assert_called_with(16)
 
 
 # ===================================================================
@@ -266,19 +573,148 @@ class TestCyclesAdapter:
             adapter.render(scene, tmp_path / "out.png", RenderSettings())
 
     def test_render_script_template_is_valid_python(self) -> None:
-        from renderscope.adapters.cycles import _RENDER_SCRIPT_TEMPLATE
+        from renderscope.adapters.cycles import _build_render_script
 
-        script = _RENDER_SCRIPT_TEMPLATE.format(
+        script = _build_render_script(
             scene_path="/tmp/scene.blend",
             output_path="/tmp/out.png",
+            stats_path="/tmp/out.png.rs.json",
             width=1920,
             height=1080,
             samples=128,
             use_gpu=False,
             is_blend=True,
+            camera_position=[0.0, -5.0, 2.0],
+            camera_target=None,
+            camera_up=None,
+            camera_fov=45.0,
         )
         compile(script, "<render_script>", "exec")
 
+    def test_build_render_script_matches_str_format(self) -> None:
+        from renderscope.adapters.cycles import _RENDER_SCRIPT_TEMPLATE, _build_render_script
+
+        fields = {
+            "scene_path": "/tmp/scene.gltf",
+            "output_path": "/tmp/out.exr",
+            "stats_path": "/tmp/out.exr.rs.json",
+            "width": 640,
+            "height": 480,
+            "samples": 16,
+            "use_gpu": True,
+            "is_blend": False,
+            "camera_position": [1.0, 2.0, 3.0],
+            "camera_target": [0.0, 0.0, 0.0],
+            "camera_up": [0.0, 0.0, 1.0],
+            "camera_fov": 39.6,
+        }
+        assert _build_render_script(**fields) == _RENDER_SCRIPT_TEMPLATE.format(**fields)
+
+    def test_render_script_body_shared_across_paths(self) -> None:
+        from renderscope.adapters.cycles import (
+            _RENDER_SCRIPT_TEMPLATE,
+            _build_render_script,
+            _render_script_body,
+        )
+
+        fields = {
+            "width": 640,
+            "height": 480,
+            "samples": 16,
+            "use_gpu": False,
+            "is_blend": True,
+            "camera_position": None,
+            "camera_target": None,
+            "camera_up": None,
+            "camera_fov": None,
+        }
+        _render_script_body.cache_clear()
+        for i in range(3):
+            paths = {
+                "scene_path": f"/tmp/s{i}.blend",
+                "output_path": f"/tmp/o{i}.png",
+                "stats_path": f"/tmp/o{i}.png.rs.json",
+            }
+            script = _build_render_script(**paths, **fields)
+            assert script == _RENDER_SCRIPT_TEMPLATE.format(**paths, **fields)
+        info = _render_script_body.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_render_script_file_reused_for_identical_content(self) -> None:
+        from renderscope.adapters.cycles import _write_render_script
+
+        first = _write_render_script("print('a')\n")
+        second = _write_render_script("print('a')\n")
+        other = _write_render_script("print('b')\n")
+        assert first == second
+        assert first != other
+        assert first.read_text(encoding="utf-8") == "print('a')\n"
+
+    def test_batch_driver_script_is_valid_python(self) -> None:
+        from renderscope.adapters.cycles import _BATCH_SCRIPT_TEMPLATE
+
+        script = _BATCH_SCRIPT_TEMPLATE.format(
+            jobs=[("/tmp/a.blend", True, "/tmp/a.py"), ("/tmp/b.glb", False, "/tmp/b.py")],
+        )
+        compile(script, "<batch_script>", "exec")
+
+    def test_render_batch_parses_per_job_reports(self, tmp_path: Path) -> None:
+        from renderscope.adapters.base import RenderJob
+        from renderscope.adapters.cycles import CyclesAdapter
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.glb"
+        scene.write_bytes(b"glTF")
+        jobs = [
+            RenderJob(scene, tmp_path / f"out_{i}.png", RenderSettings(samples=4)) for i in range(2)
+        ]
+
+        def fake_blender(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            for job in jobs:
+                job.output_path.write_bytes(b"png")
+            # Job 0 reports via its stats sidecar; job 1 only via the log
+            stats = tmp_path / "out_0.png.rs.json"
+            stats.write_text('{"gpu_backend": "CPU (fallback)", "samples": 4}', encoding="utf-8")
+            stderr = (
+                "[RenderScope] JOB_DONE 0 1.250000\n"
+                "\x1b[1m[RenderScope] GPU: CUDA\x1b[0m\n"
+                "[RenderScope] JOB_DONE 1 0.500000\n"
+            )
+            return SubprocessResult(0, "", stderr, 3.0, 512.0)
+
+        with (
+            patch.object(CyclesAdapter, "_find_binary", return_value="blender"),
+            patch("renderscope.adapters.cycles._detect_version", return_value="4.0.2"),
+            patch("renderscope.adapters.cycles.run_subprocess", side_effect=fake_blender) as run,
+        ):
+            results = CyclesAdapter().render_batch(jobs)
+
+        assert run.call_count == 1
+        assert [r.render_time_seconds for r in results] == [1.25, 0.5]
+        assert [r.metadata["gpu_backend"] for r in results] == ["CPU (fallback)", "CUDA"]
+        assert not (tmp_path / "out_0.png.rs.json").exists()
+        assert all(r.metadata["batch_size"] == 2 for r in results)
+
+    def test_render_batch_failed_job_raises(self, tmp_path: Path) -> None:
+        from renderscope.adapters.base import RenderJob
+        from renderscope.adapters.cycles import CyclesAdapter
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.glb"
+        scene.write_bytes(b"glTF")
+        jobs = [RenderJob(scene, tmp_path / f"out_{i}.png", RenderSettings()) for i in range(2)]
+        jobs[0].output_path.write_bytes(b"png")
+        stderr = "[RenderScope] JOB_DONE 0 1.0\nboom\n[RenderScope] JOB_FAILED 1 0.1\n"
+        with (
+            patch.object(CyclesAdapter, "_find_binary", return_value="blender"),
+            patch(
+                "renderscope.adapters.cycles.run_subprocess",
+                return_value=SubprocessResult(0, "", stderr, 1.0, 1.0),
+            ),
+            pytest.raises(RenderError, match="Batch job 1 failed"),
+        ):
+            CyclesAdapter().render_batch(jobs)
+
     def test_ansi_stripping(self) -> None:
         from renderscope.adapters.cycles import _ANSI_RE
 
@@ -286,6 +722,26 @@ class TestCyclesAdapter:
         cleaned = _ANSI_RE.sub("", text)
         assert cleaned == "Red text and normal"
 
+    def test_leading_version_fast_path(self) -> None:
+        from renderscope.adapters.cycles import _leading_version
+
+        assert _leading_version("Blender 4.0.2\n\tbuild date: 2023-12-05") == "4.0.2"
+        assert _leading_version("Blender 4.1.0-beta") is None
+        assert _leading_version("Read prefs: ...\nBlender 4.0.2") is None
+
+    def test_scan_render_stderr(self) -> None:
+        from renderscope.adapters.cycles import _scan_render_stderr
+
+        stderr = "\x1b[32mFra:1\x1b[0m Mem:12M\n[RenderScope] GPU: OPTIX\nGPU not available\n"
+        cleaned, backend = _scan_render_stderr(stderr)
+        assert cleaned == "Fra:1 Mem:12M\n[RenderScope] GPU: OPTIX\nGPU not available\n"
+        assert backend == "OPTIX"
+
+        assert _scan_render_stderr("[RenderScope] GPU not available, using CPU")[1] == (
+            "CPU (fallback)"
+        )
+        assert _scan_render_stderr("\x1b[1mRendering\x1b[0m") == ("Rendering", "CPU")
+
 
 # ===================================================================
 # LuxCoreRender Adapter Tests
@@ -316,30 +772,146 @@ class TestLuxCoreAdapter:
         result = self._make_adapter().detect()
         assert result is None or isinstance(result, str)
 
+    def test_instances_use_slots(self) -> None:
+        assert not hasattr(self._make_adapter(), "__dict__")
+
+    def test_property_overrides(self) -> None:
+        from renderscope.adapters.luxcore import _property_overrides, _render_engine_of
+
+        settings = RenderSettings(width=64, height=32, samples=16, gpu=True)
+        engine = _render_engine_of(settings)
+        assert engine == "PATHOCL"
+        assert _property_overrides(settings, engine) == (
+            'film.width = 64\nfilm.height = 32\nbatch.haltspp = 16\nrenderengine.type = "PATHOCL"\n'
+        )
+
+    def test_gpu_engine_prefers_cuda_on_nvidia(self) -> None:
+        from renderscope.adapters.luxcore import _render_engine_of
+
+        mock_pyluxcore = MagicMock()
+        mock_pyluxcore.GetOpenCLDeviceList.return_value = [
+            ("Intel(R) UHD Graphics", "OPENCL_GPU", 24),
+            ("NVIDIA GeForce RTX 3080", "CUDA_GPU", 68),
+        ]
+        with patch.dict("sys.modules", {"pyluxcore": mock_pyluxcore}):
+            assert _render_engine_of(RenderSettings(gpu=True)) == "PATHCUDA"
+            assert _render_engine_of(RenderSettings(gpu=True)) == "PATHCUDA"
+            assert _render_engine_of(RenderSettings(gpu=False)) == "PATHCPU"
+        mock_pyluxcore.GetOpenCLDeviceList.assert_called_once()
+
+    def test_wait_for_done_returns_on_native_halt(self) -> None:
+        from renderscope.adapters.luxcore import _wait_for_done
+
+        session = MagicMock()
+        _wait_for_done(session, timeout=5.0)
+        session.WaitForDone.assert_called_once()
+        session.Stop.assert_not_called()
+
+    def test_wait_for_done_stops_overrunning_session(self) -> None:
+        import threading
+
+        from renderscope.adapters.luxcore import _wait_for_done
+
+        stopped = threading.Event()
+        session = MagicMock()
+        session.WaitForDone.side_effect = lambda: stopped.wait(5.0)
+        session.Stop.side_effect = stopped.set
+        _wait_for_done(session, timeout=0.05)
+        session.Stop.assert_called_once()
+
+    def test_render_detects_once(self, tmp_path: Path) -> None:
+        from renderscope.adapters.luxcore import LuxCoreAdapter
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.cfg"
+        scene.touch()
+        output = tmp_path / "out.png"
+
+        def fake_render(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            output.write_bytes(b"png")
+            return SubprocessResult(0, "", "", 0.5, 64.0)
+
+        adapter = LuxCoreAdapter()
+        with (
+            patch.object(LuxCoreAdapter, "_detect_python_api", return_value=None),
+            patch.object(
+                LuxCoreAdapter, "_detect_cli", return_value="2.6", autospec=True
+            ) as detect_cli,
+            patch("renderscope.adapters.luxcore.run_subprocess", side_effect=fake_render),
+        ):
+            adapter.render(scene, output, RenderSettings())
+            adapter.render(scene, output, RenderSettings())
+        detect_cli.assert_called_once()
+
+    def test_python_api_saves_only_rgb_output(self, tmp_path: Path) -> None:
+        from renderscope.adapters.luxcore import LuxCoreAdapter
+
+        scene = tmp_path / "scene.cfg"
+        scene.touch()
+        output = tmp_path / "out.png"
+        mock_pyluxcore = MagicMock()
+        film = mock_pyluxcore.RenderSession.return_value.GetFilm.return_value
+        film.SaveOutput.side_effect = lambda path, kind: output.write_bytes(b"png")
+
+        adapter = LuxCoreAdapter()
+        with patch.dict("sys.modules", {"pyluxcore": mock_pyluxcore}):
+            adapter._render_python_api(scene, output, RenderSettings(), "2.6")
+        film.SaveOutput.assert_called_once()
+        film.Save.assert_not_called()
+
     def test_detect_via_python_api(self) -> None:
         from renderscope.adapters.luxcore import LuxCoreAdapter
 
         adapter = LuxCoreAdapter()
         mock_pyluxcore = MagicMock()
         mock_pyluxcore.Version.return_value = "v2.6"
-        with patch.dict("sys.modules", {"pyluxcore": mock_pyluxcore}):
+        with (
+            patch.dict("sys.modules", {"pyluxcore": mock_pyluxcore}),
+            patch.object(LuxCoreAdapter, "_detect_cli", return_value="2.5"),
+        ):
             version = adapter.detect()
         assert version == "2.6"
+        assert adapter._integration_path is not None
+        assert adapter._integration_path.value == "python_api"
+
+    def test_detect_probes_cli_concurrently(self) -> None:
+        import threading
+
+        from renderscope.adapters.luxcore import LuxCoreAdapter
+
+        cli_started = threading.Event()
+        overlapped: list[bool] = []
+
+        def api_probe() -> None:
+            # Sequential probing would never see the CLI probe start here
+            overlapped.append(cli_started.wait(5.0))
+
+        def cli_probe() -> str:
+            cli_started.set()
+            return "2.6"
+
+        adapter = LuxCoreAdapter()
+        with (
+            patch.object(LuxCoreAdapter, "_detect_python_api", side_effect=api_probe),
+            patch.object(LuxCoreAdapter, "_detect_cli", side_effect=cli_probe),
+        ):
+            assert adapter.detect() == "2.6"
+        assert overlapped == [True]
 
     def test_detect_via_cli_fallback(self) -> None:
         from renderscope.adapters.luxcore import LuxCoreAdapter
 
         adapter = LuxCoreAdapter()
-        mock_result = MagicMock()
-        mock_result.stdout = "LuxCoreRender v2.6"
-        mock_result.stderr = ""
         with (
             patch(
                 "renderscope.adapters.luxcore.LuxCoreAdapter._detect_python_api",
                 return_value=None,
             ),
             patch("shutil.which", return_value="/usr/bin/luxcoreconsole"),
-            patch("renderscope.adapters.luxcore.run_subprocess", return_value=mock_result),
+            patch(
+                "renderscope.adapters._version.iter_output_lines",
+                side_effect=_output_lines("LuxCoreRender v2.6"),
+            ),
         ):
             version = adapter.detect()
         assert version == "2.6"
@@ -420,6 +992,35 @@ class TestAppleseedAdapter:
             version = adapter.detect()
         assert version == "2.1.0-beta"
 
+    def test_detect_version_on_stderr(self) -> None:
+        from renderscope.adapters.appleseed import AppleseedAdapter
+
+        adapter = AppleseedAdapter()
+        mock_result = MagicMock()
+        mock_result.stdout = "loading plugins...\n"
+        mock_result.stderr = "appleseed.cli version 2.1.0-beta"
+        with (
+            patch("shutil.which", return_value="/usr/bin/appleseed.cli"),
+            patch("renderscope.adapters.appleseed.run_subprocess", return_value=mock_result),
+        ):
+            version = adapter.detect()
+        assert version == "2.1.0-beta"
+
+    def test_version_probe_runs_once(self) -> None:
+        from renderscope.adapters.appleseed import AppleseedAdapter
+
+        adapter = AppleseedAdapter()
+        mock_result = MagicMock()
+        mock_result.stdout = "appleseed.cli version 2.1.0-beta"
+        mock_result.stderr = ""
+        with (
+            patch("shutil.which", return_value="/usr/bin/appleseed.cli"),
+            patch("renderscope.adapters.appleseed.run_subprocess", return_value=mock_result) as run,
+        ):
+            assert adapter.detect() == "2.1.0-beta"
+            assert adapter.detect() == "2.1.0-beta"
+        assert run.call_count == 1
+
     def test_detect_nothing_available(self) -> None:
         from renderscope.adapters.appleseed import AppleseedAdapter
 
@@ -428,6 +1029,40 @@ class TestAppleseedAdapter:
             version = adapter.detect()
         assert version is None
 
+    def test_find_binary_is_cached(self) -> None:
+        from renderscope.adapters.appleseed import AppleseedAdapter
+        from renderscope.core.registry import registry
+
+        with patch("shutil.which", return_value="/usr/bin/appleseed.cli") as which:
+            assert AppleseedAdapter._find_binary() == "appleseed.cli"
+            assert AppleseedAdapter._find_binary() == "appleseed.cli"
+            assert which.call_count == 1
+
+            registry.clear_cache()
+            assert AppleseedAdapter._find_binary() == "appleseed.cli"
+            assert which.call_count == 2
+
+    def test_binary_lookups_share_path_snapshot(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        from renderscope.adapters._discovery import clear_binary_cache, resolve_binary
+
+        dir_a, dir_b = tmp_path / "a", tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        monkeypatch.setenv("PATH", str(dir_a))
+        with patch("shutil.which", return_value=None) as which:
+            assert resolve_binary(("appleseed.cli", "appleseed")) is None
+            assert resolve_binary(("appleseed",)) is None
+            monkeypatch.setenv("PATH", str(dir_b))
+            assert resolve_binary(("appleseed.studio", "appleseed")) is None
+            assert which.call_count == 3
+            assert {call.kwargs["path"] for call in which.call_args_list} == {str(dir_a)}
+
+            clear_binary_cache()
+            resolve_binary(("appleseed",))
+            assert which.call_args.kwargs["path"] == str(dir_b)
+
     def test_render_not_installed_raises(self, tmp_path: Path) -> None:
         adapter = self._make_adapter()
         scene = tmp_path / "scene.appleseed"
@@ -487,16 +1122,189 @@ class TestFilamentAdapter:
         from renderscope.adapters.filament import FilamentAdapter
 
         adapter = FilamentAdapter()
-        mock_result = MagicMock()
-        mock_result.stdout = "Filament gltf_viewer v1.32.0"
-        mock_result.stderr = ""
         with (
             patch("shutil.which", return_value="/usr/bin/gltf_viewer"),
-            patch("renderscope.adapters.filament.run_subprocess", return_value=mock_result),
+            patch(
+                "renderscope.adapters._version.iter_output_lines",
+                side_effect=_output_lines("Filament gltf_viewer v1.32.0"),
+            ),
         ):
             version = adapter.detect()
         assert version == "1.32.0"
 
+    def test_render_probes_version_once(self, tmp_path: Path) -> None:
+        from renderscope.adapters.filament import FilamentAdapter
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.gltf"
+        scene.write_text("{}")
+        output = tmp_path / "out.png"
+
+        def fake_render(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            output.write_bytes(b"png")
+            return SubprocessResult(0, "", "", 0.5, 64.0)
+
+        adapter = FilamentAdapter()
+        with (
+            patch("shutil.which", return_value="/usr/bin/gltf_viewer") as which,
+            patch(
+                "renderscope.adapters._version.iter_output_lines",
+                side_effect=_output_lines("Filament gltf_viewer v1.32.0"),
+            ) as probe,
+            patch("renderscope.adapters.filament.run_subprocess", side_effect=fake_render),
+        ):
+            assert adapter.detect() == "1.32.0"
+            result = adapter.render(scene, output, RenderSettings())
+        assert result.metadata["version"] == "1.32.0"
+        # One version probe (``--version`` answered); one PATH walk per tool
+        assert probe.call_count == 1
+        assert which.call_count == 5
+
+    def test_render_creates_output_dir_once(self, tmp_path: Path) -> None:
+        import os
+
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.gltf"
+        scene.write_text("{}")
+        outputs = [tmp_path / "frames" / f"{i}.png" for i in range(3)]
+
+        def fake_render(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            with open(cmd[cmd.index("--screenshot") + 1], "wb") as f:
+                f.write(b"png")
+            return SubprocessResult(0, "", "", 0.01, 64.0)
+
+        adapter = self._make_adapter()
+        with (
+            patch("shutil.which", return_value="/usr/bin/gltf_viewer"),
+            patch("renderscope.adapters._version.iter_output_lines", return_value=iter(())),
+            patch("renderscope.adapters.filament.run_subprocess", side_effect=fake_render),
+            patch("renderscope.adapters._paths.os.makedirs", wraps=os.makedirs) as makedirs,
+        ):
+            for output in outputs:
+                adapter.render(scene, output, RenderSettings())
+        assert makedirs.call_count == 1
+        assert all(output.is_file() for output in outputs)
+
+    def test_render_missing_scene_raises(self, tmp_path: Path) -> None:
+        adapter = self._make_adapter()
+        with (
+            patch("shutil.which", return_value="/usr/bin/gltf_viewer"),
+            pytest.raises(RenderError, match="Scene file not found"),
+        ):
+            adapter.render(tmp_path / "missing.glb", tmp_path / "out.png", RenderSettings())
+
+    def test_render_reports_gpu_failure(self, tmp_path: Path) -> None:
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.gltf"
+        scene.write_text("{}")
+        failed = SubprocessResult(1, "", "eglInitialize() failed", 0.1, 64.0)
+
+        adapter = self._make_adapter()
+        with (
+            patch("shutil.which", return_value="/usr/bin/gltf_viewer"),
+            patch("renderscope.adapters.filament.run_subprocess", return_value=failed),
+            pytest.raises(RenderError, match="GPU or display"),
+        ):
+            adapter.render(scene, tmp_path / "out.png", RenderSettings())
+
+    def test_render_reports_frame_times(self, tmp_path: Path) -> None:
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.glb"
+        scene.write_bytes(b"glTF")
+        output = tmp_path / "out.png"
+        stdout = (
+            "Loading scene\nframe 0: 40.0 ms\nframe 1: 2.0 ms\nframe 2: 4.0 ms\nframe 3: 3.0 ms\n"
+        )
+
+        def fake_render(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            # One warm-up frame plus three timed frames in a single process
+            assert cmd[cmd.index("--frames") + 1] == "4"
+            output.write_bytes(b"png")
+            return SubprocessResult(0, stdout, "", 0.5, 64.0)
+
+        adapter = self._make_adapter()
+        with (
+            patch("shutil.which", return_value="/usr/bin/gltf_viewer"),
+            patch("renderscope.adapters._version.iter_output_lines", return_value=iter(())),
+            patch(
+                "renderscope.adapters.filament.iter_output_lines",
+                side_effect=_output_lines("Usage: gltf_viewer [options]\n  --frames N  frames"),
+            ),
+            patch("renderscope.adapters.filament.run_subprocess", side_effect=fake_render),
+        ):
+            result = adapter.render(
+                scene, output, RenderSettings(extra={"frames": 3, "warmup_frames": 1})
+            )
+        assert result.metadata["frame_count"] == 3
+        assert result.metadata["warmup_frame_times_ms"] == [40.0]
+        assert result.metadata["frame_times_ms"] == [2.0, 4.0, 3.0]
+        assert result.metadata["average_frame_time_ms"] == 3.0
+        assert result.metadata["frame_time_stddev_ms"] == pytest.approx(0.816, abs=1e-3)
+        # Wall time, comparable with other adapters; the mean stays in metadata
+        assert result.render_time_seconds == 0.5
+
+    def test_render_single_frame_without_frames_option(self, tmp_path: Path) -> None:
+        """Viewers whose --help lacks --frames get the single-frame command."""
+        from renderscope.core.runner import SubprocessResult
+
+        scene = tmp_path / "scene.glb"
+        scene.write_bytes(b"glTF")
+        output = tmp_path / "out.png"
+        commands: list[list[str]] = []
+
+        def fake_render(cmd: list[str], **kwargs: object) -> SubprocessResult:
+            commands.append(cmd)
+            output.write_bytes(b"png")
+            return SubprocessResult(0, "", "", 0.5, 64.0)
+
+        adapter = self._make_adapter()
+        with (
+            patch("shutil.which", return_value="/usr/bin/gltf_viewer"),
+            patch("renderscope.adapters._version.iter_output_lines", return_value=iter(())),
+            patch(
+                "renderscope.adapters.filament.iter_output_lines",
+                side_effect=_output_lines("Usage: gltf_viewer [--frame-rate N] scene"),
+            ),
+            patch("renderscope.adapters.filament.run_subprocess", side_effect=fake_render),
+        ):
+            result = adapter.render(scene, output, RenderSettings(extra={"frames": 3}))
+        assert "--frames" not in commands[0]
+        assert result.metadata["frame_count"] == 1
+        assert "frame_times_ms" not in result.metadata
+
+    def test_build_command(self, tmp_path: Path) -> None:
+        from renderscope.adapters.filament import _build_command
+
+        scene, output = str(tmp_path / "scene.glb"), str(tmp_path / "out.png")
+        assert _build_command(scene, output, RenderSettings(width=64, height=32)) == [
+            "gltf_viewer",
+            "--headless",
+            "--width",
+            "64",
+            "--height",
+            "32",
+            "--screenshot",
+            output,
+            scene,
+        ]
+        settings = RenderSettings(width=64, height=32)
+        assert _build_command(scene, output, settings, 100) == [
+            "gltf_viewer",
+            "--headless",
+            "--width",
+            "64",
+            "--height",
+            "32",
+            "--frames",
+            "100",
+            "--screenshot",
+            output,
+            scene,
+        ]
+
     def test_detect_nothing_available(self) -> None:
         from renderscope.adapters.filament import FilamentAdapter
 
@@ -559,15 +1367,264 @@ class TestOSPRayAdapter:
         from renderscope.adapters.ospray import OSPRayAdapter
 
         adapter = OSPRayAdapter()
-        mock_result = MagicMock()
-        mock_result.stdout = "OSPRay Studio v3.1.0"
-        mock_result.stderr = ""
         with (
             patch("shutil.which", return_value="/usr/bin/ospStudio"),
-            patch("renderscope.adapters.ospray.run_subprocess", return_value=mock_result),
+            patch(
+                "renderscope.adapters._version.iter_output_lines",
+                side_effect=_output_lines("OSPRay Studio v3.1.0"),
+            ) as probe,
         ):
             version = adapter.detect()
         assert version == "3.1.0"
+        # Only ``--version`` is tried; ``--help`` would start Qt
+        assert [call.args[0][1] for call in probe.call_args_list] == ["--version"]
+
+    def test_detect_without_version_output(self) -> None:
+        from renderscope.adapters.ospray import OSPRayAdapter
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/ospStudio"),
+            patch(
+                "renderscope.adapters._version.iter_output_lines",
+                side_effect=_output_lines("Usage: ospStudio [options]"),
+            ) as probe,
+        ):
+            assert OSPRayAdapter().detect() == "unknown"
+        probe.assert_called_once()
+
+    def test_detect_prefers_examples_and_caches_probes(self) -> None:
+        from renderscope.adapters.ospray import OSPRayAdapter
+
+        def fake_which(name: str, path: str | None = None) -> str | None:
+            return f"/usr/bin/{name}" if name in ("ospTutorial", "ospBenchmark") else None
+
+        with (
+            patch("shutil.which", side_effect=fake_which) as which,
+            patch(
+                "renderscope.adapters._version.iter_output_lines",
+                side_effect=_output_lines("ospTutorial 3.0.0"),
+            ) as run,
+        ):
+            assert OSPRayAdapter().detect() == "3.0.0"
+            assert OSPRayAdapter().detect() == "3.0.0"
+        # One PATH lookup per tool, one version probe in total
+        assert which.call_count == 4
+        run.assert_called_once()
+
+    def test_thread_env_defaults_to_pinned_physical_cores(self) -> None:
+        from renderscope.adapters.ospray import _thread_env
+
+        with patch("renderscope.adapters.ospray.physical_core_count", return_value=8):
+            env = _thread_env(RenderSettings())
+        assert env == {
+            "OSPRAY_NUM_THREADS": "8",
+            "OMP_NUM_THREADS": "8",
+            "OMP_PLACES": "cores",
+            "OMP_PROC_BIND": "close",
+        }
+
+    def test_thread_env_respects_explicit_threads(self) -> None:
+        from renderscope.adapters.ospray import _thread_env
+
+        assert _thread_env(RenderSettings(threads=2)) == {"OSPRAY_NUM_THREADS": "2"}
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("always [madvise] never\n", "madvise"),
+            ("[always] madvise never\n", "always"),
+            ("always madvise [never]\n", "never"),
+            ("garbage\n", None),
+        ],
+    )
+    def test_transparent_hugepage_mode(
+        self, tmp_path: Path, content: str, expected: str | None
+    ) -> None:
+        from renderscope.adapters.ospray import _transparent_hugepage_mode
+
+        mode_file = tmp_path / "enabled"
+        mode_file.write_text(content)
+        with patch("renderscope.adapters.ospray._THP_MODE_PATH", str(mode_file)):
+            assert _transparent_hugepage_mode() == expected
+
+    def test_transparent_hugepage_mode_unavailable(self, tmp_path: Path) -> None:
+        from renderscope.adapters.ospray import _transparent_hugepage_mode
+
+        with patch("renderscope.adapters.ospray._THP_MODE_PATH", str(tmp_path / "missing")):
+            assert _transparent_hugepage_mode() is None
+
+    @pytest.mark.parametrize(
+        ("mode", "libc", "existing", "expected"),
+        [
+            ("madvise", ("glibc", "2.35"), None, {"GLIBC_TUNABLES": "glibc.malloc.hugetlb=1"}),
+            (
+                "madvise",
+                ("glibc", "2.39"),
+                "glibc.malloc.arena_max=2",
+                {"GLIBC_TUNABLES": "glibc.malloc.arena_max=2:glibc.malloc.hugetlb=1"},
+            ),
+            ("madvise", ("glibc", "2.39"), "glibc.malloc.hugetlb=1", {}),
+            ("madvise", ("glibc", "2.31"), None, {}),
+            ("madvise", ("", ""), None, {}),
+            ("always", ("glibc", "2.39"), None, {}),
+            ("never", ("glibc", "2.39"), None, {}),
+        ],
+    )
+    def test_hugepage_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mode: str,
+        libc: tuple[str, str],
+        existing: str | None,
+        expected: dict[str, str],
+    ) -> None:
+        from renderscope.adapters.ospray import _hugepage_env
+
+        if existing is None:
+            monkeypatch.delenv("GLIBC_TUNABLES", raising=False)
+        else:
+            monkeypatch.setenv("GLIBC_TUNABLES", existing)
+        with (
+            patch("renderscope.adapters.ospray._transparent_hugepage_mode", return_value=mode),
+            patch("renderscope.adapters.ospray.platform.libc_ver", return_value=libc),
+        ):
+            assert _hugepage_env() == expected
+
+    def test_build_commands(self) -> None:
+        from renderscope.adapters.ospray import OSPRayAdapter
+
+        settings = RenderSettings(width=640, height=480, samples=16)
+        assert OSPRayAdapter._build_studio_cmd("s.obj", "o.png", settings, "ao") == [
+            "ospStudio",
+            "--batch",
+            "--renderer",
+            "ao",
+            "--image",
+            "o.png",
+            "--size",
+            "640",
+            "480",
+            "--spp",
+            "16",
+            "s.obj",
+        ]
+        assert "--spp" not in OSPRayAdapter._build_studio_cmd(
+            "s.obj", "o.png", RenderSettings(), "ao"
+        )
+        assert OSPRayAdapter._build_example_cmd("ospTutorial", "s.obj", "o.png") == [
+            "ospTutorial",
+            "--image",
+            "o.png",
+            "s.obj",
+        ]
+
+    def test_python_api_reuses_setup_outside_timer(self, tmp_path: Path) -> None:
+        from renderscope.adapters.ospray import OSPRayAdapter, _IntegrationPath
+
+        scene = tmp_path / "scene.obj"
+        scene.write_text("# empty")
+        osp_mock = MagicMock()
+        osp_mock.FrameBuffer.return_value = MagicMock(
+            spec=["commit", "clear", "render_frame", "save"]
+        )
+        osp_mock.FrameBuffer.return_value.save.side_effect = lambda path: open(path, "wb").close()
+        adapter = OSPRayAdapter()
+        adapter._integration_path = _IntegrationPath.PYTHON_API
+
+        with (
+            patch.object(OSPRayAdapter, "detect", return_value="3.1.0"),
+            patch.dict("sys.modules", {"ospray": osp_mock}),
+            patch.dict("os.environ"),
+        ):
+            for name in ("a", "b"):
+                result = adapter.render(
+                    scene, tmp_path / f"{name}.png", RenderSettings(width=4, height=2, threads=2)
+                )
+            adapter.render(scene, tmp_path / "c.png", RenderSettings(width=8, height=2, threads=2))
+
+        osp_mock.init.assert_called_once()
+        osp_mock.Renderer.assert_called_once_with("pathtracer")
+        assert osp_mock.FrameBuffer.call_count == 2
+        osp_mock.FrameBuffer.return_value.clear.assert_called_once()
+        assert result.metadata["num_threads"] == 2
+        assert isinstance(result.metadata["setup_time_ns"], int)
+
+    def test_python_api_scopes_thread_env_to_init(self, tmp_path: Path) -> None:
+        import os
+
+        from renderscope.adapters.ospray import OSPRayAdapter, _IntegrationPath
+
+        scene = tmp_path / "scene.obj"
+        scene.write_text("# empty")
+        osp_mock = MagicMock()
+        seen: list[str | None] = []
+        osp_mock.init.side_effect = lambda: seen.append(os.environ.get("OSPRAY_NUM_THREADS"))
+        osp_mock.FrameBuffer.return_value = MagicMock(
+            spec=["commit", "clear", "render_frame", "save"]
+        )
+        osp_mock.FrameBuffer.return_value.save.side_effect = lambda path: open(path, "wb").close()
+        adapter = OSPRayAdapter()
+        adapter._integration_path = _IntegrationPath.PYTHON_API
+
+        with (
+            patch.object(OSPRayAdapter, "detect", return_value="3.1.0"),
+            patch.dict("sys.modules", {"ospray": osp_mock}),
+            patch.dict("os.environ", {"OSPRAY_NUM_THREADS": "7"}),
+        ):
+            adapter.render(scene, tmp_path / "a.png", RenderSettings(width=4, height=2, threads=2))
+            assert os.environ["OSPRAY_NUM_THREADS"] == "7"
+        assert seen == ["2"]
+
+    def test_python_api_does_not_reuse_unclearable_framebuffer(self, tmp_path: Path) -> None:
+        from renderscope.adapters.ospray import OSPRayAdapter, _IntegrationPath
+
+        scene = tmp_path / "scene.obj"
+        scene.write_text("# empty")
+        osp_mock = MagicMock()
+        osp_mock.FrameBuffer.return_value = MagicMock(spec=["commit", "render_frame", "save"])
+        osp_mock.FrameBuffer.return_value.save.side_effect = lambda path: open(path, "wb").close()
+        adapter = OSPRayAdapter()
+        adapter._integration_path = _IntegrationPath.PYTHON_API
+
+        with (
+            patch.object(OSPRayAdapter, "detect", return_value="3.1.0"),
+            patch.dict("sys.modules", {"ospray": osp_mock}),
+            patch.dict("os.environ"),
+        ):
+            for name in ("a", "b"):
+                adapter.render(
+                    scene, tmp_path / f"{name}.png", RenderSettings(width=4, height=2, threads=2)
+                )
+
+        assert osp_mock.FrameBuffer.call_count == 2
+
+    def test_save_framebuffer_writes_mapped_pixels(self, tmp_path: Path) -> None:
+        import numpy as np
+        from PIL import Image
+
+        from renderscope.adapters.ospray import _save_framebuffer
+
+        pixels = np.zeros((2, 3, 4), dtype=np.uint8)
+        pixels[0] = (255, 0, 0, 255)  # bottom row in OSPRay's layout
+        framebuffer = MagicMock()
+        framebuffer.map.return_value = pixels.reshape(-1)
+        output = tmp_path / "out.png"
+
+        _save_framebuffer(MagicMock(), framebuffer, output, 3, 2)
+
+        saved = np.asarray(Image.open(output))
+        assert saved.shape == (2, 3, 3)
+        assert tuple(saved[1, 0]) == (255, 0, 0)
+        assert tuple(saved[0, 0]) == (0, 0, 0)
+        framebuffer.unmap.assert_called_once()
+        framebuffer.save.assert_not_called()
+
+    def test_save_framebuffer_without_map_uses_ospray_writer(self, tmp_path: Path) -> None:
+        from renderscope.adapters.ospray import _save_framebuffer
+
+        framebuffer = MagicMock(spec=["save"])
+        _save_framebuffer(MagicMock(), framebuffer, tmp_path / "out.png", 3, 2)
+        framebuffer.save.assert_called_once_with(str(tmp_path / "out.png"))
 
     def test_detect_nothing_available(self) -> None:
         from renderscope.adapters.ospray import OSPRayAdapter
@@ -594,6 +1651,98 @@ class TestOSPRayAdapter:
             adapter.render(scene, tmp_path / "out.exr", RenderSettings())
 
 
+# ===================================================================
+# Shared discovery and version probe tests
+# ===================================================================
+
+
+class TestFindAvailable:
+    """Tests for the concurrent multi-tool PATH lookup."""
+
+    def test_preserves_order_and_filters(self) -> None:
+        from renderscope.adapters._discovery import find_available
+
+        def fake_which(name: str, path: str | None = None) -> str | None:
+            return None if name == "cmgen" else f"/usr/bin/{name}"
+
+        with patch("shutil.which", side_effect=fake_which) as which:
+            names = ("gltf_viewer", "matc", "cmgen", "filamesh")
+            assert find_available(names) == ("gltf_viewer", "matc", "filamesh")
+            assert find_available(names) == ("gltf_viewer", "matc", "filamesh")
+        assert which.call_count == 4
+
+
+class TestSearchPath:
+    """Tests for the PATH snapshot used by binary lookups."""
+
+    def test_drops_duplicate_and_missing_directories(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        import os
+
+        from renderscope.adapters._discovery import _search_path
+
+        dir_a, dir_b = str(tmp_path / "a"), str(tmp_path / "b")
+        os.mkdir(dir_a)
+        os.mkdir(dir_b)
+        entries = [dir_a, str(tmp_path / "missing"), "", dir_b, dir_a, ""]
+        monkeypatch.setenv("PATH", os.pathsep.join(entries))
+        assert _search_path().split(os.pathsep) == [dir_a, "", dir_b]
+
+
+class TestImportOptional:
+    """Tests for the once-per-process optional binding import."""
+
+    def test_missing_module_is_none(self) -> None:
+        from renderscope.adapters._discovery import import_optional
+
+        assert import_optional("renderscope_no_such_binding") is None
+
+    def test_import_is_cached(self) -> None:
+        from renderscope.adapters._discovery import import_optional
+
+        with patch("importlib.import_module", return_value=MagicMock()) as import_module:
+            first = import_optional("pyluxcore")
+            assert import_optional("pyluxcore") is first
+        import_module.assert_called_once_with("pyluxcore")
+
+
+class TestProbeVersion:
+    """Tests for the shared ``--version`` / ``--help`` probe."""
+
+    def test_falls_back_to_help(self) -> None:
+        from renderscope.adapters._version import probe_version
+
+        outputs = _output_lines("unknown option --version", "Usage: matc [options]\nmatc v1.51.2")
+        with patch(
+            "renderscope.adapters._version.iter_output_lines", side_effect=outputs
+        ) as stream:
+            assert probe_version("matc") == "1.51.2"
+        assert [call.args[0] for call in stream.call_args_list] == [
+            ["matc", "--version"],
+            ["matc", "--help"],
+        ]
+
+    def test_prefers_announcing_line(self) -> None:
+        from renderscope.adapters._version import probe_version
+
+        help_text = "Usage: gltf_viewer [options]\n  --ibl 1.0 intensity\ngltf_viewer v1.32.0\n"
+        with patch(
+            "renderscope.adapters._version.iter_output_lines",
+            side_effect=_output_lines(help_text),
+        ):
+            assert probe_version("/opt/bin/gltf_viewer") == "1.32.0"
+
+    def test_missing_binary(self) -> None:
+        from renderscope.adapters._version import probe_version
+
+        with patch(
+            "renderscope.adapters._version.iter_output_lines", side_effect=FileNotFoundError
+        ) as stream:
+            assert probe_version("matc") is None
+        assert stream.call_count == 1
+
+
 # ===================================================================
 # All-adapter registration tests
 # ===================================================================
@@ -49,7 +49,7 @@ class TestAdapterInterface:
     def test_all_have_supported_formats(self, all_adapters: list[RendererAdapter]) -> None:
         for adapter in all_adapters:
             formats = adapter.supported_formats()
-            assert isinstance(formats, list)
+            assert isinstance(formats, tuple)
             assert len(formats) > 0, f"{adapter.name} has no supported formats"
             for fmt in formats:
                 assert isinstance(fmt, str)
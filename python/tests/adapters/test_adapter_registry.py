@@ -101,6 +101,20 @@ class _FailingDetectAdapter(RendererAdapter):
         raise NotImplementedError
 
 
+class _CountingAdapter(_MockAdapter):
+    """A mock adapter that counts its detect() calls."""
+
+    calls = 0
+
+    @property
+    def name(self) -> str:
+        return "counting-renderer"
+
+    def detect(self) -> str | None:
+        type(self).calls += 1
+        return "2.0.0"
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -182,6 +196,60 @@ class TestAdapterRegistry:
         detection = fresh_registry.detect_all()
         assert detection["failing-detector"] is None
 
+    def test_detect_single(self, fresh_registry: AdapterRegistry) -> None:
+        fresh_registry.register(_MockAdapter)
+        fresh_registry.register(_FailingDetectAdapter)
+        assert fresh_registry.detect("mock-renderer") == "1.0.0"
+        assert fresh_registry.detect("failing-detector") is None
+        assert fresh_registry.detect("not-registered") is None
+
+    def test_detect_single_probes_once(
+        self, fresh_registry: AdapterRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """detect() should cache its result and detect_all() should reuse it."""
+        monkeypatch.setattr(_CountingAdapter, "calls", 0)
+        fresh_registry.register(_CountingAdapter)
+        fresh_registry.register(_MockAdapter)
+        assert fresh_registry.detect("counting-renderer") == "2.0.0"
+        assert fresh_registry.detect("counting-renderer") == "2.0.0"
+        assert fresh_registry.detect_all()["counting-renderer"] == "2.0.0"
+        assert _CountingAdapter.calls == 1
+
+    def test_detect_single_survives_lazy_initialization(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Adapter discovery on a listing call keeps earlier detect() results."""
+        monkeypatch.setattr(_CountingAdapter, "calls", 0)
+        monkeypatch.setattr("renderscope.adapters._adapter_names", lambda: ["counting-renderer"])
+        monkeypatch.setattr(
+            "renderscope.adapters._load_adapter_class",
+            lambda name: _CountingAdapter if name == "counting-renderer" else None,
+        )
+        registry = AdapterRegistry()
+        assert registry.detect("counting-renderer") == "2.0.0"
+        assert registry.get_names() == ["counting-renderer"]
+        assert registry.detect_all() == {"counting-renderer": "2.0.0"}
+        assert _CountingAdapter.calls == 1
+
+    def test_detect_single_uses_detect_all_results(
+        self, fresh_registry: AdapterRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_CountingAdapter, "calls", 0)
+        fresh_registry.register(_CountingAdapter)
+        fresh_registry.detect_all()
+        assert fresh_registry.detect("counting-renderer") == "2.0.0"
+        assert _CountingAdapter.calls == 1
+
+    def test_clear_cache_resets_single_detection(
+        self, fresh_registry: AdapterRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_CountingAdapter, "calls", 0)
+        fresh_registry.register(_CountingAdapter)
+        fresh_registry.detect("counting-renderer")
+        fresh_registry.clear_cache()
+        fresh_registry.detect("counting-renderer")
+        assert _CountingAdapter.calls == 2
+
     def test_overwrite_registration(self, fresh_registry: AdapterRegistry) -> None:
         """Re-registering the same adapter should overwrite."""
         fresh_registry.register(_MockAdapter)
@@ -222,3 +290,62 @@ class TestGlobalRegistry:
         adapter = registry.get("mock")
         assert adapter is not None
         assert adapter.is_mock is True
+
+
+class TestLazyLoading:
+    """Tests for per-adapter lazy loading of built-in adapters."""
+
+    def test_get_loads_only_requested_adapter(self) -> None:
+        reg = AdapterRegistry()
+        adapter = reg.get("pbrt")
+        assert adapter is not None
+        assert adapter.name == "pbrt"
+        assert list(reg._adapters) == ["pbrt"]
+        assert reg._initialized is False
+
+    def test_get_unknown_does_not_load_everything(self) -> None:
+        reg = AdapterRegistry()
+        assert reg.get("nonexistent") is None
+        assert reg._adapters == {}
+
+    def test_listing_keeps_declaration_order(self) -> None:
+        from renderscope.adapters import _ADAPTER_CLASSES
+
+        reg = AdapterRegistry()
+        reg.get("mock")
+        reg.register(_MockAdapter)
+        names = [a.name for a in reg.list_all()]
+        assert names == [*_ADAPTER_CLASSES, "mock-renderer"]
+
+
+_ENTRY_POINT_SPECS = {"mock-renderer": f"{__name__}:_MockAdapter"}
+
+
+class TestEntryPointAdapters:
+    """Tests for adapters declared in the ``renderscope.adapters`` group."""
+
+    def test_get_resolves_entry_point(self) -> None:
+        from unittest.mock import patch
+
+        reg = AdapterRegistry()
+        with patch("renderscope.adapters._entry_point_adapters", return_value=_ENTRY_POINT_SPECS):
+            adapter = reg.get("mock-renderer")
+        assert isinstance(adapter, _MockAdapter)
+
+    def test_listing_appends_entry_points(self) -> None:
+        from unittest.mock import patch
+
+        from renderscope.adapters import _ADAPTER_CLASSES
+
+        reg = AdapterRegistry()
+        with patch("renderscope.adapters._entry_point_adapters", return_value=_ENTRY_POINT_SPECS):
+            names = [a.name for a in reg.list_all()]
+        assert names == [*_ADAPTER_CLASSES, "mock-renderer"]
+
+    def test_builtin_lookup_skips_metadata(self) -> None:
+        from unittest.mock import patch
+
+        reg = AdapterRegistry()
+        with patch("renderscope.adapters._entry_point_adapters") as entry_points:
+            assert reg.get("pbrt") is not None
+        entry_points.assert_not_called()
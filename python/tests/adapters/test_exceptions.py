@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from renderscope.adapters.exceptions import (
@@ -95,3 +97,9 @@ class TestSceneFormatError:
     def test_inherits_from_exception(self) -> None:
         err = SceneFormatError("test", "/p", "f", ["g"])
         assert isinstance(err, Exception)
+
+    def test_pickle_roundtrip(self) -> None:
+        err = SceneFormatError("PBRT v4", "/scene.obj", "obj", ("pbrt",))
+        restored = pickle.loads(pickle.dumps(err))
+        assert restored.scene_path == "/scene.obj"
+        assert str(restored) == str(err)
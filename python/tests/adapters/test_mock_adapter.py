@@ -42,7 +42,7 @@ class TestMockAdapterInterface:
     def test_supported_formats_non_empty(self) -> None:
         adapter = MockRendererAdapter(sleep_seconds=0.0)
         formats = adapter.supported_formats()
-        assert isinstance(formats, list)
+        assert isinstance(formats, tuple)
         assert len(formats) > 0
         assert all(isinstance(f, str) for f in formats)
 
@@ -104,6 +104,22 @@ class TestMockAdapterRender:
         adapter.render(scene, output, RenderSettings(width=8, height=8))
         assert output.is_file()
 
+    def test_render_batch_default_runs_each_job(self, tmp_path: Path) -> None:
+        """The base render_batch() should render every job in order."""
+        from renderscope.adapters.base import RenderJob
+
+        adapter = MockRendererAdapter(sleep_seconds=0.0)
+        scene = tmp_path / "scene.pbrt"
+        scene.write_text("# mock", encoding="utf-8")
+        jobs = [
+            RenderJob(scene, tmp_path / f"out_{i}.png", RenderSettings(width=8, height=8))
+            for i in range(3)
+        ]
+
+        results = adapter.render_batch(jobs)
+        assert [r.output_path for r in results] == [str(job.output_path) for job in jobs]
+        assert all(job.output_path.is_file() for job in jobs)
+
 
 class TestMockAdapterBaseClass:
     """Tests to verify the base class is_mock property works correctly."""
@@ -15,6 +15,7 @@ from PIL import Image
 from typer.testing import CliRunner
 
 from renderscope.cli.main import app
+from renderscope.core.metrics import ImageMetrics
 
 pytestmark = pytest.mark.cli
 
@@ -174,8 +175,30 @@ class TestCompareOutputFormats:
         assert "mse" in data["metrics"]
         assert "reference" in data
         assert "test" in data
-        assert "width" in data
-        assert "height" in data
+        assert data["width"] == 64
+        assert data["height"] == 64
+
+    def test_json_text_is_stable(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Small floats, NaN, infinity and non-ASCII paths keep their exact text."""
+        from pathlib import Path
+
+        from renderscope.cli.compare import _print_json
+
+        metrics = {"mse": 1e-05, "psnr": float("inf"), "flip": float("nan")}
+        _print_json(Path("r\u00e9f.png"), Path("test.png"), metrics, (2, 4))
+        assert capsys.readouterr().out == (
+            "{\n"
+            '  "reference": "r\\u00e9f.png",\n'
+            '  "test": "test.png",\n'
+            '  "width": 4,\n'
+            '  "height": 2,\n'
+            '  "metrics": {\n'
+            '    "mse": 1e-05,\n'
+            '    "psnr": null,\n'
+            '    "flip": NaN\n'
+            "  }\n"
+            "}\n"
+        )
 
     def test_csv_format(self, image_pair: tuple[Path, Path]) -> None:
         """CSV output should have a header row and a data row."""
@@ -265,6 +288,39 @@ class TestCompareOutputImages:
         assert diff_path.is_file()
         assert heatmap_path.is_file()
 
+    def test_output_images_reuse_loaded_pair(
+        self,
+        image_pair: tuple[Path, Path],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Each input is decoded once, even when output images are requested."""
+        from renderscope.cli import compare
+
+        ref, test = image_pair
+        loaded: list[Path] = []
+        original_load = compare.load_image
+
+        def _counting_load(path: Path) -> np.ndarray:
+            loaded.append(path)
+            return original_load(path)
+
+        monkeypatch.setattr(compare, "load_image", _counting_load)
+        result = runner.invoke(
+            app,
+            [
+                "compare",
+                str(ref),
+                str(test),
+                "--diff-image",
+                str(tmp_path / "diff.png"),
+                "--ssim-heatmap",
+                str(tmp_path / "ssim.png"),
+            ],
+        )
+        assert result.exit_code == 0
+        assert loaded == [ref, test]
+
 
 # ---------------------------------------------------------------------------
 # Directory comparison tests
@@ -327,6 +383,124 @@ class TestCompareDirectory:
         # The "extra" file in dir_a should be reported as unmatched.
         assert "extra" in result.output.lower() or "unmatched" in result.output.lower()
 
+    def test_recursive_csv_single_header(self, image_dirs: tuple[Path, Path]) -> None:
+        """All pairs share one CSV header, written before the first row."""
+        dir_a, dir_b = image_dirs
+        result = runner.invoke(
+            app,
+            ["compare", str(dir_a), str(dir_b), "--recursive", "--format", "csv"],
+        )
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "reference,test,psnr,ssim,mse"
+        assert sum(line.startswith("reference,") for line in lines) == 1
+        assert sum(line.startswith(str(dir_a / "scene")) for line in lines) == 3
+
+    def test_recursive_integer_metrics_match_float_path(
+        self,
+        image_dirs: tuple[Path, Path],
+    ) -> None:
+        """PSNR/MSE-only runs use 8-bit pixels but report the same values."""
+        dir_a, dir_b = image_dirs
+        result = runner.invoke(
+            app,
+            [
+                "compare",
+                str(dir_a),
+                str(dir_b),
+                "--recursive",
+                "-m",
+                "mse",
+                "-m",
+                "psnr",
+                "-f",
+                "json",
+            ],
+        )
+        assert result.exit_code == 0
+        first = json.loads(result.stdout[: result.stdout.index("}\n}") + 3])
+        assert list(first["metrics"]) == ["mse", "psnr"]
+        assert (first["width"], first["height"]) == (32, 32)
+
+        from renderscope.utils.image_io import load_image
+
+        ref = load_image(dir_a / "scene1.png")
+        tst = load_image(dir_b / "scene1.png")
+        assert first["metrics"]["mse"] == pytest.approx(ImageMetrics.mse(ref, tst), rel=1e-5)
+        assert first["metrics"]["psnr"] == pytest.approx(ImageMetrics.psnr(ref, tst), rel=1e-5)
+
+    def test_recursive_dark_pair_mse_matches_float_path(self, tmp_path: Path) -> None:
+        """8-bit images with values of at most 1 are scored like the float path."""
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        for directory, value in ((dir_a, 0), (dir_b, 1)):
+            pixels = np.full((8, 8, 3), value, dtype=np.uint8)
+            Image.fromarray(pixels, mode="RGB").save(str(directory / "dark.png"))
+
+        reported = []
+        for metrics in (["-m", "mse"], ["-m", "mse", "-m", "ssim"]):
+            result = runner.invoke(
+                app, ["compare", str(dir_a), str(dir_b), "--recursive", *metrics, "-f", "json"]
+            )
+            assert result.exit_code == 0
+            reported.append(json.loads(result.stdout)["metrics"]["mse"])
+        assert reported == [pytest.approx(1.0), pytest.approx(1.0)]
+
+    def test_index_images_filters_by_name(self, tmp_path: Path) -> None:
+        """Only supported extensions (any case) are indexed, keyed by stem."""
+        from renderscope.cli.compare import _index_images
+
+        for name in ("b.PNG", "a.v2.exr", "notes.txt", ".png", "noext"):
+            (tmp_path / name).write_bytes(b"")
+        index = _index_images(tmp_path)
+        assert index == {"a.v2": tmp_path / "a.v2.exr", "b": tmp_path / "b.PNG"}
+
+    @pytest.mark.parametrize("cpus", [1, 4], ids=["prefetch", "process-pool"])
+    def test_recursive_keeps_order_and_skips_bad_pairs(
+        self,
+        image_dirs: tuple[Path, Path],
+        cpus: int,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Pairs computed concurrently are still reported in sorted order."""
+        monkeypatch.setattr("os.cpu_count", lambda: cpus)
+        dir_a, dir_b = image_dirs
+        # A size mismatch makes scene2 fail its metrics.
+        small = np.zeros((16, 16, 3), dtype=np.uint8)
+        Image.fromarray(small, mode="RGB").save(str(dir_b / "scene2.png"))
+
+        result = runner.invoke(
+            app,
+            ["compare", str(dir_a), str(dir_b), "--recursive", "--format", "csv"],
+        )
+        assert result.exit_code == 0
+        refs = [
+            line.split(",")[0]
+            for line in result.stdout.splitlines()
+            if line.split(",")[0].endswith(".png")
+        ]
+        assert refs == [str(dir_a / "scene1.png"), str(dir_a / "scene3.png")]
+
+    def test_lpips_pairs_stay_in_process(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """LPIPS is never spread over worker processes, one model each."""
+        from renderscope.cli import compare
+
+        monkeypatch.setattr("os.cpu_count", lambda: 4)
+        monkeypatch.setattr(
+            compare, "ProcessPoolExecutor", lambda **kwargs: pytest.fail("process pool used")
+        )
+        monkeypatch.setattr(
+            compare, "_iter_prefetched_outcomes", lambda refs, tests, names: iter(refs)
+        )
+        paths = [tmp_path / "a.png", tmp_path / "b.png"]
+
+        outcomes = list(compare._iter_pair_outcomes(paths, paths, ["psnr", "lpips"]))
+        assert outcomes == paths
+
 
 # ---------------------------------------------------------------------------
 # Error handling tests
@@ -361,7 +535,9 @@ class TestCompareErrors:
                 "bogus",
             ],
         )
-        assert result.exit_code != 0
+        # Rejected while parsing arguments, before any image is read.
+        assert result.exit_code == 2
+        assert "bogus" in _strip_ansi(result.output)
 
     def test_invalid_colormap(self, image_pair: tuple[Path, Path]) -> None:
         """Using an invalid colormap should show an error."""
@@ -376,10 +552,95 @@ class TestCompareErrors:
                 "jet",
             ],
         )
-        assert result.exit_code != 0
+        assert result.exit_code == 2
+        assert "jet" in _strip_ansi(result.output)
+
+    def test_choices_case_insensitive(self, image_pair: tuple[Path, Path]) -> None:
+        """Metric and colormap names are matched case-insensitively."""
+        ref, test = image_pair
+        result = runner.invoke(
+            app,
+            ["compare", str(ref), str(test), "-m", "PSNR", "--colormap", "Magma", "-f", "json"],
+        )
+        assert result.exit_code == 0
+        assert list(json.loads(result.stdout)["metrics"]) == ["psnr"]
 
     def test_missing_second_argument(self, image_pair: tuple[Path, Path]) -> None:
         """Invoking compare with only one file path should produce an error."""
         ref, _test = image_pair
         result = runner.invoke(app, ["compare", str(ref)])
         assert result.exit_code != 0
+
+
+# ---------------------------------------------------------------------------
+# Quality-rating helper tests
+# ---------------------------------------------------------------------------
+
+
+class TestQualityRating:
+    """Tests for the table-driven quality labels and bar scores."""
+
+    @pytest.mark.parametrize(
+        ("metric", "value", "expected"),
+        [
+            ("psnr", 19.9, "Poor"),
+            ("psnr", 20.0, "Fair"),
+            ("psnr", 40.0, "Excellent"),
+            ("ssim", 0.85, "Good"),
+            ("ssim", 0.5, "Poor"),
+            ("lpips", 0.05, "Excellent"),
+            ("lpips", 0.06, "Good"),
+            ("lpips", 0.31, "Poor"),
+            ("mse", 0.01, ""),
+            ("psnr", float("inf"), "Identical"),
+        ],
+    )
+    def test_label_boundaries(self, metric: str, value: float, expected: str) -> None:
+        """Thresholds are inclusive on the better side of each band."""
+        from renderscope.cli.compare import _quality_label
+
+        assert _quality_label(metric, value) == expected
+
+    @pytest.mark.parametrize(
+        ("metric", "value", "expected"),
+        [
+            ("psnr", 25.0, 0.5),
+            ("psnr", 80.0, 1.0),
+            ("ssim", -0.2, 0.0),
+            ("lpips", 0.25, 0.5),
+            ("lpips", 0.9, 0.0),
+            ("mse", 0.5, 0.0),
+        ],
+    )
+    def test_scores(self, metric: str, value: float, expected: float) -> None:
+        """Scores follow each metric's line, clamped to [0, 1]."""
+        from renderscope.cli.compare import _quality_score
+
+        assert _quality_score(metric, value) == pytest.approx(expected)
+
+
+class TestDirectorySummary:
+    """Tests for the averaged summary table of a directory comparison."""
+
+    def test_reductions_skip_infinite_and_missing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Mean/min/max ignore inf PSNR values; an all-missing metric shows N/A."""
+        import io
+
+        from rich.console import Console
+
+        from renderscope.cli import compare
+
+        buf = io.StringIO()
+        monkeypatch.setattr(compare, "console", Console(file=buf, width=120))
+        results = [
+            {"psnr": 30.0, "mse": 0.5},
+            {"psnr": float("inf"), "mse": 0.25},
+            {"psnr": 40.0, "mse": 0.75},
+        ]
+        compare._print_directory_summary(results, ["psnr", "mse", "lpips"], 4)
+
+        cells = [line.replace("\u2502", " ").split() for line in buf.getvalue().splitlines()]
+        rows = {row[0]: row for row in cells if row}
+        assert rows["PSNR"][1:] == ["35.00", "dB", "30.00", "dB", "40.00", "dB"]
+        assert rows["MSE"][1:] == ["0.500000", "0.250000", "0.750000"]
+        assert rows["LPIPS"][1:] == ["N/A", "N/A", "N/A"]
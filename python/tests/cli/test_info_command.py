@@ -5,7 +5,9 @@ from __future__ import annotations
 import pytest
 from typer.testing import CliRunner
 
+from renderscope.cli.info import _fuzzy_match, _levenshtein_le, _lower_index, _resolve_renderer_id
 from renderscope.cli.main import app
+from renderscope.core.data_loader import clear_cache, get_renderer_ids, load_all_renderers
 
 pytestmark = pytest.mark.cli
 
@@ -38,3 +40,113 @@ class TestInfoCommand:
         result = runner.invoke(app, ["info", "--help"])
         assert result.exit_code == 0
         assert "RENDERER" in result.output or "renderer" in result.output.lower()
+
+
+class TestResolveRendererId:
+    """Tests for query-to-ID resolution."""
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("pbrt", "pbrt"),
+            ("  PBRT ", "pbrt"),
+            ("mitsuba 3", "mitsuba3"),
+            ("cycles", "blender-cycles"),
+            ("3DGS", "3d-gaussian-splatting"),
+            ("no-such-renderer", None),
+        ],
+    )
+    def test_resolves(self, query: str, expected: str | None) -> None:
+        assert _resolve_renderer_id(query) == expected
+
+    def test_every_id_and_name_resolves(self) -> None:
+        for r in load_all_renderers():
+            assert _resolve_renderer_id(r.id.upper()) == r.id
+            assert _resolve_renderer_id(r.name) is not None
+
+    def test_index_rebuilt_after_clear_cache(self) -> None:
+        first = _lower_index()
+        assert _lower_index() is first
+        clear_cache()
+        assert _lower_index() is not first
+        assert _lower_index() == first
+
+
+def _two_scan_match(query: str, candidates: list[str], max_results: int = 5) -> list[str]:
+    """The original prefix/substring/display-name ranking, for comparison."""
+    q = query.lower()
+    prefix = [c for c in candidates if c.lower().startswith(q)]
+    substring = [c for c in candidates if not c.lower().startswith(q) and q in c.lower()]
+    for r in load_all_renderers():
+        if q in r.name.lower() and r.id not in prefix and r.id not in substring:
+            substring.append(r.id)
+    return (prefix + substring)[:max_results]
+
+
+class TestFuzzyMatch:
+    """Tests for the single-pass suggestion ranking."""
+
+    @pytest.mark.parametrize("query", ["pbr", "ray", "RENDER", "gauss", "3d", "e"])
+    def test_matches_two_scan_ranking(self, query: str) -> None:
+        ids = get_renderer_ids()
+        expected = _two_scan_match(query, ids)
+        # Typo suggestions may follow the substring matches, never precede them
+        assert _fuzzy_match(query, ids)[: len(expected)] == expected
+
+    def test_prefix_before_substring(self) -> None:
+        assert _fuzzy_match("3d", ["splat-3d", "3d-slicer"]) == ["3d-slicer", "splat-3d"]
+
+    def test_display_name_match(self) -> None:
+        assert _fuzzy_match("mitsuba 3", get_renderer_ids()) == ["mitsuba3"]
+
+    def test_typo_suggestions(self) -> None:
+        assert _fuzzy_match("mitsba", get_renderer_ids())[0] == "mitsuba3"
+        assert _fuzzy_match("pbtr", ["pbrt", "smallpt"]) == ["pbrt"]
+
+    def test_no_suggestions_for_distant_query(self) -> None:
+        assert _fuzzy_match("zzzzzz", get_renderer_ids()) == []
+
+    def test_unknown_renderer_suggests_typo_fix(self) -> None:
+        result = runner.invoke(app, ["info", "mitsba"])
+        assert result.exit_code == 1
+        assert "mitsuba3" in result.output
+
+
+def _full_osa(a: str, b: str) -> int:
+    """Unbounded optimal-string-alignment distance, for comparison."""
+    d = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(len(a) + 1):
+        d[i][0] = i
+    for j in range(len(b) + 1):
+        d[0][j] = j
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d[i][j] = min(d[i][j], d[i - 2][j - 2] + 1)
+    return d[len(a)][len(b)]
+
+
+class TestLevenshteinLe:
+    """Tests for the banded edit-distance helper."""
+
+    @pytest.mark.parametrize(
+        ("a", "b"),
+        [
+            ("", ""),
+            ("", "ab"),
+            ("pbrt", "pbrt"),
+            ("pbtr", "pbrt"),
+            ("mitsba", "mitsuba3"),
+            ("cycels", "cycles"),
+            ("abcdef", "badcfe"),
+            ("ospray", "optix"),
+            ("ca", "abc"),
+            ("kitten", "sitting"),
+        ],
+    )
+    @pytest.mark.parametrize("k", [0, 1, 2, 3])
+    def test_matches_full_distance(self, a: str, b: str, k: int) -> None:
+        expected = _full_osa(a, b)
+        assert _levenshtein_le(a, b, k) == (expected if expected <= k else None)
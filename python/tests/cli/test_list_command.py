@@ -55,6 +55,13 @@ class TestListCommand:
         assert "name" in first
         assert "technique" in first
 
+    def test_list_json_piped_text(self) -> None:
+        """Piped JSON should be plain two-space-indented text, like print_json."""
+        result = runner.invoke(app, ["list", "--format", "json"])
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert result.output == json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
     def test_list_json_with_filter(self) -> None:
         result = runner.invoke(app, ["list", "--format", "json", "--technique", "path_tracing"])
         assert result.exit_code == 0
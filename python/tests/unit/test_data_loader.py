@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from renderscope.core import data_loader
 from renderscope.core.data_loader import (
+    clear_cache,
     get_renderer_ids,
+    iter_renderer_ids,
     load_all_renderers,
     load_renderer,
 )
 from renderscope.models.renderer import RendererMetadata
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
 
 class TestLoadAllRenderers:
     """Tests for load_all_renderers()."""
@@ -36,6 +48,36 @@ class TestLoadAllRenderers:
         second = load_all_renderers()
         assert first is second
 
+    def test_reuses_single_renderer_loads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Files already parsed by load_renderer() should not be parsed again."""
+        pbrt = load_renderer("pbrt")
+        parsed: list[str] = []
+        original = data_loader._parse_renderer_file
+
+        def _spy(json_file: Path) -> RendererMetadata | None:
+            parsed.append(json_file.stem)
+            return original(json_file)
+
+        monkeypatch.setattr(data_loader, "_parse_renderer_file", _spy)
+        renderers = load_all_renderers()
+        assert any(r is pbrt for r in renderers)
+        assert sorted(parsed) == [rid for rid in get_renderer_ids() if rid != "pbrt"]
+
+    def test_concurrent_callers_share_one_load(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Threads racing on a cold cache should get one list, parsed once."""
+        parsed: list[str] = []
+        original = data_loader._parse_renderer_file
+
+        def _spy(json_file: Path) -> RendererMetadata | None:
+            parsed.append(json_file.stem)
+            return original(json_file)
+
+        monkeypatch.setattr(data_loader, "_parse_renderer_file", _spy)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: load_all_renderers(), range(4)))
+        assert all(r is results[0] for r in results)
+        assert sorted(parsed) == get_renderer_ids()
+
     def test_known_renderers_present(self) -> None:
         """Well-known renderers like PBRT and Mitsuba 3 should be loaded."""
         ids = {r.id for r in load_all_renderers()}
@@ -64,6 +106,49 @@ class TestLoadRenderer:
         """Loading a nonexistent renderer should return None."""
         assert load_renderer("does-not-exist") is None
 
+    def test_matches_linear_scan(self) -> None:
+        """The ID index should agree with a scan of load_all_renderers()."""
+        for expected in load_all_renderers():
+            assert load_renderer(expected.id) is next(
+                r for r in load_all_renderers() if r.id == expected.id
+            )
+
+    def test_index_rebuilt_after_clear_cache(self) -> None:
+        """clear_cache() should drop the ID index along with the list."""
+        before = load_renderer("pbrt")
+        clear_cache()
+        after = load_renderer("pbrt")
+        assert after is not None
+        assert after is not before
+        assert after.id == "pbrt"
+
+    def test_parses_only_requested_file(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A single lookup should parse one data file, and only once."""
+        parsed: list[str] = []
+        original = data_loader._parse_renderer_file
+
+        def _spy(json_file: Path) -> RendererMetadata | None:
+            parsed.append(json_file.stem)
+            return original(json_file)
+
+        monkeypatch.setattr(data_loader, "_parse_renderer_file", _spy)
+        assert load_renderer("pbrt") is load_renderer("pbrt")
+        assert parsed == ["pbrt"]
+
+    def test_malformed_file_skipped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A broken file should be listed by ID but load as None."""
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+        monkeypatch.setattr(data_loader, "get_data_dir", lambda: tmp_path)
+        assert get_renderer_ids() == ["broken"]
+        assert load_renderer("broken") is None
+        assert load_all_renderers() == []
+
+    def test_loads_matches_stdlib_json(self) -> None:
+        """The bytes parser should agree with the stdlib on every data file."""
+        for json_file in data_loader._scan_renderer_files().values():
+            text = json_file.read_text(encoding="utf-8")
+            assert data_loader._loads(json_file.read_bytes()) == json.loads(text)
+
     def test_renderer_fields_populated(self) -> None:
         """Loaded renderer data should have all required fields populated."""
         renderer = load_renderer("pbrt")
@@ -96,3 +181,49 @@ class TestGetRendererIds:
         ids = get_renderer_ids()
         for renderer_id in ids:
             assert not renderer_id.startswith("_")
+
+    def test_iter_matches_loaded_ids(self) -> None:
+        """File-name IDs should match the IDs inside the data files."""
+        assert list(iter_renderer_ids()) == sorted(r.id for r in load_all_renderers())
+
+    def test_cached(self) -> None:
+        """Repeated calls should reuse the sorted list until clear_cache()."""
+        first = get_renderer_ids()
+        assert get_renderer_ids() is first
+        clear_cache()
+        assert get_renderer_ids() is not first
+        assert get_renderer_ids() == first
+
+
+class TestCatalogBundle:
+    """Tests for loading the catalog from a wheel's pre-built bundle."""
+
+    def _make_data_dir(self, tmp_path: Path, ids: list[str]) -> None:
+        source = data_loader._scan_renderer_files()
+        for renderer_id in ids:
+            (tmp_path / f"{renderer_id}.json").write_bytes(source[renderer_id].read_bytes())
+        clear_cache()
+
+    def test_full_load_reads_bundle(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Bundled renderers should not be parsed from their own files."""
+        self._make_data_dir(tmp_path, ["pbrt", "mitsuba3"])
+        bundle = {
+            rid: json.loads((tmp_path / f"{rid}.json").read_text()) for rid in ["pbrt", "mitsuba3"]
+        }
+        (tmp_path / "_bundle.json").write_text(json.dumps(bundle), encoding="utf-8")
+        monkeypatch.setattr(data_loader, "get_data_dir", lambda: tmp_path)
+        parsed: list[str] = []
+        monkeypatch.setattr(data_loader, "_parse_renderer_file", lambda p: parsed.append(p.stem))
+
+        assert [r.id for r in load_all_renderers()] == ["mitsuba3", "pbrt"]
+        assert parsed == []
+        assert get_renderer_ids() == ["mitsuba3", "pbrt"]
+
+    def test_files_missing_from_bundle_are_parsed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A stale or unreadable bundle should fall back to the files."""
+        self._make_data_dir(tmp_path, ["pbrt", "mitsuba3"])
+        (tmp_path / "_bundle.json").write_text("[]", encoding="utf-8")
+        monkeypatch.setattr(data_loader, "get_data_dir", lambda: tmp_path)
+        assert sorted(r.id for r in load_all_renderers()) == ["mitsuba3", "pbrt"]
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from renderscope.models.hardware import HardwareInfo
-from renderscope.utils.hardware import detect_hardware
+from renderscope.utils.hardware import detect_hardware, physical_core_count
 
 
 class TestDetectHardware:
@@ -47,3 +49,31 @@ class TestDetectHardware:
         hw = detect_hardware()
         assert hw.cpu_cores_physical >= 1
         assert hw.cpu_cores_logical >= 1
+
+
+class TestPhysicalCoreCount:
+    """Tests for physical_core_count()."""
+
+    def setup_method(self) -> None:
+        physical_core_count.cache_clear()
+
+    def teardown_method(self) -> None:
+        physical_core_count.cache_clear()
+
+    def test_uses_psutil_physical_count(self) -> None:
+        with patch("renderscope.utils.hardware.psutil.cpu_count", return_value=6):
+            assert physical_core_count() == 6
+
+    def test_falls_back_to_half_logical(self) -> None:
+        with (
+            patch("renderscope.utils.hardware.psutil.cpu_count", return_value=None),
+            patch("renderscope.utils.hardware.os.cpu_count", return_value=16),
+        ):
+            assert physical_core_count() == 8
+
+    def test_never_below_one(self) -> None:
+        with (
+            patch("renderscope.utils.hardware.psutil.cpu_count", return_value=None),
+            patch("renderscope.utils.hardware.os.cpu_count", return_value=None),
+        ):
+            assert physical_core_count() == 1
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 from PIL import Image
 
 from renderscope.utils.image_io import (
+    _srgb_kernel,
     is_hdr,
+    linear_to_srgb_u8,
     load_image,
+    load_image_u8,
     normalize_channels,
     save_image,
     tonemap,
@@ -99,6 +105,36 @@ class TestLoadImage:
             load_image(path)
 
 
+class TestLoadImageU8:
+    """Tests for raw 8-bit loading."""
+
+    def test_matches_scaled_float_load(self, gradient_rgb: Path) -> None:
+        """Raw pixels divided by 255 equal the float32 load."""
+        raw = load_image_u8(gradient_rgb)
+        assert raw is not None
+        assert raw.dtype == np.uint8
+        np.testing.assert_allclose(raw / 255.0, load_image(gradient_rgb), atol=1e-6)
+
+    def test_grayscale_and_rgba_to_rgb(self, grayscale_png: Path, rgba_png: Path) -> None:
+        """Grayscale is expanded and alpha dropped, as in load_image."""
+        gray = load_image_u8(grayscale_png)
+        rgba = load_image_u8(rgba_png)
+        assert gray is not None and gray.shape == (32, 32, 3)
+        assert rgba is not None and rgba.shape == (16, 16, 3)
+        assert int(rgba[0, 0, 0]) == 128
+
+    def test_not_8bit_returns_none(self, tmp_path: Path) -> None:
+        """16-bit and HDR files are left to load_image."""
+        path = tmp_path / "deep.png"
+        Image.fromarray(np.full((4, 4), 40000, dtype=np.uint16)).save(str(path))
+        assert load_image_u8(path) is None
+        assert load_image_u8(tmp_path / "render.exr") is None
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_image_u8(tmp_path / "missing.png")
+
+
 # ---------------------------------------------------------------------------
 # save_image tests
 # ---------------------------------------------------------------------------
@@ -160,6 +196,41 @@ class TestSaveImage:
 # ---------------------------------------------------------------------------
 
 
+class TestLinearToSrgb:
+    """Tests for 8-bit sRGB encoding."""
+
+    def test_reference_values(self) -> None:
+        """Known linear values should map to their standard sRGB codes."""
+        linear = np.array([[[0.0, 0.0031308, 0.2140]], [[0.5, 1.0, 2.0]]], dtype=np.float32)
+        result = linear_to_srgb_u8(linear)
+        assert result.dtype == np.uint8
+        assert result.shape == linear.shape
+        np.testing.assert_array_equal(result.reshape(-1), [0, 10, 127, 188, 255, 255])
+
+    def test_negative_values_clip_to_zero(self) -> None:
+        """Negative input should encode as black."""
+        result = linear_to_srgb_u8(np.full((2, 2, 3), -1.0, dtype=np.float32))
+        assert not result.any()
+
+    def test_falls_back_when_kernel_fails_to_compile(self) -> None:
+        """A lazily compiled kernel that fails on first call should not be used."""
+
+        def failing_kernel(src: object, out: object) -> None:
+            raise RuntimeError("compilation failed")
+
+        fake_numba = SimpleNamespace(
+            njit=lambda **options: lambda func: failing_kernel, prange=range
+        )
+        _srgb_kernel.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"numba": fake_numba}):
+                assert _srgb_kernel() is None
+                result = linear_to_srgb_u8(np.ones((1, 1, 3), dtype=np.float32))
+        finally:
+            _srgb_kernel.cache_clear()
+        np.testing.assert_array_equal(result, 255)
+
+
 class TestTonemap:
     """Tests for tone mapping."""
 
@@ -196,6 +267,32 @@ class TestTonemap:
         result = tonemap(ldr, method="clamp")
         np.testing.assert_array_equal(result, ldr)
 
+    @pytest.mark.parametrize("method", ["reinhard", "exposure", "clamp"])
+    def test_matches_formula_and_keeps_input(self, hdr_image: np.ndarray, method: str) -> None:
+        """Operators match their formulas and leave the input untouched."""
+        original = hdr_image.copy()
+        expected = {
+            "reinhard": original / (1.0 + original),
+            "exposure": np.clip(1.0 - np.exp(-2.0 * original), 0.0, 1.0),
+            "clamp": np.clip(original, 0.0, 1.0),
+        }[method]
+        result = tonemap(hdr_image, method=method, exposure=2.0)
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+        np.testing.assert_array_equal(hdr_image, original)
+
+    def test_out_in_place(self, hdr_image: np.ndarray) -> None:
+        """Passing the input as ``out`` tone-maps without a new array."""
+        expected = hdr_image / (1.0 + hdr_image)
+        result = tonemap(hdr_image, out=hdr_image)
+        assert result is hdr_image
+        np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_float64_input_returns_float32(self) -> None:
+        """Non-float32 input is converted before tone mapping."""
+        result = tonemap(np.full((4, 4, 3), 3.0), method="reinhard")
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, 0.75)
+
     def test_invalid_method_raises(self) -> None:
         """Unknown tone mapping method should raise ValueError."""
         image = np.ones((8, 8, 3), dtype=np.float32)
@@ -341,6 +341,95 @@ class TestLPIPSMissingTorch:
             ImageMetrics.lpips(reference_image, reference_image)
 
 
+class TestMSEU8:
+    """Tests for ImageMetrics.mse_u8 and psnr_from_mse."""
+
+    def test_matches_float_mse(self) -> None:
+        """Integer MSE equals the float MSE of the images scaled to [0, 1]."""
+        rng = np.random.default_rng(3)
+        ref = rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8)
+        tst = rng.integers(0, 256, size=(32, 32, 3), dtype=np.uint8)
+        expected = ImageMetrics.mse(ref / 255.0, tst / 255.0)
+        assert ImageMetrics.mse_u8(ref, tst) == pytest.approx(expected, rel=1e-5)
+
+    def test_extreme_values_do_not_wrap(self) -> None:
+        """0 vs 255 everywhere is an MSE of exactly 1."""
+        ref = np.zeros((8, 8, 3), dtype=np.uint8)
+        tst = np.full((8, 8, 3), 255, dtype=np.uint8)
+        assert ImageMetrics.mse_u8(ref, tst) == 1.0
+        assert ImageMetrics.mse_u8(tst, ref) == 1.0
+
+    def test_shape_mismatch_raises(self) -> None:
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            ImageMetrics.mse_u8(
+                np.zeros((8, 8, 3), dtype=np.uint8), np.zeros((4, 4, 3), dtype=np.uint8)
+            )
+
+    def test_psnr_from_mse(self) -> None:
+        assert ImageMetrics.psnr_from_mse(0.0) == float("inf")
+        assert ImageMetrics.psnr_from_mse(0.01) == pytest.approx(20.0)
+
+
+# ---------------------------------------------------------------------------
+# Metric bundle tests
+# ---------------------------------------------------------------------------
+
+
+class TestComputeBundle:
+    """Tests for ImageMetrics.compute_bundle."""
+
+    def test_matches_individual_metrics(
+        self,
+        reference_image: np.ndarray,
+        noisy_image: np.ndarray,
+    ) -> None:
+        """Bundled values should agree with the per-metric methods."""
+        bundle = ImageMetrics.compute_bundle(reference_image, noisy_image, ["psnr", "ssim", "mse"])
+        assert bundle.values["psnr"] == pytest.approx(
+            ImageMetrics.psnr(reference_image, noisy_image), rel=1e-5
+        )
+        assert bundle.values["ssim"] == pytest.approx(
+            ImageMetrics.ssim(reference_image, noisy_image), rel=1e-6
+        )
+        assert bundle.values["mse"] == pytest.approx(
+            ImageMetrics.mse(reference_image, noisy_image), rel=1e-5
+        )
+
+    def test_keeps_requested_order(
+        self,
+        reference_image: np.ndarray,
+        noisy_image: np.ndarray,
+    ) -> None:
+        """Only the requested metrics are returned, in request order."""
+        bundle = ImageMetrics.compute_bundle(reference_image, noisy_image, ["mse", "psnr"])
+        assert list(bundle.values) == ["mse", "psnr"]
+        assert bundle.ssim_map is None
+
+    def test_identical_psnr_is_inf(self, reference_image: np.ndarray) -> None:
+        """Zero error should yield infinite PSNR, as psnr() does."""
+        bundle = ImageMetrics.compute_bundle(reference_image, reference_image, ["psnr"])
+        assert bundle.values["psnr"] == float("inf")
+
+    def test_ssim_map_shared(
+        self,
+        reference_image: np.ndarray,
+        noisy_image: np.ndarray,
+    ) -> None:
+        """The SSIM map should match ssim_map() and be returned with the images."""
+        bundle = ImageMetrics.compute_bundle(reference_image, noisy_image, ["ssim"], ssim_map=True)
+        assert bundle.ssim_map is not None
+        np.testing.assert_allclose(
+            bundle.ssim_map, ImageMetrics.ssim_map(reference_image, noisy_image), rtol=1e-6
+        )
+        assert bundle.reference.shape == reference_image.shape
+        assert bundle.test.dtype == np.float32
+
+    def test_unknown_metric_raises(self, reference_image: np.ndarray) -> None:
+        """Unknown metric names should be rejected."""
+        with pytest.raises(ValueError, match="Unknown metric"):
+            ImageMetrics.compute_bundle(reference_image, reference_image, ["flip"])
+
+
 # ---------------------------------------------------------------------------
 # Input validation tests
 # ---------------------------------------------------------------------------
@@ -395,3 +484,20 @@ class TestValidateInputs:
         b[0, 0, 0] = np.nan
         with pytest.raises(ValueError, match="NaN"):
             ImageMetrics._validate_inputs(a, b)
+
+
+# ---------------------------------------------------------------------------
+# Import cost
+# ---------------------------------------------------------------------------
+
+
+def test_cli_import_defers_skimage() -> None:
+    """Importing the package and CLI must not load scikit-image/SciPy."""
+    import subprocess
+    import sys
+
+    code = "import sys, renderscope.cli.main; print('skimage' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
@@ -98,6 +98,30 @@ class TestRendererMetadata:
         assert renderer.matches_status("ACTIVE")
         assert not renderer.matches_status("archived")
 
+    def test_derived_values_follow_updates(self, sample_renderer_data: dict[str, Any]) -> None:
+        """Derived values reflect fields changed by ``model_copy(update=...)``."""
+        renderer = RendererMetadata.model_validate(sample_renderer_data)
+        assert renderer.matches_technique("path_tracing")
+        assert renderer.stars_display
+        updated = renderer.model_copy(
+            update={"technique": ["Neural"], "github_stars": None, "status": "archived"}
+        )
+        assert updated.matches_technique("neural")
+        assert not updated.matches_technique("path_tracing")
+        assert updated.primary_technique == "Neural"
+        assert updated.stars_display == "N/A"
+        assert updated.matches_status("ARCHIVED")
+
+    def test_derived_values_not_serialized(self, sample_renderer_data: dict[str, Any]) -> None:
+        """Derived values should not leak into dumps or equality."""
+        renderer = RendererMetadata.model_validate(sample_renderer_data)
+        fresh = RendererMetadata.model_validate(sample_renderer_data)
+        assert renderer.stars_display
+        assert renderer.matches_technique("path_tracing")
+        assert renderer.model_dump() == fresh.model_dump()
+        assert "stars_display" not in renderer.model_dump()
+        assert renderer == fresh
+
     def test_to_summary_dict(self, sample_renderer_data: dict[str, Any]) -> None:
         """Summary dict contains the expected subset of fields."""
         renderer = RendererMetadata.model_validate(sample_renderer_data)
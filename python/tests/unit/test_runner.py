@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import sys
 import time
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -12,10 +14,14 @@ from renderscope.core.runner import (
     InProcessTimerResult,
     RenderResultBuilder,
     SubprocessResult,
+    iter_output_lines,
     run_subprocess,
 )
 from renderscope.models.settings import RenderSettings
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestSubprocessResult:
     """Tests for the SubprocessResult dataclass."""
@@ -91,6 +97,43 @@ class TestRunSubprocess:
         with pytest.raises(FileNotFoundError, match="Command not found"):
             run_subprocess(["nonexistent_binary_xyz_12345"])
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX fd semantics")
+    def test_python_fds_not_inherited(self, tmp_path: Path) -> None:
+        """Skipping close_fds must not leak descriptors opened by Python."""
+        with (tmp_path / "held.txt").open("w") as held:
+            fd = held.fileno()
+            result = run_subprocess(
+                [sys.executable, "-c", f"import os; os.fstat({fd})"],
+                timeout=10.0,
+            )
+        assert result.exit_code != 0
+        assert "Bad file descriptor" in result.stderr
+
+    def test_close_fds_opt_in(self) -> None:
+        result = run_subprocess(
+            [sys.executable, "-c", "print('ok')"],
+            timeout=10.0,
+            close_fds=True,
+        )
+        assert result.exit_code == 0
+        assert "ok" in result.stdout
+
+    def test_memory_monitor_opt_out(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Probes can skip the monitor thread; peak memory is then zero."""
+        from renderscope.core import runner
+
+        def no_monitor(*args: object, **kwargs: object) -> None:
+            raise AssertionError("memory monitor started")
+
+        monkeypatch.setattr(runner, "_MemoryMonitor", no_monitor)
+        result = run_subprocess(
+            [sys.executable, "-c", "print('1.2.3')"],
+            timeout=10.0,
+            monitor_memory=False,
+        )
+        assert result.stdout.strip() == "1.2.3"
+        assert result.peak_memory_mb == 0.0
+
     def test_elapsed_time_reasonable(self) -> None:
         """Elapsed time should be positive and not wildly wrong."""
         result = run_subprocess(
@@ -101,6 +144,33 @@ class TestRunSubprocess:
         assert result.elapsed_seconds < 10.0
 
 
+class TestIterOutputLines:
+    """Tests for iter_output_lines -- streams real subprocesses."""
+
+    def test_merges_streams(self) -> None:
+        script = "import sys; print('out'); sys.stdout.flush(); print('err', file=sys.stderr)"
+        lines = list(iter_output_lines([sys.executable, "-c", script], timeout=10.0, max_lines=10))
+        assert lines == ["out", "err"]
+
+    def test_stops_early_when_consumer_stops(self) -> None:
+        script = "import time; print('v1.2.3', flush=True); time.sleep(30)"
+        start = time.perf_counter()
+        with contextlib.closing(
+            iter_output_lines([sys.executable, "-c", script], timeout=10.0, max_lines=10)
+        ) as lines:
+            assert next(lines) == "v1.2.3"
+        assert time.perf_counter() - start < 5.0
+
+    def test_max_lines(self) -> None:
+        script = "for i in range(100): print(i)"
+        lines = list(iter_output_lines([sys.executable, "-c", script], timeout=10.0, max_lines=3))
+        assert lines == ["0", "1", "2"]
+
+    def test_command_not_found(self) -> None:
+        with pytest.raises(FileNotFoundError, match="Command not found"):
+            list(iter_output_lines(["nonexistent_binary_xyz_12345"], timeout=1.0, max_lines=1))
+
+
 class TestInProcessTimer:
     """Tests for the InProcessTimer context manager."""
 
@@ -110,6 +180,8 @@ class TestInProcessTimer:
             time.sleep(0.05)
         assert timer.result.elapsed_seconds >= 0.04
         assert timer.result.elapsed_seconds < 5.0
+        assert timer.result.elapsed_ns >= 40_000_000
+        assert timer.result.elapsed_seconds == timer.result.elapsed_ns / 1e9
 
     def test_memory_tracking(self) -> None:
         timer = InProcessTimer()
@@ -175,6 +247,10 @@ class TestRenderResultBuilder:
         assert result.metadata["binary"] == "pbrt"
         assert result.metadata["version"] == "4.0.0"
 
+    def test_builder_has_no_instance_dict(self) -> None:
+        builder = RenderResultBuilder(renderer="test", scene="test", output_path="/tmp/out.png")
+        assert not hasattr(builder, "__dict__")
+
     def test_hardware_auto_detected(self) -> None:
         builder = RenderResultBuilder(renderer="test", scene="test", output_path="/tmp/out.png")
         result = builder.build()